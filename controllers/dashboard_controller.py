@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from odoo import http, fields, _
-from odoo.http import request, Response
+from odoo.http import request, Response, content_disposition
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import json
@@ -34,1032 +34,30 @@ class UniversityDashboardController(http.Controller):
         Returns comprehensive JSON data for dashboard widgets
         """
         try:
-            data = {
-                'overview': self._get_overview_statistics(),
-                'academic': self._get_academic_statistics(),
-                'student': self._get_student_statistics(),
-                'faculty': self._get_faculty_statistics(),
-                'examination': self._get_examination_statistics(),
-                'fee': self._get_fee_statistics(),
-                'library': self._get_library_statistics(),
-                'hostel': self._get_hostel_statistics(),
-                'transport': self._get_transport_statistics(),
-                'placement': self._get_placement_statistics(),
-                'attendance': self._get_attendance_statistics(),
-                'recent_activities': self._get_recent_activities(),
-                'upcoming_events': self._get_upcoming_events(),
-                'alerts': self._get_alerts_notifications(),
-            }
+            if request.env.user.has_group('university_management.group_university_admin'):
+                # University-wide figures are cached and shared by all administrators
+                data = request.env['university.dashboard.cache'].sudo().get_dashboard_statistics()
+            else:
+                data = request.env['university.dashboard.statistics'].get_dashboard_statistics()
             return {'status': 'success', 'data': data}
         except Exception as e:
             _logger.error(f"Dashboard data error: {str(e)}")
             return {'status': 'error', 'message': str(e)}
 
-    # ==================== OVERVIEW STATISTICS ====================
-
-    def _get_overview_statistics(self):
-        """
-        Get overall university statistics
-        """
-        today = fields.Date.today()
-
-        return {
-            'total_students': request.env['student.student'].search_count([('state', '=', 'enrolled')]),
-            'total_faculty': request.env['faculty.faculty'].search_count([('state', '=', 'active')]),
-            'total_programs': request.env['university.program'].search_count([('active', '=', True)]),
-            'total_departments': request.env['university.department'].search_count([('active', '=', True)]),
-            'total_courses': request.env['university.course'].search_count([('active', '=', True)]),
-            'active_batches': request.env['university.batch'].search_count([('state', '=', 'active')]),
-            'library_books': request.env['library.book'].search_count([]),
-            'hostel_capacity': self._get_hostel_capacity(),
-            'transport_vehicles': request.env['transport.vehicle'].search_count([('state', '=', 'active')]),
-        }
-
-    # ==================== ACADEMIC STATISTICS ====================
-
-    def _get_academic_statistics(self):
-        """
-        Get academic module statistics
-        """
-        AcademicYear = request.env['university.academic.year']
-        Program = request.env['university.program']
-        Department = request.env['university.department']
-        Course = request.env['university.course']
-        Batch = request.env['university.batch']
-
-        # Current academic year
-        current_academic_year = AcademicYear.search([('state', '=', 'active')], limit=1)
-
-        # Programs breakdown
-        programs = Program.search([('active', '=', True)])
-        program_data = []
-        for program in programs:
-            student_count = request.env['student.student'].search_count([
-                ('program_id', '=', program.id),
-                ('state', '=', 'enrolled')
-            ])
-            program_data.append({
-                'name': program.name,
-                'code': program.code,
-                'student_count': student_count,
-                'duration': program.duration,
-                'type': program.program_type
-            })
-
-        # Departments breakdown
-        departments = Department.search([('active', '=', True)])
-        department_data = []
-        for dept in departments:
-            student_count = request.env['student.student'].search_count([
-                ('department_id', '=', dept.id),
-                ('state', '=', 'enrolled')
-            ])
-            faculty_count = request.env['faculty.faculty'].search_count([
-                ('department_id', '=', dept.id),
-                ('state', '=', 'active')
-            ])
-            department_data.append({
-                'name': dept.name,
-                'code': dept.code,
-                'hod': dept.hod_id.name if dept.hod_id else '',
-                'student_count': student_count,
-                'faculty_count': faculty_count
-            })
-
-        # Course statistics
-        total_courses = Course.search_count([('active', '=', True)])
-        theory_courses = Course.search_count([('course_type', '=', 'theory')])
-        practical_courses = Course.search_count([('course_type', '=', 'practical')])
-
-        # Batch statistics
-        active_batches = Batch.search_count([('state', '=', 'active')])
-        total_batches = Batch.search_count([])
-
-        return {
-            'current_academic_year': current_academic_year.name if current_academic_year else 'N/A',
-            'programs': program_data,
-            'departments': department_data,
-            'courses': {
-                'total': total_courses,
-                'theory': theory_courses,
-                'practical': practical_courses
-            },
-            'batches': {
-                'active': active_batches,
-                'total': total_batches
-            }
-        }
-
-    # ==================== STUDENT STATISTICS ====================
-
-    def _get_student_statistics(self):
+    @http.route('/university/dashboard/cache/stats', type='json', auth='user')
+    def get_dashboard_cache_stats(self, **kwargs):
         """
-        Get student module statistics
-        """
-        Student = request.env['student.student']
-        Admission = request.env['student.admission']
-
-        today = fields.Date.today()
-        current_month_start = today.replace(day=1)
-
-        # Student counts by state
-        total_students = Student.search_count([])
-        enrolled_students = Student.search_count([('state', '=', 'enrolled')])
-        graduated_students = Student.search_count([('state', '=', 'graduated')])
-        suspended_students = Student.search_count([('state', '=', 'suspended')])
-
-        # Gender distribution
-        male_count = Student.search_count([('gender', '=', 'male'), ('state', '=', 'enrolled')])
-        female_count = Student.search_count([('gender', '=', 'female'), ('state', '=', 'enrolled')])
-        other_count = Student.search_count([('gender', '=', 'other'), ('state', '=', 'enrolled')])
-
-        # Admission statistics
-        pending_admissions = Admission.search_count([('state', '=', 'pending')])
-        approved_admissions = Admission.search_count([
-            ('state', '=', 'approved'),
-            ('admission_date', '>=', current_month_start)
-        ])
-        rejected_admissions = Admission.search_count([
-            ('state', '=', 'rejected'),
-            ('admission_date', '>=', current_month_start)
-        ])
-
-        # New admissions this month
-        new_admissions_month = Admission.search_count([
-            ('state', '=', 'approved'),
-            ('admission_date', '>=', current_month_start)
-        ])
-
-        # Students by year/semester
-        students_by_year = []
-        for year in range(1, 5):
-            count = Student.search_count([
-                ('current_year', '=', str(year)),
-                ('state', '=', 'enrolled')
-            ])
-            students_by_year.append({'year': year, 'count': count})
-
-        # Document verification status
-        documents_pending = request.env['student.document'].search_count([
-            ('verification_status', '=', 'pending')
-        ])
-        documents_verified = request.env['student.document'].search_count([
-            ('verification_status', '=', 'verified')
-        ])
-
-        return {
-            'total': total_students,
-            'enrolled': enrolled_students,
-            'graduated': graduated_students,
-            'suspended': suspended_students,
-            'gender_distribution': {
-                'male': male_count,
-                'female': female_count,
-                'other': other_count
-            },
-            'admissions': {
-                'pending': pending_admissions,
-                'approved_this_month': approved_admissions,
-                'rejected_this_month': rejected_admissions,
-                'new_this_month': new_admissions_month
-            },
-            'by_year': students_by_year,
-            'documents': {
-                'pending': documents_pending,
-                'verified': documents_verified
-            }
-        }
-
-    # ==================== FACULTY STATISTICS ====================
-
-    def _get_faculty_statistics(self):
-        """
-        Get faculty module statistics
-        """
-        Faculty = request.env['faculty.faculty']
-        FacultyAttendance = request.env['faculty.attendance']
-        FacultyLeave = request.env['faculty.leave']
-
-        today = fields.Date.today()
-        current_month_start = today.replace(day=1)
-
-        # Faculty counts
-        total_faculty = Faculty.search_count([])
-        active_faculty = Faculty.search_count([('state', '=', 'active')])
-        inactive_faculty = Faculty.search_count([('state', '=', 'inactive')])
-
-        # Employment type breakdown
-        full_time = Faculty.search_count([('employment_type', '=', 'full_time'), ('state', '=', 'active')])
-        part_time = Faculty.search_count([('employment_type', '=', 'part_time'), ('state', '=', 'active')])
-        contract = Faculty.search_count([('employment_type', '=', 'contract'), ('state', '=', 'active')])
-
-        # Designation breakdown
-        designations = request.env['faculty.designation'].search([('active', '=', True)])
-        designation_data = []
-        for designation in designations:
-            count = Faculty.search_count([
-                ('designation_id', '=', designation.id),
-                ('state', '=', 'active')
-            ])
-            if count > 0:
-                designation_data.append({
-                    'name': designation.name,
-                    'count': count
-                })
-
-        # Attendance statistics (current month)
-        total_attendance = FacultyAttendance.search_count([
-            ('date', '>=', current_month_start),
-            ('date', '<=', today)
-        ])
-        present_count = FacultyAttendance.search_count([
-            ('date', '>=', current_month_start),
-            ('date', '<=', today),
-            ('state', '=', 'present')
-        ])
-        absent_count = FacultyAttendance.search_count([
-            ('date', '>=', current_month_start),
-            ('date', '<=', today),
-            ('state', '=', 'absent')
-        ])
-
-        # Leave statistics
-        pending_leaves = FacultyLeave.search_count([('state', '=', 'submitted')])
-        approved_leaves_month = FacultyLeave.search_count([
-            ('state', '=', 'approved'),
-            ('date_from', '>=', current_month_start)
-        ])
-
-        # Today's attendance
-        today_present = FacultyAttendance.search_count([
-            ('date', '=', today),
-            ('state', '=', 'present')
-        ])
-        today_absent = FacultyAttendance.search_count([
-            ('date', '=', today),
-            ('state', '=', 'absent')
-        ])
-
-        return {
-            'total': total_faculty,
-            'active': active_faculty,
-            'inactive': inactive_faculty,
-            'employment_types': {
-                'full_time': full_time,
-                'part_time': part_time,
-                'contract': contract
-            },
-            'by_designation': designation_data,
-            'attendance_month': {
-                'total': total_attendance,
-                'present': present_count,
-                'absent': absent_count,
-                'percentage': round((present_count / total_attendance * 100) if total_attendance > 0 else 0, 2)
-            },
-            'leaves': {
-                'pending': pending_leaves,
-                'approved_this_month': approved_leaves_month
-            },
-            'today_attendance': {
-                'present': today_present,
-                'absent': today_absent
-            }
-        }
-
-    # ==================== EXAMINATION STATISTICS ====================
-
-    def _get_examination_statistics(self):
-        """
-        Get examination module statistics
-        """
-        Examination = request.env['examination.examination']
-        ExamResult = request.env['exam.result']
-        HallTicket = request.env['hall.ticket']
-        Revaluation = request.env['revaluation.revaluation']
-
-        today = fields.Date.today()
-
-        # Upcoming exams (next 30 days)
-        upcoming_exams = Examination.search_count([
-            ('start_date', '>=', today),
-            ('start_date', '<=', today + timedelta(days=30)),
-            ('state', '=', 'scheduled')
-        ])
-
-        # Ongoing exams
-        ongoing_exams = Examination.search_count([
-            ('start_date', '<=', today),
-            ('end_date', '>=', today),
-            ('state', '=', 'ongoing')
-        ])
-
-        # Completed exams (current year)
-        year_start = today.replace(month=1, day=1)
-        completed_exams = Examination.search_count([
-            ('end_date', '>=', year_start),
-            ('state', '=', 'completed')
-        ])
-
-        # Hall tickets generated
-        hall_tickets_generated = HallTicket.search_count([
-            ('exam_id.start_date', '>=', today),
-            ('state', '=', 'generated')
-        ])
-
-        # Results statistics
-        results_published = ExamResult.search_count([
-            ('state', '=', 'published'),
-            ('publish_date', '>=', year_start)
-        ])
-        results_pending = ExamResult.search_count([
-            ('state', 'in', ['draft', 'evaluated'])
-        ])
-
-        # Pass/Fail statistics (current year)
-        passed_students = ExamResult.search_count([
-            ('result', '=', 'pass'),
-            ('publish_date', '>=', year_start)
-        ])
-        failed_students = ExamResult.search_count([
-            ('result', '=', 'fail'),
-            ('publish_date', '>=', year_start)
-        ])
-
-        # Revaluation requests
-        pending_revaluations = Revaluation.search_count([('state', '=', 'pending')])
-        completed_revaluations = Revaluation.search_count([
-            ('state', '=', 'completed'),
-            ('request_date', '>=', today.replace(day=1))
-        ])
-
-        return {
-            'upcoming_exams': upcoming_exams,
-            'ongoing_exams': ongoing_exams,
-            'completed_exams': completed_exams,
-            'hall_tickets': {
-                'generated': hall_tickets_generated
-            },
-            'results': {
-                'published': results_published,
-                'pending': results_pending,
-                'passed': passed_students,
-                'failed': failed_students,
-                'pass_percentage': round((passed_students / (passed_students + failed_students) * 100)
-                                         if (passed_students + failed_students) > 0 else 0, 2)
-            },
-            'revaluations': {
-                'pending': pending_revaluations,
-                'completed_this_month': completed_revaluations
-            }
-        }
-
-    # ==================== FEE STATISTICS ====================
-
-    def _get_fee_statistics(self):
+        Get dashboard cache hit/miss counters and entry freshness
         """
-        Get fee module statistics
-        """
-        FeePayment = request.env['fee.payment']
-        FeeStructure = request.env['fee.structure']
-        Scholarship = request.env['scholarship.scholarship']
-
-        today = fields.Date.today()
-        current_month_start = today.replace(day=1)
-        current_year_start = today.replace(month=4, day=1)  # Academic year April start
-
-        # Fee collection statistics
-        total_fee_collected = sum(FeePayment.search([
-            ('state', '=', 'paid'),
-            ('payment_date', '>=', current_year_start)
-        ]).mapped('amount'))
-
-        monthly_collection = sum(FeePayment.search([
-            ('state', '=', 'paid'),
-            ('payment_date', '>=', current_month_start)
-        ]).mapped('amount'))
-
-        # Pending payments
-        pending_payments = FeePayment.search_count([('state', '=', 'pending')])
-        overdue_payments = FeePayment.search_count([
-            ('state', '=', 'pending'),
-            ('due_date', '<', today)
-        ])
-
-        # Payment modes
-        cash_payments = FeePayment.search_count([
-            ('payment_mode', '=', 'cash'),
-            ('payment_date', '>=', current_month_start)
-        ])
-        online_payments = FeePayment.search_count([
-            ('payment_mode', '=', 'online'),
-            ('payment_date', '>=', current_month_start)
-        ])
-        cheque_payments = FeePayment.search_count([
-            ('payment_mode', '=', 'cheque'),
-            ('payment_date', '>=', current_month_start)
-        ])
-
-        # Scholarships
-        active_scholarships = Scholarship.search_count([('state', '=', 'active')])
-        scholarship_amount = sum(Scholarship.search([
-            ('state', '=', 'active'),
-            ('academic_year_id.state', '=', 'active')
-        ]).mapped('amount'))
-
-        # Fee defaulters
-        fee_defaulters = request.env['student.student'].search_count([
-            ('fee_status', '=', 'defaulter'),
-            ('state', '=', 'enrolled')
-        ])
-
-        return {
-            'total_collected_year': total_fee_collected,
-            'monthly_collection': monthly_collection,
-            'pending_payments': pending_payments,
-            'overdue_payments': overdue_payments,
-            'payment_modes': {
-                'cash': cash_payments,
-                'online': online_payments,
-                'cheque': cheque_payments
-            },
-            'scholarships': {
-                'active': active_scholarships,
-                'total_amount': scholarship_amount
-            },
-            'defaulters': fee_defaulters
-        }
-
-    # ==================== LIBRARY STATISTICS ====================
-
-    def _get_library_statistics(self):
-        """
-        Get library module statistics
-        """
-        LibraryBook = request.env['library.book']
-        LibraryIssue = request.env['library.issue']
-        LibraryFine = request.env['library.fine']
-
-        today = fields.Date.today()
-
-        # Book statistics
-        total_books = LibraryBook.search_count([])
-        available_books = LibraryBook.search_count([('state', '=', 'available')])
-        issued_books = LibraryBook.search_count([('state', '=', 'issued')])
-        damaged_books = LibraryBook.search_count([('state', '=', 'damaged')])
-
-        # Books by category
-        categories = request.env['library.category'].search([])
-        category_data = []
-        for category in categories:
-            count = LibraryBook.search_count([('category_id', '=', category.id)])
-            if count > 0:
-                category_data.append({
-                    'name': category.name,
-                    'count': count
-                })
-
-        # Issue/Return statistics
-        current_month_start = today.replace(day=1)
-        books_issued_month = LibraryIssue.search_count([
-            ('issue_date', '>=', current_month_start),
-            ('issue_date', '<=', today)
-        ])
-        books_returned_month = LibraryIssue.search_count([
-            ('return_date', '>=', current_month_start),
-            ('return_date', '<=', today),
-            ('state', '=', 'returned')
-        ])
-
-        # Overdue books
-        overdue_books = LibraryIssue.search_count([
-            ('due_date', '<', today),
-            ('state', '=', 'issued')
-        ])
-
-        # Fine statistics
-        total_fines = sum(LibraryFine.search([
-            ('fine_date', '>=', current_month_start)
-        ]).mapped('amount'))
-        pending_fines = sum(LibraryFine.search([
-            ('state', '=', 'unpaid')
-        ]).mapped('amount'))
-
-        return {
-            'total_books': total_books,
-            'available': available_books,
-            'issued': issued_books,
-            'damaged': damaged_books,
-            'by_category': category_data,
-            'monthly_activity': {
-                'issued': books_issued_month,
-                'returned': books_returned_month
-            },
-            'overdue': overdue_books,
-            'fines': {
-                'total_this_month': total_fines,
-                'pending': pending_fines
-            }
-        }
-
-    # ==================== HOSTEL STATISTICS ====================
-
-    def _get_hostel_statistics(self):
-        """
-        Get hostel module statistics
-        """
-        Hostel = request.env['hostel.hostel']
-        HostelRoom = request.env['hostel.room']
-        HostelAllocation = request.env['hostel.allocation']
-        HostelComplaint = request.env['hostel.complaint']
-        MessAttendance = request.env['mess.attendance']
-
-        today = fields.Date.today()
-
-        # Hostel capacity
-        total_capacity = sum(Hostel.search([('active', '=', True)]).mapped('total_capacity'))
-        allocated_beds = HostelAllocation.search_count([('state', '=', 'allocated')])
-        available_beds = total_capacity - allocated_beds
-
-        # Hostel wise occupancy
-        hostels = Hostel.search([('active', '=', True)])
-        hostel_data = []
-        for hostel in hostels:
-            allocated = HostelAllocation.search_count([
-                ('hostel_id', '=', hostel.id),
-                ('state', '=', 'allocated')
-            ])
-            hostel_data.append({
-                'name': hostel.name,
-                'type': hostel.hostel_type,
-                'capacity': hostel.total_capacity,
-                'allocated': allocated,
-                'available': hostel.total_capacity - allocated,
-                'occupancy_percentage': round(
-                    (allocated / hostel.total_capacity * 100) if hostel.total_capacity > 0 else 0, 2)
-            })
-
-        # Room statistics
-        total_rooms = HostelRoom.search_count([])
-        occupied_rooms = HostelRoom.search_count([('status', '=', 'occupied')])
-        available_rooms = HostelRoom.search_count([('status', '=', 'available')])
-        maintenance_rooms = HostelRoom.search_count([('status', '=', 'maintenance')])
-
-        # Complaints
-        pending_complaints = HostelComplaint.search_count([('state', '=', 'pending')])
-        resolved_complaints = HostelComplaint.search_count([
-            ('state', '=', 'resolved'),
-            ('complaint_date', '>=', today.replace(day=1))
-        ])
-
-        # Mess attendance today
-        mess_attendance_today = MessAttendance.search_count([
-            ('date', '=', today),
-            ('present', '=', True)
-        ])
-
-        return {
-            'capacity': {
-                'total': total_capacity,
-                'allocated': allocated_beds,
-                'available': available_beds,
-                'occupancy_percentage': round((allocated_beds / total_capacity * 100) if total_capacity > 0 else 0, 2)
-            },
-            'hostels': hostel_data,
-            'rooms': {
-                'total': total_rooms,
-                'occupied': occupied_rooms,
-                'available': available_rooms,
-                'maintenance': maintenance_rooms
-            },
-            'complaints': {
-                'pending': pending_complaints,
-                'resolved_this_month': resolved_complaints
-            },
-            'mess_attendance_today': mess_attendance_today
-        }
-
-    def _get_hostel_capacity(self):
-        """Helper method for hostel capacity"""
-        Hostel = request.env['hostel.hostel']
-        total_capacity = sum(Hostel.search([('active', '=', True)]).mapped('total_capacity'))
-        return total_capacity
-
-    # ==================== TRANSPORT STATISTICS ====================
-
-    def _get_transport_statistics(self):
-        """
-        Get transport module statistics
-        """
-        TransportRoute = request.env['transport.route']
-        TransportVehicle = request.env['transport.vehicle']
-        TransportAllocation = request.env['transport.allocation']
-
-        # Vehicle statistics
-        total_vehicles = TransportVehicle.search_count([])
-        active_vehicles = TransportVehicle.search_count([('state', '=', 'active')])
-        maintenance_vehicles = TransportVehicle.search_count([('state', '=', 'maintenance')])
-
-        # Route statistics
-        total_routes = TransportRoute.search_count([('active', '=', True)])
-
-        # Route wise allocation
-        routes = TransportRoute.search([('active', '=', True)])
-        route_data = []
-        for route in routes:
-            student_count = TransportAllocation.search_count([
-                ('route_id', '=', route.id),
-                ('state', '=', 'active')
-            ])
-            route_data.append({
-                'name': route.name,
-                'route_code': route.code,
-                'vehicle': route.vehicle_id.name if route.vehicle_id else 'Not Assigned',
-                'student_count': student_count,
-                'capacity': route.vehicle_id.capacity if route.vehicle_id else 0
-            })
-
-        # Student allocations
-        total_allocations = TransportAllocation.search_count([('state', '=', 'active')])
-
-        return {
-            'vehicles': {
-                'total': total_vehicles,
-                'active': active_vehicles,
-                'maintenance': maintenance_vehicles
-            },
-            'routes': {
-                'total': total_routes,
-                'details': route_data
-            },
-            'student_allocations': total_allocations
-        }
-
-    # ==================== PLACEMENT STATISTICS ====================
-
-    def _get_placement_statistics(self):
-        """
-        Get placement module statistics
-        """
-        PlacementDrive = request.env['placement.drive']
-        PlacementCompany = request.env['placement.company']
-        PlacementApplication = request.env['placement.application']
-        PlacementOffer = request.env['placement.offer']
-
-        today = fields.Date.today()
-        current_year_start = today.replace(month=4, day=1)
-
-        # Placement drives
-        upcoming_drives = PlacementDrive.search_count([
-            ('drive_date', '>=', today),
-            ('state', '=', 'scheduled')
-        ])
-        completed_drives = PlacementDrive.search_count([
-            ('drive_date', '>=', current_year_start),
-            ('state', '=', 'completed')
-        ])
-
-        # Companies
-        registered_companies = PlacementCompany.search_count([('active', '=', True)])
-        companies_visited = PlacementCompany.search([
-            ('visit_date', '>=', current_year_start)
-        ]).ids
-
-        # Applications
-        total_applications = PlacementApplication.search_count([
-            ('create_date', '>=', current_year_start)
-        ])
-        shortlisted = PlacementApplication.search_count([
-            ('state', '=', 'shortlisted'),
-            ('create_date', '>=', current_year_start)
-        ])
-
-        # Offers
-        total_offers = PlacementOffer.search_count([
-            ('offer_date', '>=', current_year_start),
-            ('state', '=', 'accepted')
-        ])
-
-        # Average package
-        offers = PlacementOffer.search([
-            ('offer_date', '>=', current_year_start),
-            ('state', '=', 'accepted')
-        ])
-        avg_package = sum(offers.mapped('package_amount')) / len(offers) if offers else 0
-        highest_package = max(offers.mapped('package_amount')) if offers else 0
-
-        # Placement percentage (final year students)
-        final_year_students = request.env['student.student'].search_count([
-            ('current_year', '=', '4'),
-            ('state', '=', 'enrolled')
-        ])
-        placed_students = PlacementOffer.search_count([
-            ('offer_date', '>=', current_year_start),
-            ('state', '=', 'accepted')
-        ])
-        placement_percentage = round((placed_students / final_year_students * 100) if final_year_students > 0 else 0, 2)
-
-        return {
-            'drives': {
-                'upcoming': upcoming_drives,
-                'completed': completed_drives
-            },
-            'companies': {
-                'registered': registered_companies,
-                'visited_this_year': len(companies_visited)
-            },
-            'applications': {
-                'total': total_applications,
-                'shortlisted': shortlisted
-            },
-            'offers': {
-                'total': total_offers,
-                'average_package': round(avg_package, 2),
-                'highest_package': highest_package
-            },
-            'placement_stats': {
-                'total_students': final_year_students,
-                'placed': placed_students,
-                'placement_percentage': placement_percentage
-            }
-        }
-
-    # ==================== ATTENDANCE STATISTICS ====================
-
-    def _get_attendance_statistics(self):
-        """
-        Get overall attendance statistics (Student + Faculty)
-        """
-        StudentAttendance = request.env['student.attendance']
-        FacultyAttendance = request.env['faculty.attendance']
-
-        today = fields.Date.today()
-
-        # Student attendance today
-        student_present_today = StudentAttendance.search_count([
-            ('date', '=', today),
-            ('state', '=', 'present')
-        ])
-        student_absent_today = StudentAttendance.search_count([
-            ('date', '=', today),
-            ('state', '=', 'absent')
-        ])
-
-        # Faculty attendance today
-        faculty_present_today = FacultyAttendance.search_count([
-            ('date', '=', today),
-            ('state', '=', 'present')
-        ])
-        faculty_absent_today = FacultyAttendance.search_count([
-            ('date', '=', today),
-            ('state', '=', 'absent')
-        ])
-
-        # Weekly attendance trend (last 7 days)
-        weekly_trend = []
-        for i in range(6, -1, -1):
-            date = today - timedelta(days=i)
-            student_present = StudentAttendance.search_count([
-                ('date', '=', date),
-                ('state', '=', 'present')
-            ])
-            faculty_present = FacultyAttendance.search_count([
-                ('date', '=', date),
-                ('state', '=', 'present')
-            ])
-            weekly_trend.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'day': date.strftime('%a'),
-                'student_present': student_present,
-                'faculty_present': faculty_present
-            })
-
-        return {
-            'today': {
-                'student': {
-                    'present': student_present_today,
-                    'absent': student_absent_today
-                },
-                'faculty': {
-                    'present': faculty_present_today,
-                    'absent': faculty_absent_today
-                }
-            },
-            'weekly_trend': weekly_trend
-        }
-
-    # ==================== RECENT ACTIVITIES ====================
-
-    def _get_recent_activities(self):
-        """
-        Get recent activities across all modules
-        """
-        activities = []
-
-        # Recent admissions
-        recent_admissions = request.env['student.admission'].search([
-            ('state', '=', 'approved')
-        ], order='admission_date desc', limit=5)
-
-        for admission in recent_admissions:
-            activities.append({
-                'type': 'admission',
-                'title': f"New Admission: {admission.student_id.name}",
-                'description': f"Admitted to {admission.program_id.name}",
-                'date': admission.admission_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'icon': 'fa-user-plus',
-                'color': 'success'
-            })
-
-        # Recent examinations
-        recent_exams = request.env['examination.examination'].search([
-            ('state', 'in', ['scheduled', 'ongoing'])
-        ], order='start_date desc', limit=3)
-
-        for exam in recent_exams:
-            activities.append({
-                'type': 'examination',
-                'title': f"Exam: {exam.name}",
-                'description': f"Starting on {exam.start_date}",
-                'date': exam.create_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'icon': 'fa-file-text',
-                'color': 'warning'
-            })
-
-        # Recent placements
-        recent_offers = request.env['placement.offer'].search([
-            ('state', '=', 'accepted')
-        ], order='offer_date desc', limit=3)
-
-        for offer in recent_offers:
-            activities.append({
-                'type': 'placement',
-                'title': f"Placement: {offer.student_id.name}",
-                'description': f"Placed at {offer.company_id.name}",
-                'date': offer.offer_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'icon': 'fa-briefcase',
-                'color': 'primary'
-            })
-
-        # Sort by date
-        activities.sort(key=lambda x: x['date'], reverse=True)
-
-        return activities[:10]
-
-    # ==================== UPCOMING EVENTS ====================
-
-    def _get_upcoming_events(self):
-        """
-        Get upcoming events across all modules
-        """
-        events = []
-        today = fields.Date.today()
-        next_30_days = today + timedelta(days=30)
-
-        # Upcoming exams
-        upcoming_exams = request.env['examination.examination'].search([
-            ('start_date', '>=', today),
-            ('start_date', '<=', next_30_days),
-            ('state', '=', 'scheduled')
-        ], order='start_date asc', limit=5)
-
-        for exam in upcoming_exams:
-            events.append({
-                'type': 'examination',
-                'title': exam.name,
-                'date': exam.start_date.strftime('%Y-%m-%d'),
-                'time': '',
-                'location': exam.exam_center if hasattr(exam, 'exam_center') else '',
-                'icon': 'fa-file-text',
-                'color': 'danger'
-            })
-
-        # Upcoming placement drives
-        upcoming_drives = request.env['placement.drive'].search([
-            ('drive_date', '>=', today),
-            ('drive_date', '<=', next_30_days),
-            ('state', '=', 'scheduled')
-        ], order='drive_date asc', limit=5)
-
-        for drive in upcoming_drives:
-            events.append({
-                'type': 'placement',
-                'title': f"Placement Drive - {drive.company_id.name}",
-                'date': drive.drive_date.strftime('%Y-%m-%d'),
-                'time': drive.drive_time if hasattr(drive, 'drive_time') else '',
-                'location': drive.venue if hasattr(drive, 'venue') else '',
-                'icon': 'fa-briefcase',
-                'color': 'success'
-            })
-
-        # Upcoming university events
-        upcoming_uni_events = request.env['university.event'].search([
-            ('event_date', '>=', today),
-            ('event_date', '<=', next_30_days),
-            ('state', '=', 'confirmed')
-        ], order='event_date asc', limit=5)
-
-        for event in upcoming_uni_events:
-            events.append({
-                'type': 'event',
-                'title': event.name,
-                'date': event.event_date.strftime('%Y-%m-%d'),
-                'time': event.start_time if hasattr(event, 'start_time') else '',
-                'location': event.venue if hasattr(event, 'venue') else '',
-                'icon': 'fa-calendar',
-                'color': 'info'
-            })
-
-        # Sort by date
-        events.sort(key=lambda x: x['date'])
-
-        return events[:10]
-
-    # ==================== ALERTS & NOTIFICATIONS ====================
-
-    def _get_alerts_notifications(self):
-        """
-        Get system alerts and notifications
-        """
-        alerts = []
-        today = fields.Date.today()
-
-        # Fee defaulters alert
-        fee_defaulters = request.env['student.student'].search_count([
-            ('fee_status', '=', 'defaulter'),
-            ('state', '=', 'enrolled')
-        ])
-        if fee_defaulters > 0:
-            alerts.append({
-                'type': 'warning',
-                'title': 'Fee Defaulters',
-                'message': f"{fee_defaulters} students have pending fee payments",
-                'icon': 'fa-exclamation-triangle',
-                'action_url': '/web#model=student.student&view_type=list&filter=fee_defaulters'
-            })
-
-        # Pending admissions
-        pending_admissions = request.env['student.admission'].search_count([('state', '=', 'pending')])
-        if pending_admissions > 0:
-            alerts.append({
-                'type': 'info',
-                'title': 'Pending Admissions',
-                'message': f"{pending_admissions} admission applications awaiting approval",
-                'icon': 'fa-user-plus',
-                'action_url': '/web#model=student.admission&view_type=list&filter=pending'
-            })
-
-        # Pending leave requests
-        pending_leaves = request.env['faculty.leave'].search_count([('state', '=', 'submitted')])
-        if pending_leaves > 0:
-            alerts.append({
-                'type': 'info',
-                'title': 'Pending Leave Requests',
-                'message': f"{pending_leaves} faculty leave requests pending approval",
-                'icon': 'fa-calendar-times-o',
-                'action_url': '/web#model=faculty.leave&view_type=list&filter=pending'
-            })
-
-        # Overdue library books
-        overdue_books = request.env['library.issue'].search_count([
-            ('due_date', '<', today),
-            ('state', '=', 'issued')
-        ])
-        if overdue_books > 0:
-            alerts.append({
-                'type': 'danger',
-                'title': 'Overdue Library Books',
-                'message': f"{overdue_books} books are overdue for return",
-                'icon': 'fa-book',
-                'action_url': '/web#model=library.issue&view_type=list&filter=overdue'
-            })
-
-        # Upcoming exams (within 7 days)
-        upcoming_exams = request.env['examination.examination'].search_count([
-            ('start_date', '>=', today),
-            ('start_date', '<=', today + timedelta(days=7)),
-            ('state', '=', 'scheduled')
-        ])
-        if upcoming_exams > 0:
-            alerts.append({
-                'type': 'warning',
-                'title': 'Upcoming Examinations',
-                'message': f"{upcoming_exams} exams scheduled in the next 7 days",
-                'icon': 'fa-file-text',
-                'action_url': '/web#model=examination.examination&view_type=calendar'
-            })
-
-        # Hostel complaints pending
-        pending_complaints = request.env['hostel.complaint'].search_count([('state', '=', 'pending')])
-        if pending_complaints > 10:
-            alerts.append({
-                'type': 'warning',
-                'title': 'Hostel Complaints',
-                'message': f"{pending_complaints} hostel complaints need attention",
-                'icon': 'fa-home',
-                'action_url': '/web#model=hostel.complaint&view_type=list&filter=pending'
-            })
+        try:
+            if not request.env.user.has_group('university_management.group_university_admin'):
+                return {'status': 'error', 'message': 'Access denied'}
 
-        return alerts
+            stats = request.env['university.dashboard.cache'].sudo().get_cache_statistics()
+            return {'status': 'success', 'data': stats}
+        except Exception as e:
+            _logger.error(f"Dashboard cache stats error: {str(e)}")
+            return {'status': 'error', 'message': str(e)}
 
     # ==================== ADDITIONAL ROUTES ====================
 
@@ -1152,8 +150,9 @@ class UniversityDashboardController(http.Controller):
 
     def _get_attendance_trend_chart(self):
         """Get attendance trend for last 30 days"""
-        StudentAttendance = request.env['student.attendance']
         today = fields.Date.today()
+        totals = request.env['university.attendance.daily'].get_daily_totals(
+            today - timedelta(days=29), today, member_type='student')
 
         present_data = []
         absent_data = []
@@ -1161,18 +160,10 @@ class UniversityDashboardController(http.Controller):
 
         for i in range(29, -1, -1):
             date = today - timedelta(days=i)
+            day = totals.get(date, {})
 
-            present = StudentAttendance.search_count([
-                ('date', '=', date),
-                ('state', '=', 'present')
-            ])
-            absent = StudentAttendance.search_count([
-                ('date', '=', date),
-                ('state', '=', 'absent')
-            ])
-
-            present_data.append(present)
-            absent_data.append(absent)
+            present_data.append(day.get('present', 0))
+            absent_data.append(day.get('absent', 0))
             labels.append(date.strftime('%d %b'))
 
         return {
@@ -1196,18 +187,16 @@ class UniversityDashboardController(http.Controller):
     def _get_department_wise_chart(self):
         """Get department-wise student distribution"""
         Department = request.env['university.department']
-        Student = request.env['student.student']
+        students = request.env['university.dashboard.statistics']._group_counts('student.student', [
+            ('state', '=', 'enrolled')
+        ], 'department_id')
 
         departments = Department.search([('active', '=', True)])
         data = []
         labels = []
 
         for dept in departments:
-            count = Student.search_count([
-                ('department_id', '=', dept.id),
-                ('state', '=', 'enrolled')
-            ])
-            data.append(count)
+            data.append(students.get(dept.id, 0))
             labels.append(dept.code)
 
         return {
@@ -1409,8 +398,8 @@ class UniversityDashboardController(http.Controller):
             }
 
     @http.route('/dashboard/api/get_widget_data', type='json', auth='user', methods=['POST'], csrf=True)
-    def api_get_widget_data(self, widget_id=None, filters=None, date_range=None, **kwargs):
-        """Get individual widget data"""
+    def api_get_widget_data(self, widget_id=None, filters=None, date_range=None, offset=0, limit=None, **kwargs):
+        """Get individual widget data, ``offset``/``limit`` page through table and list widgets"""
         try:
             if not widget_id:
                 return {'error': 'Widget ID is required', 'status': 'error'}
@@ -1426,7 +415,7 @@ class UniversityDashboardController(http.Controller):
                 if not bool(user_groups & widget.group_ids):
                     return {'error': 'Access denied', 'status': 'error'}
 
-            widget_data = widget.get_widget_data()
+            widget_data = widget.get_widget_data(offset=int(offset or 0), limit=int(limit) if limit else None)
 
             return {
                 'status': 'success',
@@ -1562,6 +551,47 @@ class UniversityDashboardController(http.Controller):
                 'status': 'error'
             }
 
+    @http.route('/dashboard/api/get_kpi_series', type='json', auth='user', methods=['POST'], csrf=True)
+    def api_get_kpi_series(self, kpi_id=None, kpi_code=None, date_from=None, date_to=None, bucket='auto', **kwargs):
+        """Get the time series of a KPI over a range, bucketed by day, week or month"""
+        try:
+            kpi_model = request.env['university.dashboard.kpi'].sudo()
+
+            if kpi_id:
+                kpi = kpi_model.browse(kpi_id)
+            elif kpi_code:
+                kpi = kpi_model.search([('code', '=', kpi_code)], limit=1)
+            else:
+                return {'error': 'KPI ID or Code is required', 'status': 'error'}
+
+            if not kpi.exists():
+                return {'error': 'KPI not found', 'status': 'error'}
+
+            date_to = fields.Datetime.to_datetime(date_to) or fields.Datetime.now()
+            date_from = fields.Datetime.to_datetime(date_from) or date_to - relativedelta(years=1)
+            bucket, points = request.env['university.dashboard.kpi.value'].sudo().get_series(
+                kpi.id, date_from, date_to, bucket)
+
+            return {
+                'status': 'success',
+                'kpi': {
+                    'id': kpi.id,
+                    'name': kpi.name,
+                    'code': kpi.code,
+                    'unit': kpi.unit,
+                },
+                'bucket': bucket,
+                'labels': [period.date().isoformat() for period, value in points],
+                'values': [round(value, 2) for period, value in points],
+            }
+
+        except Exception as e:
+            _logger.error(f"Error getting KPI series: {str(e)}")
+            return {
+                'error': str(e),
+                'status': 'error'
+            }
+
     # ============================================
     # API ENDPOINTS - USER PREFERENCES
     # ============================================
@@ -1796,6 +826,10 @@ class UniversityDashboardController(http.Controller):
     def api_get_analytics(self, analytics_code=None, date_from=None, date_to=None, filters=None, **kwargs):
         """Get analytics data"""
         try:
+            # Internal users only, portal and public users never reach the analytics
+            if not request.env.user.has_group('base.group_user'):
+                return {'error': 'Access denied', 'status': 'error'}
+
             analytics_model = request.env['university.dashboard.analytics'].sudo()
 
             if not analytics_code:
@@ -1807,10 +841,8 @@ class UniversityDashboardController(http.Controller):
                 return {'error': 'Analytics not found', 'status': 'error'}
 
             # Check access
-            if not analytics.is_public and analytics.group_ids:
-                user_groups = request.env.user.groups_id
-                if not bool(user_groups & analytics.group_ids):
-                    return {'error': 'Access denied', 'status': 'error'}
+            if not analytics._can_run(request.env.user):
+                return {'error': 'Access denied', 'status': 'error'}
 
             # Parse dates
             date_from_obj = datetime.fromisoformat(date_from) if date_from else None
@@ -1838,6 +870,66 @@ class UniversityDashboardController(http.Controller):
                 'status': 'error'
             }
 
+    @http.route('/dashboard/api/export_analytics', type='http', auth='user', methods=['POST'], csrf=True)
+    def api_export_analytics(self, analytics_code=None, date_from=None, date_to=None, filters=None, **kwargs):
+        """Export the complete result of an analytics as CSV, streamed in chunks"""
+        try:
+            # Internal users only, portal and public users never reach the analytics
+            if not request.env.user.has_group('base.group_user'):
+                return Response(
+                    json.dumps({'error': 'Access denied'}),
+                    content_type='application/json',
+                    status=403
+                )
+
+            if not analytics_code:
+                return Response(
+                    json.dumps({'error': 'Analytics code is required'}),
+                    content_type='application/json',
+                    status=400
+                )
+
+            analytics = request.env['university.dashboard.analytics'].sudo().search(
+                [('code', '=', analytics_code)], limit=1)
+
+            if not analytics.exists():
+                return Response(
+                    json.dumps({'error': 'Analytics not found'}),
+                    content_type='application/json',
+                    status=404
+                )
+
+            # Check access
+            if not analytics._can_run(request.env.user):
+                return Response(
+                    json.dumps({'error': 'Access denied'}),
+                    content_type='application/json',
+                    status=403
+                )
+
+            output = analytics.export_csv(
+                datetime.fromisoformat(date_from) if date_from else None,
+                datetime.fromisoformat(date_to) if date_to else None,
+                json.loads(filters) if filters else None,
+            )
+
+            return Response(
+                self._iter_file(output),
+                headers=[
+                    ('Content-Type', 'text/csv; charset=utf-8'),
+                    ('Content-Disposition', content_disposition(f'{analytics.code}.csv')),
+                ],
+                direct_passthrough=True,
+            )
+
+        except Exception as e:
+            _logger.error(f"Error exporting analytics: {str(e)}")
+            return Response(
+                json.dumps({'error': str(e)}),
+                content_type='application/json',
+                status=500
+            )
+
     # ============================================
     # API ENDPOINTS - EXPORT
     # ============================================
@@ -1986,6 +1078,17 @@ class UniversityDashboardController(http.Controller):
     # HELPER METHODS
     # ============================================
 
+    def _iter_file(self, file, chunk_size=65536):
+        """Yield a file in chunks and close it once consumed"""
+        try:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            file.close()
+
     def _get_user_type(self):
         """Get current user type"""
         user = request.env.user
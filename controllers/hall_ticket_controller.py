@@ -14,7 +14,7 @@ class HallTicketController(http.Controller):
     @http.route(['/my/hall-tickets'], type='http', auth="user", website=True)
     def hall_ticket_list(self, **kw):
         """List available hall tickets for student"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -36,7 +36,7 @@ class HallTicketController(http.Controller):
     @http.route(['/my/hall-ticket/<int:hall_ticket_id>'], type='http', auth="user", website=True)
     def hall_ticket_detail(self, hall_ticket_id, **kw):
         """View hall ticket details"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         hall_ticket = request.env['examination.hall.ticket'].browse(hall_ticket_id)
 
         if not student or hall_ticket.student_id != student:
@@ -55,7 +55,7 @@ class HallTicketController(http.Controller):
     @http.route(['/my/hall-ticket/<int:hall_ticket_id>/download'], type='http', auth="user")
     def hall_ticket_download(self, hall_ticket_id, **kw):
         """Download hall ticket as PDF"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         hall_ticket = request.env['examination.hall.ticket'].sudo().browse(hall_ticket_id)
 
         # Security check
@@ -68,17 +68,10 @@ class HallTicketController(http.Controller):
                 'message': _('Hall ticket is not yet generated. Please check back later.')
             })
 
-        # Generate PDF report
-        report = request.env.ref('university_management.action_report_hall_ticket')
-        pdf, _ = report.sudo()._render_qweb_pdf([hall_ticket_id])
-
-        pdfhttpheaders = [
-            ('Content-Type', 'application/pdf'),
-            ('Content-Length', len(pdf)),
-            ('Content-Disposition', f'attachment; filename="HallTicket_{hall_ticket.name}.pdf"')
-        ]
-
-        return request.make_response(pdf, headers=pdfhttpheaders)
+        # Rendered once per version of the hall ticket, revalidated by the browser through its ETag
+        stream = request.env['university.report.cache'].get_pdf_stream(
+            'university_management.action_report_hall_ticket', hall_ticket, f'HallTicket_{hall_ticket.name}.pdf')
+        return stream.get_response(as_attachment=True)
 
     # ==================== PUBLIC HALL TICKET VERIFICATION ====================
     @http.route(['/hall-ticket/verify'], type='http', auth="public", website=True)
@@ -144,17 +137,11 @@ class HallTicketController(http.Controller):
                 'message': _('No hall tickets generated for this examination yet.')
             })
 
-        # Generate PDF report for all hall tickets
-        report = request.env.ref('university_management.action_report_hall_ticket')
-        pdf, _ = report.sudo()._render_qweb_pdf(hall_tickets.ids)
-
-        pdfhttpheaders = [
-            ('Content-Type', 'application/pdf'),
-            ('Content-Length', len(pdf)),
-            ('Content-Disposition', f'attachment; filename="HallTickets_{examination.name.replace(" ", "_")}.pdf"')
-        ]
-
-        return request.make_response(pdf, headers=pdfhttpheaders)
+        # Rendered in chunks and cached until one of the hall tickets changes
+        stream = request.env['university.report.cache'].get_pdf_stream(
+            'university_management.action_report_hall_ticket', hall_tickets,
+            f'HallTickets_{examination.name.replace(" ", "_")}.pdf')
+        return stream.get_response(as_attachment=True)
 
     # ==================== GENERATE HALL TICKET ====================
     @http.route(['/examination/<int:exam_id>/generate-hall-tickets'], type='http', auth="user", methods=['POST'],
@@ -183,7 +170,7 @@ class HallTicketController(http.Controller):
     @http.route(['/api/hall-ticket/status'], type='json', auth="user")
     def hall_ticket_status(self, examination_id=None, **kw):
         """Check hall ticket status (API)"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return {'success': False, 'error': 'Student not found'}
@@ -215,7 +202,7 @@ class HallTicketController(http.Controller):
                 csrf=True)
     def hall_ticket_send_email(self, hall_ticket_id, **post):
         """Send hall ticket to student email"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         hall_ticket = request.env['examination.hall.ticket'].browse(hall_ticket_id)
 
         if not student or hall_ticket.student_id != student:
@@ -2,6 +2,7 @@
 from odoo import http, _, fields
 from odoo.http import request
 from odoo.exceptions import AccessError, ValidationError
+import base64
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -14,7 +15,7 @@ class IDCardController(http.Controller):
     @http.route(['/my/id-card'], type='http', auth="user", website=True)
     def id_card_page(self, **kw):
         """View ID card details"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -33,11 +34,35 @@ class IDCardController(http.Controller):
 
         return request.render("university_management.student_id_card_page", values)
 
+    # ==================== QR CODES ====================
+    @http.route(['/university/qr/<string:key>.png'], type='http', auth="user")
+    def qr_code_image(self, key, **kw):
+        """Serve a hall ticket or ID card QR code, rendering it on first request
+
+        Images are addressed by the hash of their payload so they never change
+        and can be cached by the browser for good.
+        """
+        # The payload is only looked up among the records the user can read
+        payload = request.env['university.qr.code']._find_payload(key)
+        if not payload:
+            return request.not_found()
+
+        etag = f'"{key}"'
+        headers = [
+            ('Cache-Control', 'private, max-age=31536000, immutable'),
+            ('ETag', etag),
+        ]
+        if etag in request.httprequest.headers.get('If-None-Match', ''):
+            return request.make_response(b'', headers=headers, status=304)
+
+        image = request.env['university.qr.code'].get_qr_images([payload])[payload]
+        return request.make_response(base64.b64decode(image), headers=headers + [('Content-Type', 'image/png')])
+
     # ==================== DOWNLOAD ID CARD ====================
     @http.route(['/my/id-card/download'], type='http', auth="user")
     def id_card_download(self, **kw):
         """Download ID card as PDF"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -52,23 +77,16 @@ class IDCardController(http.Controller):
                 'message': _('ID card not found or not yet generated.')
             })
 
-        # Generate PDF report
-        report = request.env.ref('university_management.action_report_student_id_card')
-        pdf, _ = report.sudo()._render_qweb_pdf([id_card.id])
-
-        pdfhttpheaders = [
-            ('Content-Type', 'application/pdf'),
-            ('Content-Length', len(pdf)),
-            ('Content-Disposition', f'attachment; filename="IDCard_{id_card.card_number}.pdf"')
-        ]
-
-        return request.make_response(pdf, headers=pdfhttpheaders)
+        # Rendered once per version of the card, revalidated by the browser through its ETag
+        stream = request.env['university.report.cache'].get_pdf_stream(
+            'university_management.action_report_student_id_card', id_card, f'IDCard_{id_card.name}.pdf')
+        return stream.get_response(as_attachment=True)
 
     # ==================== REQUEST NEW ID CARD ====================
     @http.route(['/my/id-card/request-new'], type='http', auth="user", website=True)
     def id_card_request_new_page(self, **kw):
         """Request new ID card page"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -89,7 +107,7 @@ class IDCardController(http.Controller):
     @http.route(['/my/id-card/request-new/submit'], type='http', auth="user", methods=['POST'], website=True, csrf=True)
     def id_card_request_new_submit(self, **post):
         """Submit new ID card request"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -151,7 +169,7 @@ class IDCardController(http.Controller):
     @http.route(['/my/id-card/report-lost'], type='http', auth="user", methods=['POST'], website=True, csrf=True)
     def id_card_report_lost(self, **post):
         """Report lost ID card"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -278,7 +296,7 @@ class IDCardController(http.Controller):
     @http.route(['/api/id-card/info'], type='json', auth="user")
     def id_card_info(self, **kw):
         """Get ID card information (API)"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return {'success': False, 'error': 'Student not found'}
@@ -267,7 +267,7 @@ class UniversityWebsiteController(http.Controller):
                 })
 
             # Check if user is a student
-            student = request.env['student.student'].sudo().search([('user_id', '=', request.env.uid)], limit=1)
+            student = request.env['student.student'].sudo()._get_current_student()
             if not student:
                 return request.render("university_management.event_error_page", {
                     'error': _('Only students can register for events.'),
@@ -459,11 +459,11 @@ class UniversityPortalExtension(CustomerPortal):
         values = super()._prepare_home_portal_values(counters)
 
         if request.env.user.has_group('university_management.group_university_student'):
-            student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+            student = request.env['student.student']._get_current_student()
             if student:
+                values.update(student._get_portal_counters())
                 values.update({
                     'student': student,
-                    'fee_due_count': len(student.fee_payment_ids.filtered(lambda f: f.state == 'pending')),
                     'attendance_percentage': student.attendance_percentage,
                     'cgpa': student.cgpa,
                 })
@@ -14,7 +14,7 @@ class MarksheetController(http.Controller):
     @http.route(['/my/marksheets'], type='http', auth="user", website=True)
     def marksheet_list(self, **kw):
         """List available marksheets for student"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -36,7 +36,7 @@ class MarksheetController(http.Controller):
     @http.route(['/my/marksheet/<int:marksheet_id>'], type='http', auth="user", website=True)
     def marksheet_detail(self, marksheet_id, **kw):
         """View marksheet details"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         marksheet = request.env['examination.marksheet'].browse(marksheet_id)
 
         if not student or marksheet.student_id != student:
@@ -54,7 +54,7 @@ class MarksheetController(http.Controller):
     @http.route(['/my/marksheet/<int:marksheet_id>/download'], type='http', auth="user")
     def marksheet_download(self, marksheet_id, **kw):
         """Download marksheet as PDF"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         marksheet = request.env['examination.marksheet'].sudo().browse(marksheet_id)
 
         # Security check
@@ -67,17 +67,10 @@ class MarksheetController(http.Controller):
                 'message': _('Marksheet is not yet published. Please check back later.')
             })
 
-        # Generate PDF report
-        report = request.env.ref('university_management.action_report_marksheet')
-        pdf, _ = report.sudo()._render_qweb_pdf([marksheet_id])
-
-        pdfhttpheaders = [
-            ('Content-Type', 'application/pdf'),
-            ('Content-Length', len(pdf)),
-            ('Content-Disposition', f'attachment; filename="Marksheet_{marksheet.name}.pdf"')
-        ]
-
-        return request.make_response(pdf, headers=pdfhttpheaders)
+        # Rendered once per version of the marksheet, revalidated by the browser through its ETag
+        stream = request.env['university.report.cache'].get_pdf_stream(
+            'university_management.action_report_marksheet', marksheet, f'Marksheet_{marksheet.name}.pdf')
+        return stream.get_response(as_attachment=True)
 
     # ==================== PUBLIC MARKSHEET VERIFICATION ====================
     @http.route(['/marksheet/verify'], type='http', auth="public", website=True)
@@ -123,7 +116,7 @@ class MarksheetController(http.Controller):
     @http.route(['/my/marksheets/download-all'], type='http', auth="user")
     def marksheet_download_all(self, **kw):
         """Download all marksheets as single PDF"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -139,23 +132,17 @@ class MarksheetController(http.Controller):
                 'message': _('No marksheets available for download.')
             })
 
-        # Generate PDF report for all marksheets
-        report = request.env.ref('university_management.action_report_marksheet')
-        pdf, _ = report.sudo()._render_qweb_pdf(marksheets.ids)
-
-        pdfhttpheaders = [
-            ('Content-Type', 'application/pdf'),
-            ('Content-Length', len(pdf)),
-            ('Content-Disposition', f'attachment; filename="Marksheets_{student.registration_number}.pdf"')
-        ]
-
-        return request.make_response(pdf, headers=pdfhttpheaders)
+        # Rendered in chunks and cached until one of the marksheets changes
+        stream = request.env['university.report.cache'].get_pdf_stream(
+            'university_management.action_report_marksheet', marksheets,
+            f'Marksheets_{student.registration_number}.pdf')
+        return stream.get_response(as_attachment=True)
 
     # ==================== SEND MARKSHEET VIA EMAIL ====================
     @http.route(['/my/marksheet/<int:marksheet_id>/send-email'], type='http', auth="user", methods=['POST'], csrf=True)
     def marksheet_send_email(self, marksheet_id, **post):
         """Send marksheet to student email"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         marksheet = request.env['examination.marksheet'].browse(marksheet_id)
 
         if not student or marksheet.student_id != student:
@@ -176,7 +163,7 @@ class MarksheetController(http.Controller):
     @http.route(['/api/marksheet/status'], type='json', auth="user")
     def marksheet_status(self, **kw):
         """Check marksheet status (API)"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return {'success': False, 'error': 'Student not found'}
@@ -210,7 +197,7 @@ class MarksheetController(http.Controller):
     @http.route(['/my/marksheet/request-duplicate'], type='http', auth="user", website=True)
     def marksheet_request_duplicate_page(self, **kw):
         """Request duplicate marksheet page"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -232,7 +219,7 @@ class MarksheetController(http.Controller):
                 csrf=True)
     def marksheet_request_duplicate_submit(self, **post):
         """Submit duplicate marksheet request"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -11,26 +11,27 @@ _logger = logging.getLogger(__name__)
 class ParentPortalController(CustomerPortal):
     """Parent Portal Controller"""
 
+    def _get_parents(self):
+        """Parent records of the current user, one per linked student"""
+        return request.env['student.parent']._get_current_parents()
+
     def _get_parent_students(self):
         """Get students linked to parent"""
-        parent = request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1)
-        if parent:
-            return parent.student_ids
-        return request.env['student.student']
+        return self._get_parents().student_id
 
     # ==================== PARENT DASHBOARD ====================
     @http.route(['/my/parent/dashboard'], type='http', auth="user", website=True)
     def parent_dashboard(self, **kw):
         """Parent Dashboard"""
-        parent = request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1)
+        parents = self._get_parents()
 
-        if not parent:
+        if not parents:
             return request.redirect('/my')
 
-        students = parent.student_ids
+        students = parents.student_id
 
         values = {
-            'parent': parent,
+            'parent': parents[:1],
             'students': students,
             'page_name': 'parent_dashboard',
         }
@@ -69,15 +70,16 @@ class ParentPortalController(CustomerPortal):
             ('state', '=', 'published')
         ], order='examination_id desc', limit=5)
 
+        counters = request.env['student.attendance']._get_summary(student.ids).get((student.id,), {})
         attendance_summary = {
-            'overall': student.attendance_percentage,
-            'present': student.classes_attended,
-            'absent': student.classes_absent,
-            'total': student.total_classes_conducted,
+            'overall': counters.get('percentage', 0.0),
+            'present': counters.get('present', 0),
+            'absent': counters.get('absent', 0),
+            'total': counters.get('total', 0),
         }
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'results': results,
             'attendance_summary': attendance_summary,
@@ -104,26 +106,11 @@ class ParentPortalController(CustomerPortal):
 
         attendance = request.env['student.attendance'].search(domain, order='date desc', limit=30)
 
-        # Subject-wise attendance
-        subject_attendance = {}
-        for att in student.attendance_ids:
-            subject = att.subject_id.name
-            if subject not in subject_attendance:
-                subject_attendance[subject] = {'present': 0, 'absent': 0, 'total': 0}
-            subject_attendance[subject]['total'] += 1
-            if att.state == 'present':
-                subject_attendance[subject]['present'] += 1
-            elif att.state == 'absent':
-                subject_attendance[subject]['absent'] += 1
-
-        # Calculate percentages
-        for subject in subject_attendance:
-            total = subject_attendance[subject]['total']
-            if total > 0:
-                subject_attendance[subject]['percentage'] = (subject_attendance[subject]['present'] / total) * 100
+        # Subject-wise attendance, counted in the database
+        subject_attendance = request.env['student.attendance']._get_subject_summary(student)
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'attendance': attendance,
             'subject_attendance': subject_attendance,
@@ -157,7 +144,7 @@ class ParentPortalController(CustomerPortal):
         }
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'fee_payments': fee_payments,
             'fee_summary': fee_summary,
@@ -191,7 +178,7 @@ class ParentPortalController(CustomerPortal):
         }
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'results': results,
             'performance': performance,
@@ -224,7 +211,7 @@ class ParentPortalController(CustomerPortal):
             timetable_by_day[tt.day_of_week].append(tt)
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'timetable_by_day': timetable_by_day,
             'page_name': 'student_timetable',
@@ -248,7 +235,7 @@ class ParentPortalController(CustomerPortal):
         ], order='from_date desc')
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'leave_requests': leave_requests,
             'page_name': 'leave_request',
@@ -300,7 +287,7 @@ class ParentPortalController(CustomerPortal):
         ], order='date desc', limit=20)
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'messages': messages,
             'page_name': 'student_messages',
@@ -322,7 +309,7 @@ class ParentPortalController(CustomerPortal):
             student = students.filtered(lambda s: s.id == int(student_id))
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'students': students,
             'student': student,
             'page_name': 'contact_teacher',
@@ -337,7 +324,7 @@ class ParentPortalController(CustomerPortal):
         try:
             # Create communication record or send message
             vals = {
-                'parent_id': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1).id,
+                'parent_id': self._get_parents()[:1].id,
                 'student_id': int(post.get('student_id')),
                 'subject': post.get('subject'),
                 'message': post.get('message'),
@@ -367,7 +354,7 @@ class ParentPortalController(CustomerPortal):
         ], order='create_date desc')
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'event_registrations': event_registrations,
             'page_name': 'student_events',
@@ -391,7 +378,7 @@ class ParentPortalController(CustomerPortal):
         ], order='create_date desc')
 
         values = {
-            'parent': request.env['student.parent'].search([('user_id', '=', request.env.uid)], limit=1),
+            'parent': self._get_parents()[:1],
             'student': student,
             'documents': documents,
             'page_name': 'student_documents',
@@ -19,19 +19,13 @@ class StudentPortalController(CustomerPortal):
         values = super(StudentPortalController, self)._prepare_portal_layout_values()
 
         # Check if user is a student
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if student:
+            # Counters are computed by the portal home, in a single query
             values.update({
                 'is_student': True,
                 'student': student,
-                'fee_count': len(student.fee_payment_ids),
-                'attendance_count': len(student.attendance_ids),
-                'result_count': len(student.result_ids),
-                'library_issue_count': request.env['library.issue'].search_count([
-                    ('member_id', '=', student.id),
-                    ('state', 'in', ['issued', 'overdue'])
-                ]),
             })
         else:
             values['is_student'] = False
@@ -42,7 +36,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/student/dashboard'], type='http', auth="user", website=True)
     def student_dashboard(self, **kw):
         """Student Dashboard"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -78,7 +72,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/profile'], type='http', auth="user", website=True)
     def student_profile(self, **kw):
         """Student Profile"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -98,7 +92,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/profile/update'], type='http', auth="user", methods=['POST'], website=True, csrf=True)
     def student_profile_update(self, **post):
         """Update student profile"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -133,18 +127,20 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/attendance', '/my/attendance/page/<int:page>'], type='http', auth="user", website=True)
     def student_attendance(self, page=1, date_from=None, date_to=None, subject=None, **kw):
         """View attendance records"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
 
         Attendance = request.env['student.attendance']
 
-        domain = [('student_id', '=', student.id)]
+        date_domain = []
         if date_from:
-            domain += [('date', '>=', date_from)]
+            date_domain += [('date', '>=', date_from)]
         if date_to:
-            domain += [('date', '<=', date_to)]
+            date_domain += [('date', '<=', date_to)]
+
+        domain = [('student_id', '=', student.id)] + date_domain
         if subject:
             domain += [('subject_id', '=', int(subject))]
 
@@ -159,6 +155,8 @@ class StudentPortalController(CustomerPortal):
         )
 
         attendance = Attendance.search(domain, limit=20, offset=pager['offset'], order='date desc')
+        # Subject-wise attendance over the selected period, counted in the database
+        subject_attendance = Attendance._get_subject_summary(student, date_domain)
         subjects = request.env['university.subject'].search([
             ('semester_id', '=', student.current_semester_id.id)
         ])
@@ -166,6 +164,7 @@ class StudentPortalController(CustomerPortal):
         values = {
             'student': student,
             'attendance': attendance,
+            'subject_attendance': subject_attendance,
             'subjects': subjects,
             'pager': pager,
             'date_from': date_from,
@@ -180,7 +179,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/timetable'], type='http', auth="user", website=True)
     def student_timetable(self, **kw):
         """View class timetable"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -210,7 +209,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/fees', '/my/fees/page/<int:page>'], type='http', auth="user", website=True)
     def student_fees(self, page=1, **kw):
         """View fee payments"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -245,7 +244,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/fee/<int:fee_id>'], type='http', auth="user", website=True)
     def student_fee_detail(self, fee_id, **kw):
         """Fee payment detail"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
         fee = request.env['fee.payment'].browse(fee_id)
 
         if not student or fee.student_id != student:
@@ -263,7 +262,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/results'], type='http', auth="user", website=True)
     def student_results(self, **kw):
         """View examination results"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -285,7 +284,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/library'], type='http', auth="user", website=True)
     def student_library(self, **kw):
         """View library issued books"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -319,7 +318,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/events'], type='http', auth="user", website=True)
     def student_events(self, **kw):
         """View registered events"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -340,7 +339,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/hostel'], type='http', auth="user", website=True)
     def student_hostel(self, **kw):
         """View hostel allocation"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
@@ -362,7 +361,7 @@ class StudentPortalController(CustomerPortal):
     @http.route(['/my/transport'], type='http', auth="user", website=True)
     def student_transport(self, **kw):
         """View transport allocation"""
-        student = request.env['student.student'].search([('user_id', '=', request.env.uid)], limit=1)
+        student = request.env['student.student']._get_current_student()
 
         if not student:
             return request.redirect('/my')
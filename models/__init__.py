@@ -1,3 +1,6 @@
+# Dashboard first: its cache invalidation mixin is inherited by the other models
+from . import dashboard
+from . import ir_sequence
 from . import academic
 from . import student
 from . import fee
@@ -11,5 +14,4 @@ from . import alumni
 from . import project
 from . import internship
 from . import events
-from . import timetable
-from . import dashboard
\ No newline at end of file
+from . import timetable
\ No newline at end of file
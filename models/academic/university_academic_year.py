@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class UniversityAcademicYear(models.Model):
     _name = 'university.academic.year'
     _description = 'University Academic Year'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'start_date desc'
 
     name = fields.Char(string='Academic Year', required=True, tracking=True,
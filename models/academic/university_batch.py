@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class UniversityBatch(models.Model):
     _name = 'university.batch'
     _description = 'University Batch/Year Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'start_year desc'
 
     name = fields.Char(string='Batch Name', required=True, tracking=True,
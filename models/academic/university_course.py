@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class UniversityCourse(models.Model):
     _name = 'university.course'
     _description = 'University Course Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'semester_id, name'
 
     name = fields.Char(string='Course Name', required=True, tracking=True)
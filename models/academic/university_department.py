@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class UniversityDepartment(models.Model):
     _name = 'university.department'
     _description = 'University Department (CSE, ECE, Civil, Mechanical, etc.)'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'name'
 
     name = fields.Char(string='Department Name', required=True, tracking=True,
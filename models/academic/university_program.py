@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class UniversityProgram(models.Model):
     _name = 'university.program'
     _description = 'University Program (B.Tech, M.Tech, MBA, etc.)'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'name'
 
     name = fields.Char(string='Program Name', required=True, tracking=True,
@@ -1 +1,5 @@
-from . import university_dashboard
\ No newline at end of file
+from . import university_dashboard
+from . import dashboard_statistics
+from . import dashboard_cache
+from . import attendance_daily_summary
+from . import kpi_timeseries
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.tools import SQL
+from odoo.tools.sql import table_exists
+from collections import Counter, defaultdict
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AttendanceDailySummaryMixin(models.AbstractModel):
+    """Keep ``university.attendance.daily`` in sync with an attendance model"""
+    _name = 'university.attendance.daily.mixin'
+    _description = 'Daily Attendance Summary Mixin'
+
+    # Fields whose change moves a record to another summary row or status
+    _attendance_summary_fields = ['date', 'state']
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['university.attendance.daily']._apply_attendance_delta(records)
+        return records
+
+    def write(self, vals):
+        if not set(self._attendance_summary_fields) & set(vals):
+            return super().write(vals)
+        Summary = self.env['university.attendance.daily']
+        old_counts = Summary._attendance_counts(self)
+        result = super().write(vals)
+        Summary._apply_attendance_delta(self, old_counts)
+        return result
+
+    def unlink(self):
+        Summary = self.env['university.attendance.daily']
+        old_counts = Summary._attendance_counts(self)
+        result = super().unlink()
+        Summary._apply_attendance_delta(self.browse(), old_counts)
+        return result
+
+
+class AttendanceDailySummary(models.Model):
+    """Daily attendance rollup per program/batch (students) and department (faculty)
+
+    Maintained incrementally by ``student.attendance`` and
+    ``faculty.attendance`` so that trend charts read one row per day and
+    group instead of scanning the raw attendance tables.
+    """
+    _name = 'university.attendance.daily'
+    _description = 'Daily Attendance Summary'
+    _order = 'date desc, member_type'
+
+    date = fields.Date(string='Date', required=True, index=True, readonly=True)
+    member_type = fields.Selection([
+        ('student', 'Student'),
+        ('faculty', 'Faculty'),
+    ], string='Member Type', required=True, readonly=True)
+
+    program_id = fields.Many2one('university.program', string='Program', readonly=True)
+    batch_id = fields.Many2one('university.batch', string='Batch', readonly=True)
+    department_id = fields.Many2one('university.department', string='Department', readonly=True)
+
+    present_count = fields.Integer(string='Present', readonly=True)
+    absent_count = fields.Integer(string='Absent', readonly=True)
+    late_count = fields.Integer(string='Late', readonly=True)
+    total_count = fields.Integer(string='Total Marked', readonly=True)
+
+    # Source table and the columns identifying one summary row for each member type
+    _member_sources = {
+        'student': ('student_attendance', ['program_id', 'batch_id', 'department_id']),
+        'faculty': ('faculty_attendance', ['department_id']),
+    }
+
+    # States with their own counter; other states only count in the total
+    _counted_states = ('present', 'absent', 'late')
+
+    # Days rebuilt by the nightly cron, overridable through the
+    # ``university_management.attendance_summary_rebuild_days`` system parameter
+    _rebuild_days = 31
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS university_attendance_daily_key_uniq
+            ON university_attendance_daily (
+                date, member_type,
+                COALESCE(program_id, 0), COALESCE(batch_id, 0), COALESCE(department_id, 0)
+            )
+        """)
+        # Backfill once when the rollup is installed on a database with history
+        self.env.cr.execute("SELECT 1 FROM university_attendance_daily LIMIT 1")
+        if not self.env.cr.fetchone():
+            for member_type, (table, group_columns) in self._member_sources.items():
+                if table_exists(self.env.cr, table):
+                    self._rebuild(member_type)
+
+    @api.model
+    def _rebuild(self, member_type, date_from=None):
+        """Recompute summary rows of ``member_type`` from the raw attendance
+
+        Used for the initial backfill and by the nightly cron, which corrects
+        any drift from changes that bypass the ORM (a student moved to another
+        program, SQL imports); without ``date_from`` the whole history is rebuilt.
+        """
+        table, group_columns = self._member_sources[member_type]
+        columns = ', '.join(group_columns)
+
+        where = 'TRUE'
+        params = {'member_type': member_type, 'uid': self.env.uid}
+        if date_from:
+            where = 'date >= %(date_from)s'
+            params['date_from'] = date_from
+
+        self.env.cr.execute(f"""
+            DELETE FROM university_attendance_daily
+            WHERE member_type = %(member_type)s AND {where}
+        """, params)
+        self.env.cr.execute(f"""
+            INSERT INTO university_attendance_daily
+                (date, member_type, {columns},
+                 present_count, absent_count, late_count, total_count,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT date, %(member_type)s, {columns},
+                   COUNT(*) FILTER (WHERE state = 'present'),
+                   COUNT(*) FILTER (WHERE state = 'absent'),
+                   COUNT(*) FILTER (WHERE state = 'late'),
+                   COUNT(*),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+            FROM {table}
+            WHERE {where}
+            GROUP BY date, {columns}
+        """, params)
+        self.invalidate_model()
+
+    @api.model
+    def _get_member_type(self, attendances):
+        return 'student' if attendances._name == 'student.attendance' else 'faculty'
+
+    @api.model
+    def _attendance_counts(self, attendances):
+        """Count ``attendances`` per summary row as ``{(date, *group ids): Counter(state)}``"""
+        group_columns = self._member_sources[self._get_member_type(attendances)][1]
+        counts = defaultdict(Counter)
+        for record in attendances:
+            if record.date:
+                counts[(record.date, *(record[column].id for column in group_columns))][record.state] += 1
+        return counts
+
+    @api.model
+    def _apply_attendance_delta(self, attendances, old_counts=None):
+        """Add ``attendances`` to their summary rows and withdraw ``old_counts``
+
+        Only the net change of each row is upserted (``count = count +
+        delta``), so concurrent attendance writes on the same day update the
+        row in place instead of deleting and recounting the whole bucket.
+        """
+        member_type = self._get_member_type(attendances)
+        group_columns = self._member_sources[member_type][1]
+        deltas = self._attendance_counts(attendances)
+        for key, counts in (old_counts or {}).items():
+            deltas[key].subtract(counts)
+
+        now = fields.Datetime.now()
+        rows = []
+        # Rows are upserted in key order so that concurrent transactions lock them in the same order
+        for (date, *group_ids), counts in sorted(deltas.items()):
+            values = [counts['present'], counts['absent'], counts['late'], sum(counts.values())]
+            if any(values):
+                rows.append(SQL("(%s)", SQL(", ").join([
+                    date, member_type, *(group_id or None for group_id in group_ids),
+                    *values, self.env.uid, now, self.env.uid, now,
+                ])))
+        if not rows:
+            return
+
+        self.env.cr.execute(SQL("""
+            INSERT INTO university_attendance_daily
+                (date, member_type, %(columns)s,
+                 present_count, absent_count, late_count, total_count,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES %(rows)s
+            ON CONFLICT (date, member_type, COALESCE(program_id, 0), COALESCE(batch_id, 0), COALESCE(department_id, 0))
+            DO UPDATE SET
+                present_count = university_attendance_daily.present_count + EXCLUDED.present_count,
+                absent_count = university_attendance_daily.absent_count + EXCLUDED.absent_count,
+                late_count = university_attendance_daily.late_count + EXCLUDED.late_count,
+                total_count = university_attendance_daily.total_count + EXCLUDED.total_count,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+        """, columns=SQL(", ").join(SQL.identifier(column) for column in group_columns), rows=SQL(", ").join(rows)))
+        self.invalidate_model()
+        self.env['university.dashboard.cache']._invalidate_model(self._name)
+
+    # ==================== TREND QUERIES ====================
+
+    @api.model
+    def get_daily_totals(self, date_from, date_to, member_type='student', domain=None):
+        """Return ``{date: {'present', 'absent', 'late', 'total'}}`` for a date range
+
+        One aggregate query over ``(date_to - date_from)`` days of summary rows,
+        whatever the size of the underlying attendance tables.
+        """
+        groups = self._read_group(
+            [('member_type', '=', member_type), ('date', '>=', date_from), ('date', '<=', date_to)]
+            + (domain or []),
+            ['date:day'],
+            ['present_count:sum', 'absent_count:sum', 'late_count:sum', 'total_count:sum'],
+        )
+        return {
+            date: {'present': present or 0, 'absent': absent or 0, 'late': late or 0, 'total': total or 0}
+            for date, present, absent, late, total in groups
+        }
+
+    @api.model
+    def _count_attendance(self, model_name, domain):
+        """Count ``model_name`` attendance records matching ``domain`` from the rollup
+
+        Supports conjunctions of leaves on the date, the summary group columns
+        and the counted states; returns None for any other domain so that the
+        caller falls back to the raw attendance table.
+        """
+        member_type = {'student.attendance': 'student', 'faculty.attendance': 'faculty'}.get(model_name)
+        if not member_type:
+            return None
+
+        group_columns = self._member_sources[member_type][1]
+        summary_domain = [('member_type', '=', member_type)]
+        states = None
+        for leaf in domain:
+            if leaf == '&':
+                continue
+            if not isinstance(leaf, (list, tuple)) or len(leaf) != 3:
+                return None
+            field_name, operator, value = leaf
+            if field_name == 'state' and operator in ('=', 'in'):
+                selected = {value} if operator == '=' else set(value)
+                states = selected if states is None else states & selected
+            elif field_name == 'date' or field_name in group_columns:
+                summary_domain.append((field_name, operator, value))
+            else:
+                return None
+
+        if states is None:
+            aggregates = ['total_count:sum']
+        elif states <= set(self._counted_states):
+            aggregates = [f'{state}_count:sum' for state in states]
+        else:
+            return None
+        if not aggregates:
+            return 0
+        [row] = self._read_group(summary_domain, [], aggregates)
+        return sum(value or 0 for value in row)
+
+    @api.model
+    def _cron_rebuild_summary(self):
+        """Cron job rebuilding the recent days of the rollup from the raw attendance"""
+        days = self.env['ir.config_parameter'].sudo().get_param(
+            'university_management.attendance_summary_rebuild_days')
+        try:
+            days = int(days) if days else self._rebuild_days
+        except ValueError:
+            _logger.warning(f"Invalid attendance summary rebuild window: {days}")
+            days = self._rebuild_days
+        date_from = fields.Date.today() - timedelta(days=days)
+        for member_type in self._member_sources:
+            self._rebuild(member_type, date_from)
+        self.env['university.dashboard.cache']._invalidate_model(self._name)
+
+    @api.model
+    def action_rebuild_all(self):
+        """Rebuild the whole rollup from the raw attendance tables"""
+        for member_type in self._member_sources:
+            self._rebuild(member_type)
+        self.env['university.dashboard.cache']._invalidate_model(self._name)
+        return True
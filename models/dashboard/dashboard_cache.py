@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from collections import Counter, defaultdict
+from datetime import timedelta
+import hashlib
+import json
+import logging
+from psycopg2.errors import SerializationFailure
+
+_logger = logging.getLogger(__name__)
+
+# Per-process hit/miss counters, keyed by database name then section
+_cache_counters = defaultdict(Counter)
+
+
+class DashboardCacheMixin(models.AbstractModel):
+    """Invalidate cached dashboard sections when records change
+
+    Only inherited by the models the statistics sections read, see
+    ``university.dashboard.statistics._section_models``. Raw attendance is
+    not one of them: the sections read the daily rollup, which invalidates
+    them itself.
+    """
+    _name = 'university.dashboard.cache.mixin'
+    _description = 'Dashboard Cache Invalidation Mixin'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['university.dashboard.cache']._invalidate_model(self._name)
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.env['university.dashboard.cache']._invalidate_model(self._name)
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env['university.dashboard.cache']._invalidate_model(self._name)
+        return result
+
+
+class DashboardCache(models.Model):
+    """Cached dashboard statistics sections shared by all administrators"""
+    _name = 'university.dashboard.cache'
+    _description = 'Dashboard Statistics Cache'
+    _order = 'section'
+
+    section = fields.Char(string='Section', required=True, index=True)
+    payload = fields.Text(string='Payload (JSON)')
+    computed_at = fields.Datetime(string='Computed At')
+    expires_at = fields.Datetime(string='Expires At')
+    statistics_date = fields.Date(string='Statistics Date',
+                                  help='Day the figures were computed for; date based counters expire at midnight')
+
+    _sql_constraints = [
+        ('section_unique', 'UNIQUE(section)', 'Only one cache entry per dashboard section!'),
+    ]
+
+    # Default time to live in minutes, overridable per section through the
+    # ``university_management.dashboard_cache_ttl.<section>`` system parameter
+    _default_ttls = {
+        'overview': 60,
+        'academic': 60,
+        'student': 15,
+        'faculty': 15,
+        'examination': 15,
+        'fee': 10,
+        'library': 30,
+        'hostel': 30,
+        'transport': 120,
+        'placement': 60,
+        'attendance': 5,
+        'recent_activities': 5,
+        'upcoming_events': 30,
+        'alerts': 5,
+    }
+
+    @api.model
+    def get_dashboard_statistics(self):
+        """Build the complete dashboard payload, serving fresh sections from the cache"""
+        Statistics = self.env['university.dashboard.statistics']
+        return {
+            section: self._get_section(section)
+            for section, method in Statistics._dashboard_sections
+        }
+
+    @api.model
+    def _get_section(self, section):
+        """Return one section from the cache, computing and storing it on a miss"""
+        counters = _cache_counters[self.env.cr.dbname]
+        entry = self.search([('section', '=', section)], limit=1)
+        if entry._is_fresh():
+            counters[f'{section}.hit'] += 1
+            return json.loads(entry.payload)
+
+        counters[f'{section}.miss'] += 1
+        return self._compute_section(section)
+
+    def _is_fresh(self):
+        if not self or not self.payload:
+            return False
+        return self.expires_at > fields.Datetime.now() and self.statistics_date == fields.Date.today()
+
+    @api.model
+    def _compute_section(self, section):
+        """Compute a section with the statistics engine and store it
+
+        Concurrent misses on the same section both upsert its entry; under
+        repeatable read the later one fails to serialize. That failure is
+        rolled back to a savepoint and the computed value is served
+        uncached, instead of failing and retrying the whole request.
+        """
+        Statistics = self.env['university.dashboard.statistics']
+        method = dict(Statistics._dashboard_sections)[section]
+        value = getattr(Statistics, method)()
+        payload = json.dumps(value, default=str)
+        self._store_section(section, payload)
+        # Serve the JSON round-tripped value so hits and misses look alike
+        return json.loads(payload)
+
+    @api.model
+    def _store_section(self, section, payload):
+        """Upsert the cache entry of a section, giving up on a concurrent update"""
+        now = fields.Datetime.now()
+        try:
+            with self.env.cr.savepoint():
+                self.env.cr.execute("""
+                    INSERT INTO university_dashboard_cache
+                        (section, payload, computed_at, expires_at, statistics_date,
+                         create_uid, create_date, write_uid, write_date)
+                    VALUES (%(section)s, %(payload)s, %(now)s, %(expires_at)s, %(today)s,
+                            %(uid)s, %(now)s, %(uid)s, %(now)s)
+                    ON CONFLICT (section) DO UPDATE SET
+                        payload = EXCLUDED.payload,
+                        computed_at = EXCLUDED.computed_at,
+                        expires_at = EXCLUDED.expires_at,
+                        statistics_date = EXCLUDED.statistics_date,
+                        write_uid = EXCLUDED.write_uid,
+                        write_date = EXCLUDED.write_date
+                """, {
+                    'section': section,
+                    'payload': payload,
+                    'now': now,
+                    'expires_at': now + timedelta(minutes=self._get_ttl(section)),
+                    'today': fields.Date.today(),
+                    'uid': self.env.uid,
+                }, log_exceptions=False)
+        except SerializationFailure:
+            _logger.info(f"Dashboard cache: concurrent update of section {section}, served without caching")
+        self.invalidate_model()
+
+    @api.model
+    def _get_ttl(self, section):
+        """Time to live of a section in minutes"""
+        ttl = self.env['ir.config_parameter'].sudo().get_param(
+            f'university_management.dashboard_cache_ttl.{section}')
+        try:
+            return int(ttl) if ttl else self._default_ttls.get(section, 15)
+        except ValueError:
+            _logger.warning(f"Invalid dashboard cache TTL for section {section}: {ttl}")
+            return self._default_ttls.get(section, 15)
+
+    # ==================== INVALIDATION ====================
+
+    @api.model
+    def _invalidate_model(self, model_name):
+        """Drop the sections depending on ``model_name`` once the transaction commits
+
+        The delete runs in its own cursor after commit so that frequent writes
+        (attendance, payments) never contend on the cache rows.
+        """
+        sections = {
+            section for section, model_names in self.env['university.dashboard.statistics']._section_models.items()
+            if model_name in model_names
+        }
+        analytics_ids = self.env['university.dashboard.analytics']._get_dependent_analytics(model_name)
+        if not sections and not analytics_ids:
+            return
+
+        postcommit = self.env.cr.postcommit
+        pending = postcommit.data.get('university_dashboard_cache.sections')
+        if pending is None:
+            pending = postcommit.data['university_dashboard_cache.sections'] = {
+                'sections': set(),
+                'analytics': set(),
+            }
+            registry = self.env.registry
+
+            @postcommit.add
+            def _clear_sections():
+                try:
+                    with registry.cursor() as cr:
+                        if pending['sections']:
+                            cr.execute("DELETE FROM university_dashboard_cache WHERE section IN %s",
+                                       [tuple(pending['sections'])])
+                        if pending['analytics']:
+                            cr.execute("DELETE FROM university_dashboard_analytics_cache WHERE analytics_id IN %s",
+                                       [tuple(pending['analytics'])])
+                except Exception as e:
+                    # Entries still expire through their TTL
+                    _logger.warning(f"Dashboard cache invalidation failed: {str(e)}")
+
+        pending['sections'].update(sections)
+        pending['analytics'].update(analytics_ids)
+
+    # ==================== MONITORING & WARM-UP ====================
+
+    @api.model
+    def get_cache_statistics(self):
+        """Hit/miss counters of the current worker and the state of every entry"""
+        counters = _cache_counters[self.env.cr.dbname]
+        entries = {entry.section: entry for entry in self.search([])}
+        Statistics = self.env['university.dashboard.statistics']
+
+        sections = []
+        for section, method in Statistics._dashboard_sections:
+            entry = entries.get(section, self.browse())
+            hits = counters[f'{section}.hit']
+            misses = counters[f'{section}.miss']
+            sections.append({
+                'section': section,
+                'hits': hits,
+                'misses': misses,
+                'hit_ratio': round((hits / (hits + misses) * 100) if (hits + misses) > 0 else 0, 2),
+                'ttl': self._get_ttl(section),
+                'fresh': entry._is_fresh(),
+                'computed_at': entry.computed_at.isoformat() if entry.computed_at else None,
+                'expires_at': entry.expires_at.isoformat() if entry.expires_at else None,
+            })
+
+        return {
+            'hits': sum(section['hits'] for section in sections),
+            'misses': sum(section['misses'] for section in sections),
+            'sections': sections,
+        }
+
+    @api.model
+    def cron_warm_dashboard_cache(self):
+        """Cron job recomputing missing or expired dashboard sections"""
+        cache = self.sudo()
+        Statistics = self.env['university.dashboard.statistics']
+        entries = {entry.section: entry for entry in cache.search([])}
+
+        warmed = 0
+        for section, method in Statistics._dashboard_sections:
+            if entries.get(section, cache.browse())._is_fresh():
+                continue
+            try:
+                with self.env.cr.savepoint():
+                    cache._compute_section(section)
+                warmed += 1
+            except Exception as e:
+                _logger.error(f"Error warming dashboard section {section}: {str(e)}")
+
+        _logger.info(f"Dashboard cache warm-up: {warmed} sections recomputed")
+
+
+class DashboardAnalyticsCache(models.Model):
+    """Cached analytics results, one entry per analytics and set of parameters"""
+    _name = 'university.dashboard.analytics.cache'
+    _description = 'Dashboard Analytics Cache'
+
+    analytics_id = fields.Many2one('university.dashboard.analytics', string='Analytics', required=True,
+                                   ondelete='cascade', index=True)
+    params_key = fields.Char(string='Parameters Key', required=True)
+    payload = fields.Text(string='Payload (JSON)')
+    expires_at = fields.Datetime(string='Expires At')
+
+    _sql_constraints = [
+        ('params_unique', 'UNIQUE(analytics_id, params_key)', 'Only one cache entry per analytics and parameters!'),
+    ]
+
+    @api.model
+    def _get_key(self, params):
+        """Stable digest of the bound parameters of a run and of the user context
+
+        Model analytics run with the access rights, companies and language of
+        the current user, so their results are only shared by identical contexts.
+        """
+        key = {
+            'params': params,
+            'uid': self.env.uid,
+            'company_ids': sorted(self.env.companies.ids),
+            'lang': self.env.lang,
+        }
+        return hashlib.sha1(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+
+    @api.model
+    def _get_payload(self, analytics, key):
+        """Return the cached result, or None when missing or expired"""
+        counters = _cache_counters[self.env.cr.dbname]
+        entry = self.search([('analytics_id', '=', analytics.id), ('params_key', '=', key)], limit=1)
+        if entry.payload and entry.expires_at > fields.Datetime.now():
+            counters[f'analytics.{analytics.code}.hit'] += 1
+            return json.loads(entry.payload)
+        counters[f'analytics.{analytics.code}.miss'] += 1
+        return None
+
+    @api.model
+    def _store_payload(self, analytics, key, value):
+        """Store a result and return it JSON round-tripped like a cache hit"""
+        payload = json.dumps(value, default=str)
+        if analytics.cache_duration > 0:
+            now = fields.Datetime.now()
+            self.env.cr.execute("""
+                INSERT INTO university_dashboard_analytics_cache
+                    (analytics_id, params_key, payload, expires_at,
+                     create_uid, create_date, write_uid, write_date)
+                VALUES (%(analytics_id)s, %(key)s, %(payload)s, %(expires_at)s,
+                        %(uid)s, %(now)s, %(uid)s, %(now)s)
+                ON CONFLICT (analytics_id, params_key) DO UPDATE SET
+                    payload = EXCLUDED.payload,
+                    expires_at = EXCLUDED.expires_at,
+                    write_uid = EXCLUDED.write_uid,
+                    write_date = EXCLUDED.write_date
+            """, {
+                'analytics_id': analytics.id,
+                'key': key,
+                'payload': payload,
+                'expires_at': now + timedelta(minutes=analytics.cache_duration),
+                'uid': self.env.uid,
+                'now': now,
+            })
+            self.invalidate_model()
+        return json.loads(payload)
+
+    @api.autovacuum
+    def _gc_expired_entries(self):
+        self.search([('expires_at', '<', fields.Datetime.now())]).unlink()
@@ -0,0 +1,990 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from collections import defaultdict
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class DashboardStatistics(models.AbstractModel):
+    """Grouped-query statistics engine behind the university dashboard"""
+    _name = 'university.dashboard.statistics'
+    _description = 'Dashboard Statistics Engine'
+
+    # Scholarship states counted as active on the dashboard
+    _active_scholarship_states = ['open', 'selection', 'awarded']
+
+    # (payload key, builder method) in the order the dashboard renders them
+    _dashboard_sections = [
+        ('overview', '_get_overview_statistics'),
+        ('academic', '_get_academic_statistics'),
+        ('student', '_get_student_statistics'),
+        ('faculty', '_get_faculty_statistics'),
+        ('examination', '_get_examination_statistics'),
+        ('fee', '_get_fee_statistics'),
+        ('library', '_get_library_statistics'),
+        ('hostel', '_get_hostel_statistics'),
+        ('transport', '_get_transport_statistics'),
+        ('placement', '_get_placement_statistics'),
+        ('attendance', '_get_attendance_statistics'),
+        ('recent_activities', '_get_recent_activities'),
+        ('upcoming_events', '_get_upcoming_events'),
+        ('alerts', '_get_alerts_notifications'),
+    ]
+
+    # Models queried by each section builder, including the comodels its
+    # domains traverse; a change to any of them invalidates the cached section
+    _section_models = {
+        'overview': [
+            'student.student', 'faculty.faculty', 'university.program', 'university.department',
+            'university.course', 'university.batch', 'library.book', 'hostel.hostel', 'transport.vehicle',
+        ],
+        'academic': [
+            'university.academic.year', 'university.program', 'university.department', 'university.course',
+            'university.batch', 'student.student', 'faculty.faculty',
+        ],
+        'student': ['student.student', 'student.admission', 'student.document'],
+        'faculty': ['faculty.faculty', 'faculty.designation', 'faculty.leave', 'university.attendance.daily'],
+        'examination': [
+            'examination.examination', 'examination.hall.ticket', 'examination.result', 'examination.revaluation',
+        ],
+        'fee': ['fee.payment', 'scholarship.scholarship', 'university.academic.year', 'student.student'],
+        'library': ['library.book', 'library.category', 'library.issue', 'library.fine'],
+        'hostel': ['hostel.hostel', 'hostel.room', 'hostel.allocation', 'hostel.complaint', 'mess.attendance'],
+        'transport': ['transport.vehicle', 'transport.route', 'transport.allocation'],
+        'placement': [
+            'placement.drive', 'placement.company', 'placement.application', 'placement.offer', 'student.student',
+        ],
+        'attendance': ['university.attendance.daily'],
+        'recent_activities': ['student.admission', 'examination.examination', 'placement.offer'],
+        'upcoming_events': ['examination.examination', 'placement.drive', 'university.event', 'calendar.event'],
+        'alerts': [
+            'fee.payment', 'student.student', 'student.admission', 'faculty.leave', 'library.issue',
+            'examination.examination', 'hostel.complaint',
+        ],
+    }
+
+    @api.model
+    def get_dashboard_statistics(self):
+        """Build the complete dashboard payload"""
+        return {
+            section: getattr(self, method)()
+            for section, method in self._dashboard_sections
+        }
+
+    # ==================== AGGREGATION HELPERS ====================
+
+    @api.model
+    def _group_counts(self, model_name, domain, groupby):
+        """Count records per combination of ``groupby`` values in one query
+
+        Returns ``{key: count}`` where ``key`` is the group value for a single
+        groupby and a tuple of values otherwise; many2one values are ids.
+        """
+        groupby = [groupby] if isinstance(groupby, str) else list(groupby)
+        groups = self.env[model_name]._read_group(domain, groupby, ['__count'])
+        counts = {}
+        for row in groups:
+            key = tuple(self._group_value(value) for value in row[:-1])
+            counts[key[0] if len(key) == 1 else key] = row[-1]
+        return counts
+
+    @api.model
+    def _group_sums(self, model_name, domain, groupby, aggregate):
+        """Same as :meth:`_group_counts` for an aggregate such as ``amount:sum``"""
+        groups = self.env[model_name]._read_group(domain, [groupby], [aggregate])
+        return {self._group_value(value): total or 0 for value, total in groups}
+
+    @api.model
+    def _aggregate(self, model_name, domain, aggregates):
+        """Compute ungrouped aggregates (``amount:sum``, ``__count``...) in one query"""
+        [row] = self.env[model_name]._read_group(domain, [], aggregates)
+        return tuple(value or 0 for value in row)
+
+    @staticmethod
+    def _group_value(value):
+        return value.id if isinstance(value, models.BaseModel) else value
+
+    @staticmethod
+    def _sum_where(counts, predicate):
+        """Sum grouped values whose key matches ``predicate``"""
+        return sum(value for key, value in counts.items() if predicate(key))
+
+    @staticmethod
+    def _year_of_study(semester):
+        """Year of study of a semester number (semesters 1-2 are year 1)"""
+        return (semester + 1) // 2 if semester else 0
+
+    @staticmethod
+    def _marginal(counts, index):
+        """Collapse multi-key grouped values onto their ``index``-th key"""
+        totals = defaultdict(int)
+        for key, value in counts.items():
+            totals[key[index]] += value
+        return totals
+
+    # ==================== OVERVIEW STATISTICS ====================
+
+    @api.model
+    def _get_overview_statistics(self):
+        """Get overall university statistics"""
+        return {
+            'total_students': self.env['student.student'].search_count([('state', '=', 'enrolled')]),
+            'total_faculty': self.env['faculty.faculty'].search_count([('state', '=', 'active')]),
+            'total_programs': self.env['university.program'].search_count([('active', '=', True)]),
+            'total_departments': self.env['university.department'].search_count([('active', '=', True)]),
+            'total_courses': self.env['university.course'].search_count([('active', '=', True)]),
+            'active_batches': self.env['university.batch'].search_count([('state', '=', 'active')]),
+            'library_books': self.env['library.book'].search_count([]),
+            'hostel_capacity': self._get_hostel_capacity(),
+            'transport_vehicles': self.env['transport.vehicle'].search_count([('state', '=', 'active')]),
+        }
+
+    # ==================== ACADEMIC STATISTICS ====================
+
+    @api.model
+    def _get_academic_statistics(self):
+        """Get academic module statistics"""
+        AcademicYear = self.env['university.academic.year']
+        Program = self.env['university.program']
+        Department = self.env['university.department']
+
+        # Current academic year
+        current_academic_year = AcademicYear.search([('state', '=', 'active')], limit=1)
+
+        # Enrolled students per program and department, active faculty per department
+        students = self._group_counts('student.student', [
+            ('state', '=', 'enrolled')
+        ], ['program_id', 'department_id'])
+        students_by_program = self._marginal(students, 0)
+        students_by_department = self._marginal(students, 1)
+        faculty_by_department = self._group_counts('faculty.faculty', [
+            ('state', '=', 'active')
+        ], 'department_id')
+
+        # Programs breakdown
+        programs = Program.search([('active', '=', True)])
+        program_data = []
+        for program in programs:
+            program_data.append({
+                'name': program.name,
+                'code': program.code,
+                'student_count': students_by_program[program.id],
+                'duration': program.duration_years,
+                'type': program.program_type
+            })
+
+        # Departments breakdown
+        departments = Department.search([('active', '=', True)])
+        department_data = []
+        for dept in departments:
+            department_data.append({
+                'name': dept.name,
+                'code': dept.code,
+                'hod': dept.hod_id.name if dept.hod_id else '',
+                'student_count': students_by_department[dept.id],
+                'faculty_count': faculty_by_department.get(dept.id, 0)
+            })
+
+        # Course statistics (archived courses are excluded by the ORM, as before)
+        courses = self._group_counts('university.course', [], 'course_type')
+
+        # Batch statistics
+        batches = self._group_counts('university.batch', [], 'state')
+
+        return {
+            'current_academic_year': current_academic_year.name if current_academic_year else 'N/A',
+            'programs': program_data,
+            'departments': department_data,
+            'courses': {
+                'total': sum(courses.values()),
+                'theory': courses.get('theory', 0),
+                'practical': courses.get('practical', 0)
+            },
+            'batches': {
+                'active': batches.get('active', 0),
+                'total': sum(batches.values())
+            }
+        }
+
+    # ==================== STUDENT STATISTICS ====================
+
+    @api.model
+    def _get_student_statistics(self):
+        """Get student module statistics"""
+        today = fields.Date.today()
+        current_month_start = today.replace(day=1)
+
+        # Students by state, gender and semester in a single pass
+        students = self._group_counts('student.student', [], ['state', 'gender', 'current_semester'])
+        by_state = lambda state: self._sum_where(students, lambda key: key[0] == state)
+        enrolled_where = lambda predicate: self._sum_where(
+            students, lambda key: key[0] == 'enrolled' and predicate(key))
+
+        # Applications awaiting a decision overall, decisions of this month only
+        admissions = self._group_counts('student.admission', [
+            '|', '|',
+            ('state', 'in', ['submitted', 'under_review']),
+            '&',
+            ('state', 'in', ['approved', 'admitted']),
+            ('admission_date', '>=', current_month_start),
+            '&',
+            ('state', '=', 'rejected'),
+            ('rejection_date', '>=', current_month_start),
+        ], 'state')
+        approved_this_month = admissions.get('approved', 0) + admissions.get('admitted', 0)
+
+        # Document verification status
+        documents = self._group_counts('student.document', [
+            ('state', 'in', ['pending', 'verified'])
+        ], 'state')
+
+        return {
+            'total': sum(students.values()),
+            'enrolled': by_state('enrolled'),
+            'graduated': by_state('graduated'),
+            'suspended': by_state('suspended'),
+            'gender_distribution': {
+                'male': enrolled_where(lambda key: key[1] == 'male'),
+                'female': enrolled_where(lambda key: key[1] == 'female'),
+                'other': enrolled_where(lambda key: key[1] == 'other')
+            },
+            'admissions': {
+                'pending': admissions.get('submitted', 0) + admissions.get('under_review', 0),
+                'approved_this_month': approved_this_month,
+                'rejected_this_month': admissions.get('rejected', 0),
+                'new_this_month': approved_this_month
+            },
+            'by_year': [
+                {'year': year, 'count': enrolled_where(lambda key, year=year: self._year_of_study(key[2]) == year)}
+                for year in range(1, 5)
+            ],
+            'documents': {
+                'pending': documents.get('pending', 0),
+                'verified': documents.get('verified', 0)
+            }
+        }
+
+    # ==================== FACULTY STATISTICS ====================
+
+    @api.model
+    def _get_faculty_statistics(self):
+        """Get faculty module statistics"""
+        today = fields.Date.today()
+        current_month_start = today.replace(day=1)
+
+        # Faculty counts, employment types and designations
+        faculty = self._group_counts('faculty.faculty', [], ['state', 'employment_type', 'designation_id'])
+        active_where = lambda predicate: self._sum_where(
+            faculty, lambda key: key[0] == 'active' and predicate(key))
+        active_by_designation = self._marginal(
+            {key: count for key, count in faculty.items() if key[0] == 'active'}, 2)
+
+        # Designation breakdown
+        designations = self.env['faculty.designation'].search([('active', '=', True)])
+        designation_data = []
+        for designation in designations:
+            count = active_by_designation[designation.id]
+            if count > 0:
+                designation_data.append({
+                    'name': designation.name,
+                    'count': count
+                })
+
+        # Attendance for the current month, read from the daily rollup
+        attendance = self.env['university.attendance.daily'].get_daily_totals(
+            current_month_start, today, member_type='faculty')
+        total_attendance = sum(day['total'] for day in attendance.values())
+        present_count = sum(day['present'] for day in attendance.values())
+        absent_count = sum(day['absent'] for day in attendance.values())
+        today_attendance = attendance.get(today, {})
+
+        # Leave statistics
+        leaves = self._group_counts('faculty.leave', [
+            '|',
+            ('state', 'in', ['submitted', 'hod_approved']),
+            '&',
+            ('state', '=', 'approved'),
+            ('date_from', '>=', current_month_start),
+        ], 'state')
+
+        return {
+            'total': sum(faculty.values()),
+            'active': active_where(lambda key: True),
+            'inactive': self._sum_where(faculty, lambda key: key[0] != 'active'),
+            'employment_types': {
+                'full_time': active_where(lambda key: key[1] in ('permanent', 'temporary')),
+                'part_time': active_where(lambda key: key[1] == 'part_time'),
+                'contract': active_where(lambda key: key[1] == 'contract')
+            },
+            'by_designation': designation_data,
+            'attendance_month': {
+                'total': total_attendance,
+                'present': present_count,
+                'absent': absent_count,
+                'percentage': round((present_count / total_attendance * 100) if total_attendance > 0 else 0, 2)
+            },
+            'leaves': {
+                'pending': leaves.get('submitted', 0) + leaves.get('hod_approved', 0),
+                'approved_this_month': leaves.get('approved', 0)
+            },
+            'today_attendance': {
+                'present': today_attendance.get('present', 0),
+                'absent': today_attendance.get('absent', 0)
+            }
+        }
+
+    # ==================== EXAMINATION STATISTICS ====================
+
+    @api.model
+    def _get_examination_statistics(self):
+        """Get examination module statistics"""
+        today = fields.Date.today()
+        year_start = today.replace(month=1, day=1)
+
+        # Upcoming (next 30 days), ongoing and completed (current year) exams;
+        # each bucket has its own state so one grouped query separates them
+        exams = self._group_counts('examination.examination', [
+            '|', '|',
+            '&', '&',
+            ('start_date', '>=', today),
+            ('start_date', '<=', today + timedelta(days=30)),
+            ('state', '=', 'scheduled'),
+            '&', '&',
+            ('start_date', '<=', today),
+            ('end_date', '>=', today),
+            ('state', '=', 'ongoing'),
+            '&',
+            ('end_date', '>=', year_start),
+            ('state', '=', 'completed'),
+        ], 'state')
+
+        # Hall tickets issued for upcoming exams
+        hall_tickets_generated = self.env['examination.hall.ticket'].search_count([
+            ('examination_id.start_date', '>=', today),
+            ('state', 'in', ['issued', 'downloaded', 'printed'])
+        ])
+
+        # Published results of this year's exams, by pass/fail
+        results = self._group_counts('examination.result', [
+            ('state', '=', 'published'),
+            ('examination_id.start_date', '>=', year_start)
+        ], 'result')
+        results_published = sum(results.values())
+        passed_students = results.get('pass', 0)
+        failed_students = results.get('fail', 0)
+        results_pending = self.env['examination.result'].search_count([
+            ('state', 'in', ['draft', 'submitted', 'verified'])
+        ])
+
+        # Revaluation requests
+        revaluations = self._group_counts('examination.revaluation', [
+            '|',
+            ('state', 'in', ['submitted', 'under_review', 'revaluation_in_progress']),
+            '&',
+            ('state', '=', 'completed'),
+            ('revaluation_date', '>=', today.replace(day=1)),
+        ], 'state')
+        pending_revaluations = self._sum_where(revaluations, lambda state: state != 'completed')
+
+        return {
+            'upcoming_exams': exams.get('scheduled', 0),
+            'ongoing_exams': exams.get('ongoing', 0),
+            'completed_exams': exams.get('completed', 0),
+            'hall_tickets': {
+                'generated': hall_tickets_generated
+            },
+            'results': {
+                'published': results_published,
+                'pending': results_pending,
+                'passed': passed_students,
+                'failed': failed_students,
+                'pass_percentage': round((passed_students / (passed_students + failed_students) * 100)
+                                         if (passed_students + failed_students) > 0 else 0, 2)
+            },
+            'revaluations': {
+                'pending': pending_revaluations,
+                'completed_this_month': revaluations.get('completed', 0)
+            }
+        }
+
+    # ==================== FEE STATISTICS ====================
+
+    @api.model
+    def _get_fee_statistics(self):
+        """Get fee module statistics"""
+        FeePayment = self.env['fee.payment']
+
+        today = fields.Date.today()
+        current_month_start = today.replace(day=1)
+        current_year_start = today.replace(month=4, day=1)  # Academic year April start
+
+        # Paid amounts per month; both windows start on a month boundary
+        monthly_paid = self._group_sums('fee.payment', [
+            ('state', '=', 'paid'),
+            ('payment_date', '>=', min(current_year_start, current_month_start))
+        ], 'payment_date:month', 'amount:sum')
+
+        # Pending payments
+        pending_payments = FeePayment.search_count([('state', '=', 'pending')])
+        overdue_payments = FeePayment.search_count([
+            ('state', '=', 'pending'),
+            ('due_date', '<', today)
+        ])
+
+        # Payment modes
+        payment_modes = self._group_counts('fee.payment', [
+            ('payment_method', 'in', ['cash', 'online', 'cheque']),
+            ('payment_date', '>=', current_month_start)
+        ], 'payment_method')
+
+        # Scholarships
+        active_scholarships = self.env['scholarship.scholarship'].search_count([
+            ('state', 'in', self._active_scholarship_states)
+        ])
+        scholarship_amount, = self._aggregate('scholarship.scholarship', [
+            ('state', 'in', self._active_scholarship_states),
+            ('academic_year_id.state', '=', 'active')
+        ], ['total_amount:sum'])
+
+        # Fee defaulters
+        fee_defaulters = self._count_fee_defaulters()
+
+        return {
+            'total_collected_year': self._sum_where(monthly_paid, lambda month: month >= current_year_start),
+            'monthly_collection': self._sum_where(monthly_paid, lambda month: month >= current_month_start),
+            'pending_payments': pending_payments,
+            'overdue_payments': overdue_payments,
+            'payment_modes': {
+                'cash': payment_modes.get('cash', 0),
+                'online': payment_modes.get('online', 0),
+                'cheque': payment_modes.get('cheque', 0)
+            },
+            'scholarships': {
+                'active': active_scholarships,
+                'total_amount': scholarship_amount
+            },
+            'defaulters': fee_defaulters
+        }
+
+    @api.model
+    def _count_fee_defaulters(self):
+        """Enrolled students with at least one pending payment past its due date"""
+        return len(self._group_counts('fee.payment', [
+            ('state', '=', 'pending'),
+            ('due_date', '<', fields.Date.today()),
+            ('student_id.state', '=', 'enrolled')
+        ], 'student_id'))
+
+    # ==================== LIBRARY STATISTICS ====================
+
+    @api.model
+    def _get_library_statistics(self):
+        """Get library module statistics"""
+        LibraryIssue = self.env['library.issue']
+
+        today = fields.Date.today()
+        current_month_start = today.replace(day=1)
+
+        # Book statistics
+        books = self._group_counts('library.book', [], 'state')
+
+        # Books by category
+        books_by_category = self._group_counts('library.book', [], 'category_id')
+        categories = self.env['library.category'].search([])
+        category_data = []
+        for category in categories:
+            count = books_by_category.get(category.id, 0)
+            if count > 0:
+                category_data.append({
+                    'name': category.name,
+                    'count': count
+                })
+
+        # Issue/Return statistics
+        books_issued_month = LibraryIssue.search_count([
+            ('issue_date', '>=', current_month_start),
+            ('issue_date', '<=', today)
+        ])
+        books_returned_month = LibraryIssue.search_count([
+            ('return_date', '>=', current_month_start),
+            ('return_date', '<=', today),
+            ('state', '=', 'returned')
+        ])
+
+        # Overdue books
+        overdue_books = LibraryIssue.search_count([
+            ('due_date', '<', today),
+            ('state', 'in', ['issued', 'overdue'])
+        ])
+
+        # Fine statistics
+        total_fines, = self._aggregate('library.fine', [
+            ('date', '>=', current_month_start)
+        ], ['amount:sum'])
+        pending_fines, = self._aggregate('library.fine', [
+            ('state', '=', 'pending')
+        ], ['amount:sum'])
+
+        return {
+            'total_books': sum(books.values()),
+            'available': books.get('available', 0),
+            'issued': books.get('issued', 0),
+            'damaged': books.get('damaged', 0),
+            'by_category': category_data,
+            'monthly_activity': {
+                'issued': books_issued_month,
+                'returned': books_returned_month
+            },
+            'overdue': overdue_books,
+            'fines': {
+                'total_this_month': total_fines,
+                'pending': pending_fines
+            }
+        }
+
+    # ==================== HOSTEL STATISTICS ====================
+
+    @api.model
+    def _get_hostel_statistics(self):
+        """Get hostel module statistics"""
+        Hostel = self.env['hostel.hostel']
+
+        today = fields.Date.today()
+
+        # Hostel capacity
+        total_capacity = self._get_hostel_capacity()
+        allocations = self._group_counts('hostel.allocation', [('state', '=', 'allocated')], 'hostel_id')
+        allocated_beds = sum(allocations.values())
+        available_beds = total_capacity - allocated_beds
+
+        # Hostel wise occupancy
+        hostels = Hostel.search([('active', '=', True)])
+        hostel_data = []
+        for hostel in hostels:
+            allocated = allocations.get(hostel.id, 0)
+            hostel_data.append({
+                'name': hostel.name,
+                'type': hostel.hostel_type,
+                'capacity': hostel.total_capacity,
+                'allocated': allocated,
+                'available': hostel.total_capacity - allocated,
+                'occupancy_percentage': round(
+                    (allocated / hostel.total_capacity * 100) if hostel.total_capacity > 0 else 0, 2)
+            })
+
+        # Room statistics
+        rooms = self._group_counts('hostel.room', [], 'state')
+
+        # Complaints
+        complaints = self._group_counts('hostel.complaint', [
+            '|',
+            ('state', 'in', ['new', 'in_progress']),
+            '&',
+            ('state', '=', 'resolved'),
+            ('complaint_date', '>=', today.replace(day=1)),
+        ], 'state')
+
+        # Mess attendance today
+        mess_attendance_today = self.env['mess.attendance'].search_count([
+            ('date', '=', today),
+            ('present', '=', True)
+        ])
+
+        return {
+            'capacity': {
+                'total': total_capacity,
+                'allocated': allocated_beds,
+                'available': available_beds,
+                'occupancy_percentage': round((allocated_beds / total_capacity * 100) if total_capacity > 0 else 0, 2)
+            },
+            'hostels': hostel_data,
+            'rooms': {
+                'total': sum(rooms.values()),
+                'occupied': rooms.get('occupied', 0) + rooms.get('full', 0),
+                'available': rooms.get('available', 0),
+                'maintenance': rooms.get('maintenance', 0)
+            },
+            'complaints': {
+                'pending': complaints.get('new', 0) + complaints.get('in_progress', 0),
+                'resolved_this_month': complaints.get('resolved', 0)
+            },
+            'mess_attendance_today': mess_attendance_today
+        }
+
+    @api.model
+    def _get_hostel_capacity(self):
+        """Total bed capacity of active hostels"""
+        total_capacity, = self._aggregate('hostel.hostel', [('active', '=', True)], ['total_capacity:sum'])
+        return total_capacity
+
+    # ==================== TRANSPORT STATISTICS ====================
+
+    @api.model
+    def _get_transport_statistics(self):
+        """Get transport module statistics"""
+        TransportRoute = self.env['transport.route']
+
+        # Vehicle statistics
+        vehicles = self._group_counts('transport.vehicle', [], 'state')
+
+        # Active student allocations per route
+        allocations = self._group_counts('transport.allocation', [('state', '=', 'active')], 'route_id')
+
+        # Route wise allocation
+        routes = TransportRoute.search([('active', '=', True)])
+        route_data = []
+        for route in routes:
+            vehicle = route.vehicle_ids[:1]
+            route_data.append({
+                'name': route.name,
+                'route_code': route.code,
+                'vehicle': vehicle.name if vehicle else 'Not Assigned',
+                'student_count': allocations.get(route.id, 0),
+                'capacity': sum(route.vehicle_ids.mapped('seating_capacity'))
+            })
+
+        # Student allocations
+        total_allocations = sum(allocations.values())
+
+        return {
+            'vehicles': {
+                'total': sum(vehicles.values()),
+                'active': vehicles.get('active', 0),
+                'maintenance': vehicles.get('maintenance', 0)
+            },
+            'routes': {
+                'total': len(routes),
+                'details': route_data
+            },
+            'student_allocations': total_allocations
+        }
+
+    # ==================== PLACEMENT STATISTICS ====================
+
+    @api.model
+    def _get_placement_statistics(self):
+        """Get placement module statistics"""
+        PlacementCompany = self.env['placement.company']
+
+        today = fields.Date.today()
+        current_year_start = today.replace(month=4, day=1)
+
+        # Placement drives
+        drives = self._group_counts('placement.drive', [
+            '|',
+            '&',
+            ('drive_date', '>=', today),
+            ('state', '=', 'scheduled'),
+            '&',
+            ('drive_date', '>=', current_year_start),
+            ('state', '=', 'completed'),
+        ], 'state')
+
+        # Companies
+        registered_companies = PlacementCompany.search_count([('active', '=', True)])
+        companies_visited = len(self._group_counts('placement.drive', [
+            ('drive_date', '>=', current_year_start),
+            ('state', 'in', ['ongoing', 'completed'])
+        ], 'company_id'))
+
+        # Applications
+        applications = self._group_counts('placement.application', [
+            ('create_date', '>=', current_year_start)
+        ], 'state')
+
+        # Accepted offers with their average and highest package
+        total_offers, avg_package, highest_package = self._aggregate('placement.offer', [
+            ('offer_date', '>=', current_year_start),
+            ('state', '=', 'accepted')
+        ], ['__count', 'ctc:avg', 'ctc:max'])
+
+        # Placement percentage (final year students)
+        final_year_students = self.env['student.student'].search_count([
+            ('current_semester', 'in', [7, 8]),
+            ('state', '=', 'enrolled')
+        ])
+        placed_students = total_offers
+        placement_percentage = round((placed_students / final_year_students * 100) if final_year_students > 0 else 0, 2)
+
+        return {
+            'drives': {
+                'upcoming': drives.get('scheduled', 0),
+                'completed': drives.get('completed', 0)
+            },
+            'companies': {
+                'registered': registered_companies,
+                'visited_this_year': companies_visited
+            },
+            'applications': {
+                'total': sum(applications.values()),
+                'shortlisted': applications.get('shortlisted', 0)
+            },
+            'offers': {
+                'total': total_offers,
+                'average_package': round(avg_package, 2),
+                'highest_package': highest_package
+            },
+            'placement_stats': {
+                'total_students': final_year_students,
+                'placed': placed_students,
+                'placement_percentage': placement_percentage
+            }
+        }
+
+    # ==================== ATTENDANCE STATISTICS ====================
+
+    @api.model
+    def _get_attendance_statistics(self):
+        """Get overall attendance statistics (Student + Faculty)"""
+        today = fields.Date.today()
+        week_start = today - timedelta(days=6)
+
+        # Last 7 days from the daily rollup, today's figures included
+        Summary = self.env['university.attendance.daily']
+        student_week = Summary.get_daily_totals(week_start, today, member_type='student')
+        faculty_week = Summary.get_daily_totals(week_start, today, member_type='faculty')
+        student_today = student_week.get(today, {})
+        faculty_today = faculty_week.get(today, {})
+
+        # Weekly attendance trend (last 7 days)
+        weekly_trend = []
+        for i in range(6, -1, -1):
+            date = today - timedelta(days=i)
+            weekly_trend.append({
+                'date': date.strftime('%Y-%m-%d'),
+                'day': date.strftime('%a'),
+                'student_present': student_week.get(date, {}).get('present', 0),
+                'faculty_present': faculty_week.get(date, {}).get('present', 0)
+            })
+
+        return {
+            'today': {
+                'student': {
+                    'present': student_today.get('present', 0),
+                    'absent': student_today.get('absent', 0)
+                },
+                'faculty': {
+                    'present': faculty_today.get('present', 0),
+                    'absent': faculty_today.get('absent', 0)
+                }
+            },
+            'weekly_trend': weekly_trend
+        }
+
+    # ==================== RECENT ACTIVITIES ====================
+
+    @api.model
+    def _get_recent_activities(self):
+        """Get recent activities across all modules"""
+        activities = []
+
+        # Recent admissions
+        recent_admissions = self.env['student.admission'].search([
+            ('state', 'in', ['approved', 'admitted']),
+            ('admission_date', '!=', False)
+        ], order='admission_date desc', limit=5)
+
+        for admission in recent_admissions:
+            activities.append({
+                'type': 'admission',
+                'title': f"New Admission: {admission.student_id.name}",
+                'description': f"Admitted to {admission.program_id.name}",
+                'date': admission.admission_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'icon': 'fa-user-plus',
+                'color': 'success'
+            })
+
+        # Recent examinations
+        recent_exams = self.env['examination.examination'].search([
+            ('state', 'in', ['scheduled', 'ongoing'])
+        ], order='start_date desc', limit=3)
+
+        for exam in recent_exams:
+            activities.append({
+                'type': 'examination',
+                'title': f"Exam: {exam.name}",
+                'description': f"Starting on {exam.start_date}",
+                'date': exam.create_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'icon': 'fa-file-text',
+                'color': 'warning'
+            })
+
+        # Recent placements
+        recent_offers = self.env['placement.offer'].search([
+            ('state', '=', 'accepted'),
+            ('offer_date', '!=', False)
+        ], order='offer_date desc', limit=3)
+
+        for offer in recent_offers:
+            activities.append({
+                'type': 'placement',
+                'title': f"Placement: {offer.student_id.name}",
+                'description': f"Placed at {offer.company_id.name}",
+                'date': offer.offer_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'icon': 'fa-briefcase',
+                'color': 'primary'
+            })
+
+        # Sort by date
+        activities.sort(key=lambda x: x['date'], reverse=True)
+
+        return activities[:10]
+
+    # ==================== UPCOMING EVENTS ====================
+
+    @api.model
+    def _get_upcoming_events(self):
+        """Get upcoming events across all modules"""
+        events = []
+        today = fields.Date.today()
+        next_30_days = today + timedelta(days=30)
+
+        # Upcoming exams
+        upcoming_exams = self.env['examination.examination'].search([
+            ('start_date', '>=', today),
+            ('start_date', '<=', next_30_days),
+            ('state', '=', 'scheduled')
+        ], order='start_date asc', limit=5)
+
+        for exam in upcoming_exams:
+            events.append({
+                'type': 'examination',
+                'title': exam.name,
+                'date': exam.start_date.strftime('%Y-%m-%d'),
+                'time': '',
+                'location': '',
+                'icon': 'fa-file-text',
+                'color': 'danger'
+            })
+
+        # Upcoming placement drives
+        upcoming_drives = self.env['placement.drive'].search([
+            ('drive_date', '>=', today),
+            ('drive_date', '<=', next_30_days),
+            ('state', '=', 'scheduled')
+        ], order='drive_date asc', limit=5)
+
+        for drive in upcoming_drives:
+            events.append({
+                'type': 'placement',
+                'title': f"Placement Drive - {drive.company_id.name}",
+                'date': drive.drive_date.strftime('%Y-%m-%d'),
+                'time': '',
+                'location': drive.venue or '',
+                'icon': 'fa-briefcase',
+                'color': 'success'
+            })
+
+        # Upcoming university events, scheduled through their calendar event
+        upcoming_uni_events = self.env['university.event'].search([
+            ('start', '>=', today),
+            ('start', '<', next_30_days + timedelta(days=1)),
+            ('state', 'in', ['published', 'registration_open', 'registration_closed'])
+        ], order='start asc', limit=5)
+
+        for event in upcoming_uni_events:
+            events.append({
+                'type': 'event',
+                'title': event.name,
+                'date': event.start.strftime('%Y-%m-%d'),
+                'time': event.start.strftime('%H:%M'),
+                'location': event.location or '',
+                'icon': 'fa-calendar',
+                'color': 'info'
+            })
+
+        # Sort by date
+        events.sort(key=lambda x: x['date'])
+
+        return events[:10]
+
+    # ==================== ALERTS & NOTIFICATIONS ====================
+
+    @api.model
+    def _get_alerts_notifications(self):
+        """Get system alerts and notifications"""
+        alerts = []
+        today = fields.Date.today()
+
+        # Fee defaulters alert
+        fee_defaulters = self._count_fee_defaulters()
+        if fee_defaulters > 0:
+            alerts.append({
+                'type': 'warning',
+                'title': 'Fee Defaulters',
+                'message': f"{fee_defaulters} students have pending fee payments",
+                'icon': 'fa-exclamation-triangle',
+                'action_url': '/web#model=student.student&view_type=list&filter=fee_defaulters'
+            })
+
+        # Pending admissions
+        pending_admissions = self.env['student.admission'].search_count([
+            ('state', 'in', ['submitted', 'under_review'])
+        ])
+        if pending_admissions > 0:
+            alerts.append({
+                'type': 'info',
+                'title': 'Pending Admissions',
+                'message': f"{pending_admissions} admission applications awaiting approval",
+                'icon': 'fa-user-plus',
+                'action_url': '/web#model=student.admission&view_type=list&filter=pending'
+            })
+
+        # Pending leave requests
+        pending_leaves = self.env['faculty.leave'].search_count([
+            ('state', 'in', ['submitted', 'hod_approved'])
+        ])
+        if pending_leaves > 0:
+            alerts.append({
+                'type': 'info',
+                'title': 'Pending Leave Requests',
+                'message': f"{pending_leaves} faculty leave requests pending approval",
+                'icon': 'fa-calendar-times-o',
+                'action_url': '/web#model=faculty.leave&view_type=list&filter=pending'
+            })
+
+        # Overdue library books
+        overdue_books = self.env['library.issue'].search_count([
+            ('due_date', '<', today),
+            ('state', 'in', ['issued', 'overdue'])
+        ])
+        if overdue_books > 0:
+            alerts.append({
+                'type': 'danger',
+                'title': 'Overdue Library Books',
+                'message': f"{overdue_books} books are overdue for return",
+                'icon': 'fa-book',
+                'action_url': '/web#model=library.issue&view_type=list&filter=overdue'
+            })
+
+        # Upcoming exams (within 7 days)
+        upcoming_exams = self.env['examination.examination'].search_count([
+            ('start_date', '>=', today),
+            ('start_date', '<=', today + timedelta(days=7)),
+            ('state', '=', 'scheduled')
+        ])
+        if upcoming_exams > 0:
+            alerts.append({
+                'type': 'warning',
+                'title': 'Upcoming Examinations',
+                'message': f"{upcoming_exams} exams scheduled in the next 7 days",
+                'icon': 'fa-file-text',
+                'action_url': '/web#model=examination.examination&view_type=calendar'
+            })
+
+        # Hostel complaints pending
+        pending_complaints = self.env['hostel.complaint'].search_count([
+            ('state', 'in', ['new', 'in_progress'])
+        ])
+        if pending_complaints > 10:
+            alerts.append({
+                'type': 'warning',
+                'title': 'Hostel Complaints',
+                'message': f"{pending_complaints} hostel complaints need attention",
+                'icon': 'fa-home',
+                'action_url': '/web#model=hostel.complaint&view_type=list&filter=pending'
+            })
+
+        return alerts
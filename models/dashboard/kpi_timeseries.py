@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.exceptions import ValidationError
+from odoo.tools.sql import table_exists
+from datetime import datetime, timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class DashboardKPIValue(models.Model):
+    """KPI time series, one point per KPI and period
+
+    Points are recorded daily by the snapshot cron and progressively rolled
+    up into weekly then monthly points, so that a year of history is about a
+    hundred rows per KPI. ``sample_count`` keeps rolled up averages weighted.
+    """
+    _name = 'university.dashboard.kpi.value'
+    _description = 'Dashboard KPI Value'
+    _order = 'kpi_id, timestamp'
+
+    kpi_id = fields.Many2one('university.dashboard.kpi', string='KPI', required=True,
+                             ondelete='cascade', readonly=True)
+    timestamp = fields.Datetime(string='Period Start', required=True, readonly=True)
+    resolution = fields.Selection([
+        ('day', 'Daily'),
+        ('week', 'Weekly'),
+        ('month', 'Monthly'),
+    ], string='Resolution', required=True, default='day', readonly=True)
+    value = fields.Float(string='Value', readonly=True)
+    sample_count = fields.Integer(string='Samples', default=1, readonly=True)
+
+    # The unique index on (kpi_id, timestamp, resolution) also serves range scans on (kpi_id, timestamp)
+    _sql_constraints = [
+        ('point_unique', 'UNIQUE(kpi_id, timestamp, resolution)', 'Only one value per KPI and period!'),
+    ]
+
+    # Default age in days after which points are rolled up to the next resolution,
+    # overridable through the ``university_management.kpi_retention.<resolution>`` system parameter
+    _default_retention = {
+        'day': 90,
+        'week': 730,
+    }
+    _next_resolution = {
+        'day': 'week',
+        'week': 'month',
+    }
+
+    def init(self):
+        # Backfill once from the snapshots taken before the time series existed
+        self.env.cr.execute("SELECT 1 FROM university_dashboard_kpi_value LIMIT 1")
+        if not self.env.cr.fetchone() and table_exists(self.env.cr, 'university_dashboard_snapshot'):
+            self._backfill_from_snapshots()
+
+    @api.model
+    def _backfill_from_snapshots(self):
+        """Record the last snapshot of each day as that day's point"""
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (snapshot_date::date) snapshot_date, kpi_data
+            FROM university_dashboard_snapshot
+            WHERE kpi_data IS NOT NULL
+            ORDER BY snapshot_date::date, snapshot_date DESC
+        """)
+        rows = self.env.cr.fetchall()
+        if not rows:
+            return
+
+        self.env.cr.execute("SELECT code, id FROM university_dashboard_kpi")
+        kpi_ids = dict(self.env.cr.fetchall())
+        Snapshot = self.env['university.dashboard.snapshot']
+        for snapshot_date, kpi_data in rows:
+            try:
+                values = Snapshot._decode_kpi_data(kpi_data)
+            except ValueError:
+                continue
+            self._record_values({
+                kpi_ids[code]: value for code, value in values.items()
+                if code in kpi_ids and isinstance(value, (int, float))
+            }, snapshot_date)
+
+    @api.model
+    def _record_values(self, values, timestamp=None):
+        """Store ``{kpi id: value}`` as the daily points of ``timestamp``
+
+        Recording the same day twice keeps the latest value.
+        """
+        if not values:
+            return
+        day = datetime.combine((timestamp or fields.Datetime.now()).date(), datetime.min.time())
+        now = fields.Datetime.now()
+        rows = [(kpi_id, day, 'day', value or 0.0, 1, self.env.uid, now, self.env.uid, now)
+                for kpi_id, value in values.items()]
+        self.env.cr.execute("""
+            INSERT INTO university_dashboard_kpi_value
+                (kpi_id, timestamp, resolution, value, sample_count,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES %s
+            ON CONFLICT (kpi_id, timestamp, resolution) DO UPDATE SET
+                value = EXCLUDED.value,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+        """ % ', '.join(['%s'] * len(rows)), rows)
+        self.invalidate_model()
+
+    # ==================== RETENTION ====================
+
+    @api.model
+    def _get_retention(self, resolution):
+        """Age in days after which points of ``resolution`` are rolled up"""
+        days = self.env['ir.config_parameter'].sudo().get_param(
+            f'university_management.kpi_retention.{resolution}')
+        try:
+            return int(days) if days else self._default_retention[resolution]
+        except ValueError:
+            _logger.warning(f"Invalid KPI retention for resolution {resolution}: {days}")
+            return self._default_retention[resolution]
+
+    @api.model
+    def _downsample(self, resolution, before):
+        """Roll points of ``resolution`` older than ``before`` into the next resolution
+
+        Only whole target periods are rolled up, so a week or month is never
+        split between two resolutions.
+        """
+        target = self._next_resolution[resolution]
+        params = {'source': resolution, 'target': target, 'before': before, 'uid': self.env.uid}
+        self.env.cr.execute("""
+            WITH moved AS (
+                DELETE FROM university_dashboard_kpi_value
+                WHERE resolution = %(source)s
+                  AND date_trunc(%(target)s, timestamp) + ('1 ' || %(target)s)::interval <= %(before)s
+                RETURNING kpi_id, timestamp, value, sample_count
+            )
+            INSERT INTO university_dashboard_kpi_value
+                (kpi_id, timestamp, resolution, value, sample_count,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT kpi_id, date_trunc(%(target)s, timestamp), %(target)s,
+                   SUM(value * sample_count) / SUM(sample_count), SUM(sample_count),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+            FROM moved
+            GROUP BY kpi_id, date_trunc(%(target)s, timestamp)
+            ON CONFLICT (kpi_id, timestamp, resolution) DO UPDATE SET
+                value = (university_dashboard_kpi_value.value * university_dashboard_kpi_value.sample_count
+                         + EXCLUDED.value * EXCLUDED.sample_count)
+                        / (university_dashboard_kpi_value.sample_count + EXCLUDED.sample_count),
+                sample_count = university_dashboard_kpi_value.sample_count + EXCLUDED.sample_count,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+        """, params)
+        moved = self.env.cr.rowcount
+        self.invalidate_model()
+        return moved
+
+    @api.model
+    def cron_downsample_kpi_values(self):
+        """Cron job rolling daily points into weeks and weekly points into months"""
+        now = fields.Datetime.now()
+        for resolution in ('day', 'week'):
+            before = now - timedelta(days=self._get_retention(resolution))
+            moved = self._downsample(resolution, before)
+            _logger.info(f"KPI time series: {moved} {resolution} buckets rolled up")
+
+    # ==================== RANGE QUERIES ====================
+
+    @api.model
+    def _get_bucket(self, date_from, date_to):
+        """Pick the bucket size giving at most a few hundred points for a range"""
+        days = (date_to - date_from).days
+        if days <= 92:
+            return 'day'
+        if days <= 731:
+            return 'week'
+        return 'month'
+
+    @api.model
+    def get_series(self, kpi_id, date_from, date_to=None, bucket='auto'):
+        """Return ``[(period start, value)]`` of a KPI, bucketed in the database
+
+        Values are averaged per bucket, weighted by the number of daily samples
+        each stored point stands for.
+        """
+        date_from = fields.Datetime.to_datetime(date_from)
+        date_to = fields.Datetime.to_datetime(date_to) or fields.Datetime.now()
+        if bucket == 'auto':
+            bucket = self._get_bucket(date_from, date_to)
+        if bucket not in ('day', 'week', 'month'):
+            raise ValidationError(_('Invalid bucket %s, expected day, week, month or auto') % bucket)
+
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT date_trunc(%(bucket)s, timestamp) AS period,
+                   SUM(value * sample_count) / SUM(sample_count)
+            FROM university_dashboard_kpi_value
+            WHERE kpi_id = %(kpi_id)s AND timestamp >= %(date_from)s AND timestamp <= %(date_to)s
+            GROUP BY period
+            ORDER BY period
+        """, {'bucket': bucket, 'kpi_id': kpi_id, 'date_from': date_from, 'date_to': date_to})
+        return bucket, self.env.cr.fetchall()
@@ -1,13 +1,68 @@
 # -*- coding: utf-8 -*-
-from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError, UserError
-from datetime import datetime, timedelta
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import AccessError, ValidationError, UserError
+from odoo.tools import SQL
+from odoo.tools.safe_eval import safe_eval, datetime as safe_datetime, dateutil as safe_dateutil, time as safe_time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import ast
+import csv
+import io
 import json
 import logging
+import re
+import tempfile
 
 _logger = logging.getLogger(__name__)
 
 
+class DashboardDomainMixin(models.AbstractModel):
+    """Parse the ``domain`` of widgets and KPIs once instead of on every render"""
+    _name = 'university.dashboard.domain.mixin'
+    _description = 'Dashboard Domain Mixin'
+
+    def write(self, vals):
+        result = super().write(vals)
+        if 'domain' in vals:
+            self.env.registry.clear_cache()
+        return result
+
+    def _get_domain(self):
+        """Return ``domain`` as a list
+
+        Literal domains are parsed once per record version and cached; domains
+        using ``uid``, ``context_today()`` and the like are evaluated with
+        ``safe_eval`` on each call since their value changes over time.
+        """
+        self.ensure_one()
+        domain = self._parse_literal_domain(self.id, self.write_date, self.domain or '[]')
+        if domain is None:
+            return safe_eval(self.domain, self._get_domain_eval_context())
+        return list(domain)
+
+    @api.model
+    @tools.ormcache('record_id', 'write_date')
+    def _parse_literal_domain(self, record_id, write_date, domain):
+        try:
+            return tuple(ast.literal_eval(domain))
+        except (ValueError, TypeError, SyntaxError):
+            return None
+
+    def _get_domain_eval_context(self):
+        return {
+            'uid': self.env.uid,
+            'user': self.env.user,
+            'context_today': lambda: fields.Date.context_today(self),
+            'datetime': safe_datetime,
+            'dateutil': safe_dateutil,
+            'relativedelta': safe_dateutil.relativedelta.relativedelta,
+            'time': safe_time,
+        }
+
+
 class UniversityDashboard(models.Model):
     """Main Dashboard Configuration"""
     _name = 'university.dashboard'
@@ -73,11 +128,8 @@ class UniversityDashboard(models.Model):
         if not dashboard:
             return {'error': 'Dashboard not found'}
 
-            # Get widget data
-        widgets_data = []
-        for widget in dashboard.widget_ids.filtered(lambda w: w.active):
-            widget_data = widget.get_widget_data()
-            widgets_data.append(widget_data)
+        # Get widget data
+        widgets_data = dashboard.widget_ids.filtered(lambda w: w.active)._get_widgets_data()
 
         return {
             'dashboard': {
@@ -92,6 +144,7 @@ class UniversityDashboard(models.Model):
 class DashboardWidget(models.Model):
     """Dashboard Widgets"""
     _name = 'university.dashboard.widget'
+    _inherit = ['university.dashboard.domain.mixin']
     _description = 'Dashboard Widget'
     _order = 'sequence, name'
 
@@ -144,8 +197,17 @@ class DashboardWidget(models.Model):
     # Permissions
     group_ids = fields.Many2many('res.groups', string='Visible to Groups')
 
-    def get_widget_data(self):
-        """Get widget data"""
+    def get_widget_data(self, offset=0, limit=None):
+        """Get widget data, ``offset``/``limit`` paginate table and list widgets"""
+        self.ensure_one()
+        return self._get_widgets_data(offset=offset, limit=limit)[0]
+
+    def _get_widgets_data(self, offset=0, limit=None):
+        """Get the data of several widgets, counting KPI widgets per model in one query"""
+        kpi_counts = self._get_kpi_counts()
+        return [widget._build_widget_data(kpi_counts, offset, limit) for widget in self]
+
+    def _build_widget_data(self, kpi_counts, offset=0, limit=None):
         self.ensure_one()
 
         data = {
@@ -171,24 +233,58 @@ class DashboardWidget(models.Model):
                 _logger.error(f"Error getting widget data for {self.name}: {str(e)}")
                 data['data'] = {'error': str(e)}
         elif self.widget_type in ['kpi', 'counter']:
-            data['data'] = self._get_kpi_data()
+            if self.id in kpi_counts:
+                data['data'] = {'value': kpi_counts[self.id], 'label': self.name}
+            else:
+                data['data'] = self._get_kpi_data()
         elif self.widget_type in ['chart', 'bar', 'line', 'pie', 'donut']:
             data['data'] = self._get_chart_data()
         elif self.widget_type == 'table':
-            data['data'] = self._get_table_data()
+            data['data'] = self._get_table_data(offset, limit)
         elif self.widget_type == 'list':
-            data['data'] = self._get_list_data()
+            data['data'] = self._get_list_data(offset, limit)
 
         return data
 
+    def _get_kpi_counts(self):
+        """Return ``{widget id: count}`` for the KPI and counter widgets of ``self``
+
+        The counts of all widgets targeting one model are selected side by side
+        in a single statement. Widgets whose model fails are left out and fall
+        back to ``_get_kpi_data``, which reports the error.
+        """
+        widgets_by_model = defaultdict(list)
+        for widget in self:
+            if (not widget.data_method and widget.widget_type in ('kpi', 'counter')
+                    and widget.model_name in self.env):
+                widgets_by_model[widget.model_name].append(widget)
+
+        counts = {}
+        for model_name, widgets in widgets_by_model.items():
+            Model = self.env[model_name]
+            try:
+                with self.env.cr.savepoint():
+                    domains = {widget.id: widget._get_domain() for widget in widgets}
+                    # Widgets sharing a domain share a column
+                    columns = list({repr(domain): domain for domain in domains.values()}.items())
+                    [row] = self.env.execute_query(SQL("SELECT %s", SQL(", ").join(
+                        SQL("(%s)", Model._search(domain).select(SQL("COUNT(*)")))
+                        for key, domain in columns
+                    )))
+                positions = {key: index for index, (key, domain) in enumerate(columns)}
+                for widget_id, domain in domains.items():
+                    counts[widget_id] = row[positions[repr(domain)]]
+            except Exception as e:
+                _logger.error(f"Error counting {model_name} widgets: {str(e)}")
+        return counts
+
     def _get_kpi_data(self):
         """Get KPI data"""
         if not self.model_name:
             return {}
 
         try:
-            domain = eval(self.domain or '[]')
-            count = self.env[self.model_name].search_count(domain)
+            count = self.env[self.model_name].search_count(self._get_domain())
             return {
                 'value': count,
                 'label': self.name,
@@ -197,33 +293,200 @@ class DashboardWidget(models.Model):
             _logger.error(f"Error calculating KPI: {str(e)}")
             return {'value': 0, 'label': self.name, 'error': str(e)}
 
+    # ==================== DECLARATIVE WIDGETS ====================
+    #
+    # Chart, table and list widgets are driven by their JSON ``config``:
+    #   groupby      field or list of fields, with an optional granularity
+    #                for dates ("admission_date:month"); charts use the first
+    #                one for labels and the second one for datasets
+    #   measure      field to aggregate, rows are counted when omitted
+    #   aggregation  sum, avg, min, max or count (default sum)
+    #   fields       columns of ungrouped tables and lists
+    #   order        ``_read_group``/``search`` order
+    #   limit        groups of a chart, rows per page of a table or list
+
+    _date_label_formats = {
+        'day': '%d %b %Y',
+        'week': 'W%V %G',
+        'month': '%b %Y',
+        'year': '%Y',
+    }
+
+    @api.constrains('config')
+    def _check_config(self):
+        for widget in self:
+            widget._get_widget_config()
+
+    def _get_widget_config(self):
+        """Return the JSON configuration as a dict"""
+        self.ensure_one()
+        try:
+            config = json.loads(self.config or '{}')
+        except ValueError:
+            raise ValidationError(_('Widget %s has an invalid JSON configuration') % self.name)
+        if not isinstance(config, dict):
+            raise ValidationError(_('Widget %s configuration must be a JSON object') % self.name)
+        return config
+
+    def _get_config_fields(self, Model, specs):
+        """Check the field names of ``specs`` against ``Model`` and return ``[(spec, field)]``"""
+        if isinstance(specs, str):
+            specs = [specs]
+        result = []
+        for spec in specs or []:
+            field = Model._fields.get(spec.split(':')[0])
+            if not field:
+                raise ValidationError(_('Field %s does not exist on %s') % (spec, Model._name))
+            result.append((spec, field))
+        return result
+
+    def _get_config_aggregate(self, Model, config):
+        """Return the ``_read_group`` aggregate and the label of the measure"""
+        measure = config.get('measure')
+        aggregation = config.get('aggregation', 'sum')
+        if not measure or aggregation == 'count':
+            return '__count', _('Count')
+        if aggregation not in ('sum', 'avg', 'min', 'max'):
+            raise ValidationError(_('Invalid aggregation %s') % aggregation)
+        [(spec, field)] = self._get_config_fields(Model, measure)
+        return f'{measure}:{aggregation}', field.string
+
+    def _format_value(self, field, value, granularity=None):
+        """Return a JSON friendly label for a grouped or fetched field value"""
+        if isinstance(value, models.BaseModel):
+            return ', '.join(value.mapped('display_name')) if value else _('None')
+        if value is False or value is None:
+            return _('None') if granularity is not None else False
+        if field.type == 'selection':
+            return dict(field._description_selection(self.env)).get(value, value)
+        if field.type in ('date', 'datetime'):
+            if granularity in self._date_label_formats:
+                return value.strftime(self._date_label_formats[granularity])
+            if granularity == 'quarter':
+                return f'Q{(value.month - 1) // 3 + 1} {value.year}'
+            return value.isoformat()
+        return value
+
+    def _format_group(self, groupby, values):
+        labels = []
+        for (spec, field), value in zip(groupby, values):
+            # Dates grouped without granularity are grouped by month
+            granularity = spec.partition(':')[2] or ('month' if field.type in ('date', 'datetime') else '')
+            labels.append(self._format_value(field, value, granularity))
+        return labels
+
     def _get_chart_data(self):
-        """Get chart data"""
-        # Placeholder - implement based on specific requirements
-        return {
-            'labels': [],
-            'datasets': [],
-        }
+        """Get chart data with one ``_read_group`` over one or two group-bys"""
+        try:
+            config = self._get_widget_config()
+            if not self.model_name or not config.get('groupby'):
+                return {'labels': [], 'datasets': []}
+
+            Model = self.env[self.model_name]
+            groupby = self._get_config_fields(Model, config['groupby'])[:2]
+            aggregate, measure_label = self._get_config_aggregate(Model, config)
+            groups = Model._read_group(
+                self._get_domain(), [spec for spec, field in groupby], [aggregate],
+                order=config.get('order'),
+                # Limiting pairs of a two-level chart would cut series arbitrarily
+                limit=config.get('limit') if len(groupby) == 1 else None,
+            )
+
+            if len(groupby) == 1:
+                return {
+                    'labels': [self._format_group(groupby, group[:1])[0] for group in groups],
+                    'datasets': [{'label': measure_label, 'data': [group[1] or 0 for group in groups]}],
+                }
+
+            labels, series = {}, defaultdict(dict)
+            for key, serie, value in groups:
+                label, serie_label = self._format_group(groupby, (key, serie))
+                labels.setdefault(label, None)
+                series[serie_label][label] = value or 0
+            return {
+                'labels': list(labels),
+                'datasets': [
+                    {'label': serie_label, 'data': [values.get(label, 0) for label in labels]}
+                    for serie_label, values in series.items()
+                ],
+            }
+        except Exception as e:
+            _logger.error(f"Error getting chart data for {self.name}: {str(e)}")
+            return {'labels': [], 'datasets': [], 'error': str(e)}
 
-    def _get_table_data(self):
-        """Get table data"""
-        # Placeholder - implement based on specific requirements
-        return {
-            'headers': [],
-            'rows': [],
-        }
+    def _get_table_data(self, offset=0, limit=None):
+        """Get one page of table data, grouped rows when ``groupby`` is configured"""
+        try:
+            config = self._get_widget_config()
+            if not self.model_name:
+                return {'headers': [], 'rows': []}
+
+            Model = self.env[self.model_name]
+            limit = limit or config.get('limit') or 20
+            domain = self._get_domain()
+
+            if config.get('groupby'):
+                groupby = self._get_config_fields(Model, config['groupby'])
+                aggregate, measure_label = self._get_config_aggregate(Model, config)
+                # One extra group tells whether there is a next page
+                groups = Model._read_group(domain, [spec for spec, field in groupby], [aggregate],
+                                           offset=offset, limit=limit + 1, order=config.get('order'))
+                headers = [field.string for spec, field in groupby] + [measure_label]
+                rows = [self._format_group(groupby, group[:-1]) + [group[-1] or 0] for group in groups[:limit]]
+                has_more = len(groups) > limit
+            else:
+                columns = self._get_config_fields(Model, config.get('fields') or ['display_name'])
+                records = Model.search_fetch(domain, [spec for spec, field in columns],
+                                             offset=offset, limit=limit + 1, order=config.get('order'))
+                headers = [field.string for spec, field in columns]
+                rows = [
+                    [self._format_value(field, record[spec]) for spec, field in columns]
+                    for record in records[:limit]
+                ]
+                has_more = len(records) > limit
 
-    def _get_list_data(self):
-        """Get list data"""
-        # Placeholder - implement based on specific requirements
-        return {
-            'items': [],
-        }
+            return {
+                'headers': headers,
+                'rows': rows,
+                'offset': offset,
+                'limit': limit,
+                'has_more': has_more,
+            }
+        except Exception as e:
+            _logger.error(f"Error getting table data for {self.name}: {str(e)}")
+            return {'headers': [], 'rows': [], 'error': str(e)}
+
+    def _get_list_data(self, offset=0, limit=None):
+        """Get one page of list items"""
+        try:
+            config = self._get_widget_config()
+            if not self.model_name:
+                return {'items': []}
+
+            Model = self.env[self.model_name]
+            limit = limit or config.get('limit') or 10
+            columns = self._get_config_fields(Model, config.get('fields') or [])
+            records = Model.search_fetch(self._get_domain(), ['display_name'] + [spec for spec, field in columns],
+                                         offset=offset, limit=limit + 1, order=config.get('order'))
+            return {
+                'items': [{
+                    'id': record.id,
+                    'name': record.display_name,
+                    'fields': {spec: self._format_value(field, record[spec]) for spec, field in columns},
+                } for record in records[:limit]],
+                'offset': offset,
+                'limit': limit,
+                'has_more': len(records) > limit,
+            }
+        except Exception as e:
+            _logger.error(f"Error getting list data for {self.name}: {str(e)}")
+            return {'items': [], 'error': str(e)}
 
 
 class DashboardKPI(models.Model):
     """Dashboard KPI Definitions"""
     _name = 'university.dashboard.kpi'
+    _inherit = ['university.dashboard.domain.mixin']
     _description = 'Dashboard KPI'
     _order = 'sequence, name'
 
@@ -279,44 +542,135 @@ class DashboardKPI(models.Model):
         ('code_unique', 'UNIQUE(code)', 'KPI code must be unique!'),
     ]
 
-    def calculate_kpi(self):
-        """Calculate KPI value"""
+    # Definition fields whose change makes the stored value stale
+    _kpi_definition_fields = ['model_name', 'domain', 'field_name', 'aggregation']
+
+    def write(self, vals):
+        if set(self._kpi_definition_fields) & set(vals):
+            vals = dict(vals, last_calculated=False)
+        return super().write(vals)
+
+    def _is_cache_fresh(self):
+        """Whether ``last_value`` is still inside the cache window"""
         self.ensure_one()
+        if not self.last_calculated or self.cache_duration <= 0:
+            return False
+        return self.last_calculated + timedelta(minutes=self.cache_duration) > fields.Datetime.now()
 
-        try:
-            if not self.model_name:
-                return 0.0
-
-            domain = eval(self.domain or '[]')
-            records = self.env[self.model_name].search(domain)
-
-            if self.aggregation == 'count':
-                value = len(records)
-            elif self.aggregation == 'sum' and self.field_name:
-                value = sum(records.mapped(self.field_name))
-            elif self.aggregation == 'avg' and self.field_name:
-                values = records.mapped(self.field_name)
-                value = sum(values) / len(values) if values else 0.0
-            elif self.aggregation == 'min' and self.field_name:
-                values = records.mapped(self.field_name)
-                value = min(values) if values else 0.0
-            elif self.aggregation == 'max' and self.field_name:
-                values = records.mapped(self.field_name)
-                value = max(values) if values else 0.0
+    def calculate_kpi(self, force=False):
+        """Calculate KPI value
+
+        Within ``cache_duration`` the stored value is returned without querying
+        the target model; otherwise the aggregate is computed in the database.
+        """
+        self.ensure_one()
+        return self._evaluate_kpis(force=force).get(self.id, 0.0)
+
+    def _evaluate_kpis(self, force=False):
+        """Evaluate every KPI of ``self`` once and return ``{kpi id: value}``
+
+        KPIs inside their cache window keep their stored value. The others are
+        grouped per model, and KPIs sharing a model and a domain are computed
+        by a single ``_read_group``. With more than one worker configured in
+        ``university_management.kpi_workers``, models are evaluated
+        concurrently on separate cursors, which only see committed data.
+        """
+        values = {}
+        batches = {}
+        for kpi in self:
+            if not force and kpi._is_cache_fresh():
+                values[kpi.id] = kpi.last_value
+            elif not kpi.model_name or kpi.model_name not in self.env:
+                values[kpi.id] = 0.0
             else:
-                value = 0.0
+                batches.setdefault(kpi.model_name, []).append(kpi.id)
 
-                # Update cache
-            self.write({
-                'last_calculated': fields.Datetime.now(),
-                'last_value': value,
-            })
+        workers = self._get_kpi_workers()
+        if workers > 1 and len(batches) > 1:
+            computed = self._compute_kpi_values_concurrently(list(batches.values()), workers)
+        else:
+            computed = {}
+            for kpi_ids in batches.values():
+                computed.update(self.browse(kpi_ids)._compute_kpi_values())
 
-            return value
+        # Update cache
+        now = fields.Datetime.now()
+        for kpi in self.browse(list(computed)):
+            kpi.write({'last_calculated': now, 'last_value': computed[kpi.id]})
 
-        except Exception as e:
-            _logger.error(f"Error calculating KPI {self.name}: {str(e)}")
-            return 0.0
+        values.update(computed)
+        # KPIs whose computation failed keep their stored value but report 0
+        return {kpi.id: values.get(kpi.id, 0.0) for kpi in self}
+
+    @api.model
+    def _get_kpi_workers(self):
+        workers = self.env['ir.config_parameter'].sudo().get_param('university_management.kpi_workers', '1')
+        try:
+            return max(int(workers), 1)
+        except ValueError:
+            _logger.warning(f"Invalid KPI worker count: {workers}")
+            return 1
+
+    def _compute_kpi_values_concurrently(self, batches, workers):
+        """Run ``_compute_kpi_values`` for each batch of KPI ids in a thread pool"""
+        registry, uid, context = self.env.registry, self.env.uid, self.env.context
+
+        def compute(kpi_ids):
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                return env[self._name].browse(kpi_ids)._compute_kpi_values()
+
+        values = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(compute, batches):
+                values.update(result)
+        return values
+
+    def _compute_kpi_values(self):
+        """Aggregate KPIs of one model, one ``_read_group`` per distinct domain"""
+        by_domain = {}
+        for kpi in self:
+            by_domain.setdefault(kpi.domain or '[]', []).append(kpi)
+
+        values = {}
+        Summary = self.env['university.attendance.daily']
+        for domain, kpis in by_domain.items():
+            try:
+                # Attendance counts come from the daily rollup when their domain allows it
+                if any(kpi.aggregation == 'count' for kpi in kpis):
+                    count = Summary._count_attendance(kpis[0].model_name, kpis[0]._get_domain())
+                    if count is not None:
+                        values.update({kpi.id: float(count) for kpi in kpis if kpi.aggregation == 'count'})
+                        kpis = [kpi for kpi in kpis if kpi.aggregation != 'count']
+                        if not kpis:
+                            continue
+                with self.env.cr.savepoint():
+                    Model = self.env[kpis[0].model_name]
+                    aggregates = {kpi.id: kpi._get_kpi_aggregate(Model) for kpi in kpis}
+                    columns = list(dict.fromkeys(spec for spec in aggregates.values() if spec))
+                    row = Model._read_group(kpis[0]._get_domain(), [], columns)[0] if columns else ()
+                    results = dict(zip(columns, row))
+                for kpi in kpis:
+                    values[kpi.id] = float(results.get(aggregates[kpi.id]) or 0.0)
+            except Exception as e:
+                _logger.error(f"Error calculating KPIs {', '.join(kpi.name for kpi in kpis)}: {str(e)}")
+        return values
+
+    def _get_kpi_aggregate(self, Model):
+        """``_read_group`` aggregate computing this KPI, or None when it has none"""
+        self.ensure_one()
+        if self.aggregation == 'count':
+            return '__count'
+        if self.aggregation not in ('sum', 'avg', 'min', 'max') or not self.field_name:
+            return None
+
+        field = Model._fields.get(self.field_name)
+        if not field:
+            raise ValidationError(_('Field %s does not exist on %s') % (self.field_name, self.model_name))
+        if not field.store:
+            raise ValidationError(_('Field %s of %s is not stored and cannot be aggregated')
+                                  % (self.field_name, self.model_name))
+        return f'{self.field_name}:{self.aggregation}'
 
     def get_kpi_status(self):
         """Get KPI status (success/warning/critical)"""
@@ -337,9 +691,7 @@ class DashboardKPI(models.Model):
     @api.model
     def cron_calculate_all_kpis(self):
         """Cron job to calculate all active KPIs"""
-        kpis = self.search([('active', '=', True)])
-        for kpi in kpis:
-            kpi.calculate_kpi()
+        self.search([('active', '=', True)])._evaluate_kpis(force=True)
 
 
 class DashboardUserPreference(models.Model):
@@ -381,7 +733,20 @@ class DashboardUserPreference(models.Model):
 
 
 class DashboardAnalytics(models.Model):
-    """Dashboard Analytics and Reports"""
+    """Dashboard Analytics and Reports
+
+    Analytics are either a custom SQL ``query`` or a ``_read_group`` over
+    ``model_name``. Queries take named parameters, ``%(date_from)s``,
+    ``%(date_to)s`` and any filter key such as ``%(program_id)s``, which are
+    always bound, never formatted; literal ``%`` signs must be doubled. Both
+    kinds run on a separate read-only cursor under ``query_timeout`` and their
+    results are cached per set of parameters and user context.
+
+    Access is denied by default: only internal users may run analytics, SQL
+    analytics are reserved to university administrators, and other analytics
+    need one of ``group_ids``, or ``is_public`` to open them to every
+    internal user.
+    """
     _name = 'university.dashboard.analytics'
     _description = 'Dashboard Analytics'
 
@@ -402,6 +767,23 @@ class DashboardAnalytics(models.Model):
     # Data Configuration
     model_name = fields.Char(string='Model Name')
     query = fields.Text(string='SQL Query', help='Custom SQL query for complex analytics')
+    groupby = fields.Char(string='Group By', help='Comma separated fields of the model, e.g. program_id,payment_date:month')
+    measure_field = fields.Char(string='Measure Field')
+    aggregation = fields.Selection([
+        ('count', 'Count'),
+        ('sum', 'Sum'),
+        ('avg', 'Average'),
+        ('min', 'Minimum'),
+        ('max', 'Maximum'),
+    ], string='Aggregation Method', default='count')
+    date_field = fields.Char(string='Date Field', help='Field of the model restricted by the date range')
+
+    # Execution
+    query_timeout = fields.Integer(string='Query Timeout (seconds)', default=30)
+    cache_duration = fields.Integer(string='Cache Duration (minutes)', default=30)
+    depends_on = fields.Char(string='Depends On Models',
+                             help='Comma separated models whose changes invalidate cached results, '
+                                  'e.g. fee.payment,student.student')
 
     # Visualization
     chart_type = fields.Selection([
@@ -425,36 +807,220 @@ class DashboardAnalytics(models.Model):
         ('code_unique', 'UNIQUE(code)', 'Analytics code must be unique!'),
     ]
 
+    # Largest result returned as JSON, complete results go through the CSV export
+    _max_rows = 5000
+
+    # Fields whose change makes cached results stale
+    _analytics_definition_fields = [
+        'model_name', 'query', 'groupby', 'measure_field', 'aggregation', 'date_field',
+    ]
+
+    @api.constrains('query')
+    def _check_query(self):
+        for analytics in self.filtered('query'):
+            statement = analytics._get_statement()
+            if not re.match(r'(?i)(select|with)\b', statement) or ';' in statement:
+                raise ValidationError(_('Analytics %s: the query must be a single SELECT statement') % analytics.name)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        if set(self._analytics_definition_fields) & set(vals):
+            self.env['university.dashboard.analytics.cache'].sudo().search([('analytics_id', 'in', self.ids)]).unlink()
+        if 'depends_on' in vals:
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
+    @api.model
+    @tools.ormcache('model_name')
+    def _get_dependent_analytics(self, model_name):
+        """Ids of the analytics whose cached results depend on ``model_name``"""
+        analytics = self.sudo().with_context(active_test=False).search([('depends_on', '!=', False)])
+        return tuple(
+            record.id for record in analytics
+            if model_name in {name.strip() for name in record.depends_on.split(',')}
+        )
+
+    def _can_run(self, user):
+        """Whether ``user`` may run the analytics, denied unless explicitly granted"""
+        self.ensure_one()
+        if not user.has_group('base.group_user'):
+            return False
+        if user.has_group('university_management.group_university_admin'):
+            return True
+        if self.query:
+            return False
+        return self.is_public or bool(user.groups_id & self.group_ids)
+
+    def _check_run_access(self):
+        if not self._can_run(self.env.user):
+            raise AccessError(_('You are not allowed to run the analytics %s') % self.name)
+
     def get_analytics_data(self, date_from=None, date_to=None, filters=None):
-        """Get analytics data"""
+        """Get analytics data, served from the cache while it is fresh"""
         self.ensure_one()
+        self._check_run_access()
+
+        params = self._get_query_params(date_from, date_to, filters)
+        Cache = self.env['university.dashboard.analytics.cache'].sudo()
+        key = Cache._get_key(params)
+        data = Cache._get_payload(self, key)
+        if data is None:
+            if self.query:
+                # Execute custom SQL query
+                data = self._execute_custom_query(params)
+            else:
+                # Use model-based approach
+                data = self._get_model_analytics(params)
+            data = Cache._store_payload(self, key, data)
+        return data
 
-        if self.query:
-            # Execute custom SQL query
-            return self._execute_custom_query(date_from, date_to, filters)
-        else:
-            # Use model-based approach
-            return self._get_model_analytics(date_from, date_to, filters)
+    def _get_statement(self):
+        return (self.query or '').strip().rstrip(';').strip()
+
+    def _get_query_params(self, date_from, date_to, filters):
+        """Return the bound parameters of a run, restricted to the ones the analytics uses"""
+        params = {}
+        for key, value in (filters or {}).items():
+            if isinstance(value, (list, tuple)):
+                value = tuple(value)
+            elif not isinstance(value, (str, int, float, bool)) and value is not None:
+                raise ValidationError(_('Invalid value for analytics filter %s') % key)
+            params[key] = value
+        params['date_from'] = date_from
+        params['date_to'] = date_to
 
-    def _execute_custom_query(self, date_from, date_to, filters):
+        if self.query:
+            names = set(re.findall(r'%\((\w+)\)s', self.query))
+            return {name: params.get(name) for name in names}
+        return params
+
+    @contextmanager
+    def _readonly_env(self):
+        """Environment on a new read-only cursor bounded by ``query_timeout``"""
+        with self.env.registry.cursor() as cr:
+            cr.execute("SET TRANSACTION READ ONLY")
+            cr.execute("SET LOCAL statement_timeout = %s", [max(self.query_timeout, 1) * 1000])
+            yield api.Environment(cr, self.env.uid, self.env.context)
+
+    def _execute_custom_query(self, params):
         """Execute custom SQL query"""
-        # Implement custom query execution with proper sanitization
-        return {}
+        with self._readonly_env() as env:
+            env.cr.execute(self._get_statement(), params)
+            columns = [column.name for column in env.cr.description]
+            rows = env.cr.fetchmany(self._max_rows + 1)
+        return self._format_result(columns, rows)
+
+    def _get_model_analytics(self, params, limit=_max_rows):
+        """Get analytics from model with one ``_read_group``"""
+        if not self.model_name or not self.groupby:
+            return self._format_result([], [])
+
+        with self._readonly_env() as env:
+            Model = env[self.model_name]
+            Widget = env['university.dashboard.widget']
+            groupby = Widget._get_config_fields(Model, [spec.strip() for spec in self.groupby.split(',')])
+            aggregate, measure_label = Widget._get_config_aggregate(Model, {
+                'measure': self.measure_field,
+                'aggregation': self.aggregation,
+            })
+            groups = Model._read_group(
+                self._get_model_domain(Model, params), [spec for spec, field in groupby], [aggregate],
+                limit=limit + 1 if limit else None,
+            )
+            columns = [field.string for spec, field in groupby] + [measure_label]
+            rows = [Widget._format_group(groupby, group[:-1]) + [group[-1] or 0] for group in groups]
+        return self._format_result(columns, rows, limit)
+
+    def _get_model_domain(self, Model, params):
+        domain = []
+        for key, value in params.items():
+            if key in ('date_from', 'date_to'):
+                if value and self.date_field:
+                    domain.append((self.date_field, '>=' if key == 'date_from' else '<=', value))
+                continue
+            if key not in Model._fields:
+                raise ValidationError(_('Invalid filter %s for %s') % (key, Model._name))
+            domain.append((key, 'in' if isinstance(value, tuple) else '=', value))
+        return domain
+
+    def _format_result(self, columns, rows, limit=_max_rows):
+        """Columns, rows and chart datasets, the first column giving the labels"""
+        truncated = bool(limit) and len(rows) > limit
+        rows = [[self._json_value(value) for value in row] for row in rows[:limit or None]]
+        return {
+            'columns': columns,
+            'rows': rows,
+            'labels': [str(row[0]) for row in rows] if columns else [],
+            'datasets': [
+                {'label': column, 'data': [row[index] for row in rows]}
+                for index, column in enumerate(columns[1:], 1)
+            ],
+            'truncated': truncated,
+        }
+
+    @api.model
+    def _json_value(self, value):
+        if isinstance(value, Decimal):
+            return float(value)
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        return value
+
+    # ==================== EXPORT ====================
 
-    def _get_model_analytics(self, date_from, date_to, filters):
-        """Get analytics from model"""
-        # Implement model-based analytics
-        return {}
+    def export_csv(self, date_from=None, date_to=None, filters=None):
+        """Write the complete result as CSV into a temporary file, rewound for reading
+
+        SQL analytics are streamed by PostgreSQL with ``COPY`` so that the
+        result set is never held in memory.
+        """
+        self.ensure_one()
+        self._check_run_access()
+        params = self._get_query_params(date_from, date_to, filters)
+        output = tempfile.TemporaryFile()
+
+        if self.query:
+            with self._readonly_env() as env:
+                statement = env.cr.mogrify(self._get_statement(), params).decode()
+                env.cr.copy_expert(f"COPY ({statement}) TO STDOUT WITH (FORMAT csv, HEADER)", output)
+        else:
+            data = self._get_model_analytics(params, limit=None)
+            text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+            writer = csv.writer(text)
+            writer.writerow(data['columns'])
+            writer.writerows(data['rows'])
+            # Detach so that the wrapper does not close the file once collected
+            text.flush()
+            text.detach()
+
+        output.seek(0)
+        return output
 
 
 class DashboardSnapshot(models.Model):
-    """Dashboard Snapshots for Historical Data"""
+    """Dashboard Snapshots for Historical Data
+
+    ``kpi_data`` is stored column-wise, ``{"codes": [...], "values": [...]}``,
+    so that trend queries decode one short list per snapshot. Snapshots taken
+    before this format map each code to ``{"name", "value", "unit"}``.
+    """
     _name = 'university.dashboard.snapshot'
     _description = 'Dashboard Snapshot'
     _order = 'snapshot_date desc'
 
     name = fields.Char(string='Snapshot Name', required=True)
-    snapshot_date = fields.Datetime(string='Snapshot Date', required=True, default=fields.Datetime.now)
+    snapshot_date = fields.Datetime(string='Snapshot Date', required=True, default=fields.Datetime.now, index=True)
     dashboard_id = fields.Many2one('university.dashboard', string='Dashboard')
 
     # Snapshot Data
@@ -466,39 +1032,86 @@ class DashboardSnapshot(models.Model):
     notes = fields.Text(string='Notes')
 
     @api.model
-    def create_snapshot(self, dashboard_id):
+    def create_snapshot(self, dashboard_id, name=None):
         """Create a snapshot of current dashboard state"""
         dashboard = self.env['university.dashboard'].browse(dashboard_id)
 
         if not dashboard.exists():
             raise ValidationError(_('Dashboard not found'))
 
-            # Collect KPI data
-        kpis = self.env['university.dashboard.kpi'].search([('active', '=', True)])
-        kpi_data = {}
-        for kpi in kpis:
-            kpi_data[kpi.code] = {
-                'name': kpi.name,
-                'value': kpi.calculate_kpi(),
-                'unit': kpi.unit,
-            }
+        return self._create_snapshots(dashboard, self._collect_kpi_data(), name=name)
 
-            # Create snapshot
-        snapshot = self.create({
-            'name': f'{dashboard.name} - {fields.Datetime.now()}',
-            'dashboard_id': dashboard_id,
-            'kpi_data': json.dumps(kpi_data),
-            'snapshot_date': fields.Datetime.now(),
-        })
+    @api.model
+    def _collect_kpi_data(self):
+        """Evaluate every active KPI once, record it in the time series and return the columnar payload"""
+        kpis = self.env['university.dashboard.kpi'].search([('active', '=', True)])
+        values = kpis._evaluate_kpis()
+        self.env['university.dashboard.kpi.value']._record_values(values)
+        return json.dumps({
+            'codes': kpis.mapped('code'),
+            'values': [values[kpi.id] for kpi in kpis],
+        }, separators=(',', ':'))
 
-        return snapshot
+    @api.model
+    def _create_snapshots(self, dashboards, kpi_data, name=None):
+        now = fields.Datetime.now()
+        return self.create([{
+            'name': name or f'{dashboard.name} - {now}',
+            'dashboard_id': dashboard.id,
+            'kpi_data': kpi_data,
+            'snapshot_date': now,
+        } for dashboard in dashboards])
 
     @api.model
     def cron_create_daily_snapshots(self):
-        """Cron job to create daily snapshots"""
+        """Cron job to create daily snapshots
+
+        KPI values do not depend on the dashboard, so they are evaluated once
+        and shared by the snapshots of every active dashboard.
+        """
         dashboards = self.env['university.dashboard'].search([('active', '=', True)])
-        for dashboard in dashboards:
-            self.create_snapshot(dashboard.id)
+        if dashboards:
+            self._create_snapshots(dashboards, self._collect_kpi_data())
+
+    # ==================== HISTORY ====================
+
+    @api.model
+    def _decode_kpi_data(self, kpi_data):
+        """Return ``{code: value}`` from a stored ``kpi_data`` payload"""
+        data = json.loads(kpi_data or '{}')
+        if 'codes' in data:
+            return dict(zip(data['codes'], data['values']))
+        return {code: item.get('value') for code, item in data.items()}
+
+    @api.model
+    def get_kpi_history(self, codes=None, date_from=None, date_to=None, dashboard_id=None):
+        """Return ``{'dates': [...], 'series': {code: [...]}}`` ordered by date
+
+        Snapshots of one run share their date and values, so each date is
+        reported once unless ``dashboard_id`` narrows the history already.
+        """
+        domain = []
+        if dashboard_id:
+            domain.append(('dashboard_id', '=', dashboard_id))
+        if date_from:
+            domain.append(('snapshot_date', '>=', date_from))
+        if date_to:
+            domain.append(('snapshot_date', '<=', date_to))
+
+        dates = []
+        series = {code: [] for code in codes or []}
+        for snapshot in self.search_fetch(domain, ['snapshot_date', 'kpi_data'], order='snapshot_date'):
+            if dates and dates[-1] == snapshot.snapshot_date:
+                continue
+            values = self._decode_kpi_data(snapshot.kpi_data)
+            if codes is None:
+                for code in values:
+                    series.setdefault(code, [None] * len(dates))
+            for code, column in series.items():
+                column.append(values.get(code))
+            dates.append(snapshot.snapshot_date)
+
+        return {'dates': [date.isoformat() for date in dates], 'series': series}
 
 
 class DashboardAlert(models.Model):
@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class UniversityEvent(models.Model):
     _name = 'university.event'
     _description = 'University Events (Fest, Seminar, Workshop)'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'website.published.mixin', 'university.dashboard.cache.mixin']
     _inherits = {'calendar.event': 'calendar_event_id'}  # Integration with calendar
     _order = 'start desc'
 
@@ -6,4 +6,5 @@ from . import examination
 from . import grade_system
 from . import hall_ticket
 from . import marksheet
+from . import result_publication
 from . import revaluation
\ No newline at end of file
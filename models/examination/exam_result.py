@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class ExaminationResult(models.Model):
     _name = 'examination.result'
     _description = 'Exam Result Entry'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _order = 'examination_id, student_id'
 
     active = fields.Boolean(string='Active', default=True)
@@ -35,6 +35,7 @@ class ExaminationResult(models.Model):
                                 required=True, tracking=True)
     subject_id = fields.Many2one(related='course_id.subject_id', string='Subject',
                                  store=True, readonly=True)
+    credits = fields.Integer(related='course_id.credits', string='Credits', store=True)
 
     # Marks
     max_marks = fields.Integer(string='Maximum Marks', required=True, default=100)
@@ -56,6 +57,8 @@ class ExaminationResult(models.Model):
                                compute='_compute_grade', store=True)
     grade_letter = fields.Char(related='grade_id.grade', string='Grade Letter', store=True)
     grade_point = fields.Float(related='grade_id.grade_point', string='Grade Point', store=True)
+    credit_points = fields.Float(string='Credit Points', compute='_compute_credit_points', store=True,
+                                 help='Grade point weighted by the course credits')
 
     # Result
     is_pass = fields.Boolean(string='Pass', compute='_compute_result', store=True)
@@ -117,16 +120,18 @@ class ExaminationResult(models.Model):
 
     @api.depends('percentage')
     def _compute_grade(self):
+        GradeSystem = self.env['examination.grade.system']
         for record in self:
             if not record.is_absent:
-                grade = self.env['examination.grade.system'].search([
-                    ('min_percentage', '<=', record.percentage),
-                    ('max_percentage', '>=', record.percentage)
-                ], limit=1)
-                record.grade_id = grade.id if grade else False
+                record.grade_id = GradeSystem._get_grade_for_percentage(record.percentage)
             else:
                 record.grade_id = False
 
+    @api.depends('grade_point', 'credits')
+    def _compute_credit_points(self):
+        for record in self:
+            record.credit_points = record.grade_point * record.credits
+
     @api.depends('total_marks', 'passing_marks', 'is_absent', 'internal_marks', 'external_marks')
     def _compute_result(self):
         for record in self:
@@ -160,6 +165,31 @@ class ExaminationResult(models.Model):
             if record.external_marks > record.external_max:
                 raise ValidationError(_('External marks cannot exceed maximum external marks!'))
 
+    # ==================== GRADE POINT AVERAGES ====================
+
+    @api.model
+    def _get_credit_totals(self, students, groupby=()):
+        """Published credit points and credits of ``students``, in one grouped query
+
+        Returns ``{(student_id, *groupby ids): (credit_points, credits)}``;
+        ``groupby`` lists many2one fields such as ``semester_id``. Absent
+        results are left out, as for the marksheet SGPA.
+        """
+        groups = self._read_group(
+            [('student_id', 'in', students.ids), ('state', '=', 'published'), ('is_absent', '=', False)],
+            ['student_id', *groupby],
+            ['credit_points:sum', 'credits:sum'],
+        )
+        return {
+            tuple(key.id for key in keys): (credit_points or 0.0, credits or 0)
+            for *keys, credit_points, credits in groups
+        }
+
+    @api.model
+    def _get_grade_point_average(self, credit_points, credits):
+        """Credit-weighted grade point average"""
+        return credit_points / credits if credits else 0.0
+
     def action_submit(self):
         self.write({'state': 'submitted'})
 
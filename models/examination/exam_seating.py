@@ -2,6 +2,8 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from collections import defaultdict
+import heapq
 
 
 class ExaminationSeating(models.Model):
@@ -79,39 +81,103 @@ class ExaminationSeating(models.Model):
         self.write({'is_confirmed': True})
 
     @api.model
-    def generate_seating_arrangement(self, examination_id, students_per_room=30):
-        """Auto-generate seating arrangement"""
-        examination = self.env['examination.examination'].browse(examination_id)
-
-        # Get all students registered for examination
+    def generate_seating_arrangement(self, examination_id, students_per_room=30, classroom_ids=None,
+                                     timetable_id=False, seats_per_row=6):
+        """Auto-generate seating arrangement
+
+        Candidates are seated room by room in the classrooms' real capacity
+        (``students_per_room`` for rooms without one), ordered so that
+        neighbouring seats go to different programs whenever possible.
+        Students already seated for the exam keep their seat; all new
+        seats are written with a single batched create.
+        """
+        # Eligible hall ticket of every student, built once
         hall_tickets = self.env['examination.hall.ticket'].search([
             ('examination_id', '=', examination_id),
             ('is_eligible', '=', True),
             ('state', 'in', ['issued', 'printed'])
         ])
+        ticket_by_student = {}
+        for ticket in hall_tickets:
+            ticket_by_student.setdefault(ticket.student_id.id, ticket.id)
 
-        students = hall_tickets.mapped('student_id')
-
-        # Simple room allocation logic
-        room_counter = 1
-        seat_counter = 1
-
-        for student in students:
-            room_number_id = f"R{room_counter:03d}"
-            seat_number = f"S{seat_counter:03d}"
-
-            self.create({
+        # Seats already allocated for this exam
+        existing = self.search_fetch([
+            ('examination_id', '=', examination_id),
+            ('timetable_id', '=', timetable_id),
+        ], ['student_id', 'room_number_id', 'seat_number'])
+        seated_students = set(existing.student_id.ids)
+        taken_seats = {(seat.room_number_id.id, seat.seat_number) for seat in existing}
+
+        students = hall_tickets.student_id.filtered(lambda s: s.id not in seated_students)
+        if not students:
+            return self.browse()
+
+        classrooms = (
+            self.env['university.classroom'].browse(classroom_ids) if classroom_ids
+            else self.env['university.classroom'].search([], order='building_name, floor, room_number, id')
+        )
+        free_seats = self._iter_free_seats(classrooms, students_per_room, seats_per_row, taken_seats)
+
+        vals_list = []
+        for student in self._interleave_by_group(students, lambda s: s.program_id.id):
+            seat = next(free_seats, None)
+            if seat is None:
+                raise ValidationError(_(
+                    'Not enough classroom capacity: %s candidates could not be seated.'
+                ) % (len(students) - len(vals_list)))
+            classroom, seat_number, row, column = seat
+            vals_list.append({
                 'examination_id': examination_id,
+                'timetable_id': timetable_id,
                 'student_id': student.id,
-                'hall_ticket_id': hall_tickets.filtered(lambda h: h.student_id == student).id,
-                'room_number_id': room_number_id,
+                'hall_ticket_id': ticket_by_student[student.id],
+                'room_number_id': classroom.id,
                 'seat_number': seat_number,
+                'row_number': str(row),
+                'column_number': str(column),
+                'venue': classroom.building_name,
             })
 
-            seat_counter += 1
-            if seat_counter > students_per_room:
-                room_counter += 1
-                seat_counter = 1
+        return self.create(vals_list)
+
+    @api.model
+    def _iter_free_seats(self, classrooms, students_per_room, seats_per_row, taken_seats):
+        """Yield ``(classroom, seat number, row, column)`` for every free seat, room by room"""
+        for classroom in classrooms:
+            for index in range(classroom.capacity or students_per_room):
+                seat_number = f"S{index + 1:03d}"
+                if (classroom.id, seat_number) in taken_seats:
+                    continue
+                yield classroom, seat_number, index // seats_per_row + 1, index % seats_per_row + 1
+
+    @api.model
+    def _interleave_by_group(self, records, key):
+        """Order ``records`` so that consecutive ones differ in ``key`` whenever possible
+
+        Always takes the next record from the largest remaining group other
+        than the one just used: O(n log g) for g groups.
+        """
+        groups = defaultdict(list)
+        for record in records:
+            groups[key(record)].append(record)
+
+        heap = [(-len(members), index, members[::-1]) for index, members in enumerate(groups.values())]
+        heapq.heapify(heap)
+
+        ordered = []
+        held = None
+        while heap:
+            count, index, members = heapq.heappop(heap)
+            ordered.append(members.pop())
+            if held:
+                heapq.heappush(heap, held)
+            held = (count + 1, index, members) if members else None
+
+        # Only one group left: its remaining members have to sit together
+        if held:
+            ordered.extend(reversed(held[2]))
+        return ordered
 
     @api.depends('state')
     def _compute_is_confirmed(self):
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class Examination(models.Model):
     _name = 'examination.examination'
     _description = 'Exam Schedule'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'start_date desc'
 
     name = fields.Char(string='Examination Name', required=True, tracking=True)
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
+from bisect import bisect_right
 
 
 class ExaminationGradeSystem(models.Model):
@@ -39,6 +40,22 @@ class ExaminationGradeSystem(models.Model):
         ('grade_point_unique', 'unique(grade_point)', 'Grade Point must be unique!'),
     ]
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
+
     @api.constrains('min_percentage', 'max_percentage')
     def _check_percentage_range(self):
         for record in self:
@@ -60,3 +77,29 @@ class ExaminationGradeSystem(models.Model):
             ])
             if overlapping:
                 raise ValidationError(_('Grade ranges cannot overlap!'))
+
+    # ==================== GRADE LOOKUP ====================
+
+    @api.model
+    @tools.ormcache()
+    def _get_grade_bands(self):
+        """Active grade bands as ``(mins, maxes, ids)`` tuples sorted by minimum percentage
+
+        Cached per registry and cleared whenever a grade is created, edited or
+        deleted, so grading a batch of results never queries this table.
+        """
+        grades = self.sudo().search_fetch([], ['min_percentage', 'max_percentage'], order='min_percentage, id')
+        return (
+            tuple(grades.mapped('min_percentage')),
+            tuple(grades.mapped('max_percentage')),
+            tuple(grades.ids),
+        )
+
+    @api.model
+    def _get_grade_for_percentage(self, percentage):
+        """Return the grade whose range contains ``percentage`` (empty if none)"""
+        mins, maxes, ids = self._get_grade_bands()
+        index = bisect_right(mins, percentage) - 1
+        if index >= 0 and percentage <= maxes[index]:
+            return self.browse(ids[index])
+        return self.browse()
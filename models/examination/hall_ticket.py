@@ -1,17 +1,18 @@
 # -*- coding: utf-8 -*-
 
 from odoo import models, fields, api, _
-import qrcode
-import base64
-from io import BytesIO
 
 
 class ExaminationHallTicket(models.Model):
     _name = 'examination.hall.ticket'
     _description = 'Hall Ticket Generation'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin',
+                'university.report.cache.mixin']
     _order = 'issue_date desc'
 
+    # Printed records whose changes render the cached PDFs again
+    _report_cache_depends = ['student_id', 'student_id.program_id', 'examination_id']
+
     name = fields.Char(string='Hall Ticket Number', required=True, readonly=True,
                        copy=False, default='/')
 
@@ -50,8 +51,11 @@ class ExaminationHallTicket(models.Model):
                                 default=lambda self: self.env.user, readonly=True)
 
     # QR Code
-    qr_code = fields.Binary(string='QR Code', compute='_compute_qr_code', store=True)
+    # Rendered on first view or print and cached per payload by university.qr.code
+    qr_code = fields.Binary(string='QR Code', compute='_compute_qr_code')
     qr_data = fields.Char(string='QR Data', compute='_compute_qr_data', store=True)
+    qr_key = fields.Char(string='QR Key', compute='_compute_qr_key', store=True, index=True)
+    qr_url = fields.Char(string='QR Code URL', compute='_compute_qr_url')
 
     # Instructions
     instructions = fields.Html(related='examination_id.instructions',
@@ -83,11 +87,12 @@ class ExaminationHallTicket(models.Model):
          'Hall ticket already generated for this student and examination!'),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get('name', '/') == '/':
-            vals['name'] = self.env['ir.sequence'].next_by_code('examination.hall.ticket') or '/'
-        return super(ExaminationHallTicket, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if vals.get('name', '/') == '/':
+                vals['name'] = self.env['ir.sequence'].next_by_code('examination.hall.ticket') or '/'
+        return super(ExaminationHallTicket, self).create(vals_list)
 
     @api.depends('student_id', 'name', 'examination_id')
     def _compute_qr_data(self):
@@ -101,20 +106,22 @@ class ExaminationHallTicket(models.Model):
             else:
                 record.qr_data = False
 
+    @api.depends('qr_data')
+    def _compute_qr_key(self):
+        QrCode = self.env['university.qr.code']
+        for record in self:
+            record.qr_key = QrCode._get_qr_key(record.qr_data) if record.qr_data else False
+
+    @api.depends('qr_key')
+    def _compute_qr_url(self):
+        for record in self:
+            record.qr_url = f'/university/qr/{record.qr_key}.png' if record.qr_key else False
+
     @api.depends('qr_data')
     def _compute_qr_code(self):
+        images = self.env['university.qr.code'].get_qr_images(self.mapped('qr_data'))
         for record in self:
-            if record.qr_data:
-                qr = qrcode.QRCode(version=1, box_size=10, border=5)
-                qr.add_data(record.qr_data)
-                qr.make(fit=True)
-
-                img = qr.make_image(fill_color="black", back_color="white")
-                buffer = BytesIO()
-                img.save(buffer, format='PNG')
-                record.qr_code = base64.b64encode(buffer.getvalue())
-            else:
-                record.qr_code = False
+            record.qr_code = images.get(record.qr_data, False)
 
     def action_issue(self):
         """Issue hall ticket"""
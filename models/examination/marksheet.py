@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
 
 from odoo import models, fields, api, _
+from collections import defaultdict
 
 
 class ExaminationMarksheet(models.Model):
     _name = 'examination.marksheet'
     _description = 'Student Marksheet Generation'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.report.cache.mixin']
     _order = 'issue_date desc'
 
+    # Printed records whose changes render the cached PDFs again
+    _report_cache_depends = ['student_id', 'student_id.program_id', 'semester_id', 'result_ids',
+                             'result_ids.examination_id']
+
     name = fields.Char(string='Marksheet Number', required=True, readonly=True,
                        copy=False, default='/')
 
@@ -130,13 +135,14 @@ class ExaminationMarksheet(models.Model):
         ('name_unique', 'unique(name)', 'Marksheet Number must be unique!'),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get('name', '/') == '/':
-            vals['name'] = self.env['ir.sequence'].next_by_code('examination.marksheet') or '/'
-        return super(ExaminationMarksheet, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        pending = [vals for vals in vals_list if vals.get('name', '/') == '/']
+        for vals, number in zip(pending, self.env['ir.sequence'].next_block_by_code('examination.marksheet', len(pending))):
+            vals['name'] = number or '/'
+        return super(ExaminationMarksheet, self).create(vals_list)
 
-    @api.depends('result_ids', 'result_ids.grade_point', 'result_ids.is_pass')
+    @api.depends('result_ids', 'result_ids.credit_points', 'result_ids.is_pass')
     def _compute_performance(self):
         for record in self:
             results = record.result_ids.filtered(lambda r: not r.is_absent)
@@ -149,12 +155,9 @@ class ExaminationMarksheet(models.Model):
             record.total_credits = sum(results.mapped('course_id.credits'))
             record.credits_earned = sum(results.filtered(lambda r: r.is_pass).mapped('course_id.credits'))
 
-            # SGPA
-            if results:
-                total_grade_points = sum(results.mapped('grade_point'))
-                record.sgpa = total_grade_points / len(results)
-            else:
-                record.sgpa = 0.0
+            # SGPA (credit weighted)
+            record.sgpa = results._get_grade_point_average(
+                sum(results.mapped('credit_points')), record.total_credits)
 
             # Percentage
             if results:
@@ -164,21 +167,32 @@ class ExaminationMarksheet(models.Model):
             else:
                 record.percentage = 0.0
 
-    @api.depends('student_id', 'academic_year_id')
+    @api.depends('student_id', 'academic_year_id.start_date', 'student_id.exam_result_ids.state',
+                 'student_id.exam_result_ids.credit_points', 'student_id.exam_result_ids.is_absent',
+                 'student_id.exam_result_ids.academic_year_id')
     def _compute_cgpa(self):
+        Result = self.env['examination.result']
+        # Published credit totals of every student per academic year, in one query
+        totals_by_student = defaultdict(list)
+        for (student_id, year_id), totals in Result._get_credit_totals(
+                self.student_id, ['academic_year_id']).items():
+            if year_id:
+                totals_by_student[student_id].append((year_id, totals))
+        start_dates = {
+            year.id: year.start_date
+            for year in self.env['university.academic.year'].browse(
+                {year_id for totals in totals_by_student.values() for year_id, _totals in totals})
+        }
+
         for record in self:
-            # Get all published results for the student up to current academic year
-            all_results = self.env['examination.result'].search([
-                ('student_id', '=', record.student_id.id),
-                ('state', '=', 'published'),
-                ('academic_year_id', '<=', record.academic_year_id.id)
-            ])
-
-            if all_results:
-                total_grade_points = sum(all_results.mapped('grade_point'))
-                record.cgpa = total_grade_points / len(all_results)
-            else:
-                record.cgpa = 0.0
+            # Cumulative over the results up to the marksheet's academic year
+            credit_points = credits = 0
+            year_start = record.academic_year_id.start_date
+            for year_id, (year_credit_points, year_credits) in totals_by_student[record.student_id.id]:
+                if year_start and start_dates[year_id] <= year_start:
+                    credit_points += year_credit_points
+                    credits += year_credits
+            record.cgpa = Result._get_grade_point_average(credit_points, credits)
 
     @api.depends('percentage')
     def _compute_classification(self):
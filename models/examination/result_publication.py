@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, Command, _
+from collections import defaultdict
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class ExaminationResultPublication(models.Model):
+    """Resumable publication run of a set of examination results
+
+    Started from the publish result wizard; kept as a regular record so that
+    a queued or failed run survives the cleanup of the wizard and can be
+    resumed later by the publication cron.
+    """
+    _name = 'examination.result.publication'
+    _description = 'Examination Result Publication'
+    _order = 'create_date desc'
+
+    examination_id = fields.Many2one('examination.examination', string='Examination', required=True,
+                                     ondelete='cascade', readonly=True)
+    result_ids = fields.Many2many('examination.result', string='Results', readonly=True)
+
+    generate_marksheet = fields.Boolean(string='Generate Marksheets', readonly=True)
+    send_email = fields.Boolean(string='Send Email Notification', readonly=True)
+    send_sms = fields.Boolean(string='Send SMS Notification', readonly=True)
+
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='queued', required=True, readonly=True, index=True)
+    progress_total = fields.Integer(string='Results to Process', readonly=True)
+    progress_done = fields.Integer(string='Results Published', readonly=True)
+    progress_percentage = fields.Float(string='Progress', compute='_compute_progress_percentage')
+    marksheets_generated = fields.Integer(string='Marksheets Generated', readonly=True)
+    error_message = fields.Text(string='Last Error', readonly=True)
+
+    # Results published per chunk; larger publications run in the background
+    _publish_chunk_size = 500
+
+    @api.depends('progress_total', 'progress_done')
+    def _compute_progress_percentage(self):
+        for publication in self:
+            publication.progress_percentage = (
+                publication.progress_done / publication.progress_total * 100) if publication.progress_total else 0.0
+
+    def _get_pending_results(self):
+        """Results of the run not published yet; a failed or interrupted run resumes from here"""
+        return self.result_ids.filtered(lambda r: r.state != 'published')
+
+    def _start(self):
+        """Run the publication inline, or queue it for the cron when it is large
+
+        Returns True when the publication was queued.
+        """
+        self.ensure_one()
+        pending = len(self._get_pending_results())
+        self.write({
+            'state': 'queued',
+            'progress_total': self.progress_done + pending,
+            'error_message': False,
+        })
+        if pending > self._publish_chunk_size:
+            self.env.ref('university_management.cron_publish_results')._trigger()
+            return True
+        self._run_publication()
+        return False
+
+    def _run_publication(self, commit=False):
+        """Publish the pending results chunk by chunk
+
+        Each chunk runs in a savepoint: a failing chunk is rolled back, the
+        run is marked as failed and resuming it publishes the results that
+        are still unpublished.
+        """
+        self.ensure_one()
+        while True:
+            results = self._get_pending_results()[:self._publish_chunk_size]
+            if not results:
+                break
+            try:
+                with self.env.cr.savepoint():
+                    marksheets = self._publish_chunk(results)
+            except Exception as e:
+                _logger.error(f"Result publication error: {str(e)}")
+                self.write({'state': 'failed', 'error_message': str(e)})
+                return False
+
+            self.write({
+                'progress_done': self.progress_done + len(results),
+                'marksheets_generated': self.marksheets_generated + marksheets,
+            })
+            if commit:
+                self.env.cr.commit()
+
+        # Update examination status once all of its results are out
+        if self.examination_id.results_published:
+            self.examination_id.action_publish_results()
+        self.state = 'done'
+        return True
+
+    def _publish_chunk(self, results):
+        """Publish one chunk of results and return the number of marksheets created"""
+        results.write({'state': 'published'})
+
+        marksheets = 0
+        if self.generate_marksheet:
+            marksheets = self._generate_marksheets(results)
+
+        self._enqueue_notifications(results)
+        return marksheets
+
+    @api.model
+    def _cron_publish_results(self):
+        """Cron job publishing queued runs in committed chunks"""
+        for publication in self.search([('state', '=', 'queued')], order='id'):
+            publication._run_publication(commit=True)
+            self.env.cr.commit()
+
+    def _generate_marksheets(self, results):
+        """Create or complete semester marksheets per (student, semester)
+
+        One query finds the existing marksheets of the chunk; those receiving
+        the same results are updated together and new ones are created in a
+        single batch. Returns the number of marksheets created.
+        """
+        Marksheet = self.env['examination.marksheet']
+
+        result_ids_by_key = defaultdict(list)
+        academic_years = {}
+        for result in results:
+            if not result.semester_id or not result.academic_year_id:
+                continue
+            key = (result.student_id.id, result.semester_id.id)
+            result_ids_by_key[key].append(result.id)
+            academic_years[key] = result.academic_year_id.id
+
+        existing = {
+            (marksheet.student_id.id, marksheet.semester_id.id): marksheet
+            for marksheet in Marksheet.search([
+                ('student_id', 'in', results.student_id.ids),
+                ('semester_id', 'in', results.semester_id.ids),
+                ('marksheet_type', '=', 'semester'),
+                ('state', '!=', 'cancelled'),
+            ])
+        }
+
+        vals_list = []
+        marksheets_by_results = defaultdict(lambda: Marksheet)
+        for key, result_ids in result_ids_by_key.items():
+            marksheet = existing.get(key)
+            if marksheet:
+                marksheets_by_results[tuple(result_ids)] |= marksheet
+            else:
+                vals_list.append({
+                    'student_id': key[0],
+                    'semester_id': key[1],
+                    'academic_year_id': academic_years[key],
+                    'marksheet_type': 'semester',
+                    'result_ids': [Command.set(result_ids)],
+                    'issue_date': fields.Date.today(),
+                })
+
+        for result_ids, marksheets in marksheets_by_results.items():
+            marksheets.write({'result_ids': [Command.link(result_id) for result_id in result_ids]})
+        Marksheet.create(vals_list)
+        return len(vals_list)
+
+    def _enqueue_notifications(self, results):
+        """Queue email/SMS notifications; the mail and SMS queues deliver them"""
+        if self.send_email:
+            template = self.env.ref('university_management.email_template_result_published',
+                                    raise_if_not_found=False)
+            recipients = results.filtered(lambda r: r.student_id.email)
+            if template and recipients:
+                template.send_mail_batch(recipients.ids)
+
+        if self.send_sms and 'sms.sms' in self.env:
+            self.env['sms.sms'].create([{
+                'number': result.student_id.mobile,
+                'body': _(
+                    "Dear %s, Your %s result is published. Result: %s, Percentage: %.2f%%. "
+                    "Login to student portal for details."
+                ) % (
+                    result.student_id.name,
+                    result.examination_id.name,
+                    (result.result or '').upper(),
+                    result.percentage
+                ),
+            } for result in results if result.student_id.mobile])
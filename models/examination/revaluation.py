@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class ExaminationRevaluation(models.Model):
     _name = 'examination.revaluation'
     _description = 'Re-evaluation Requests'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _order = 'application_date desc'
 
     name = fields.Char(string='Revaluation Number', required=True, readonly=True,
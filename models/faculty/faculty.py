@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class Faculty(models.Model):
     _name = 'faculty.faculty'
     _description = 'Faculty Master'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _inherits = {'hr.employee': 'employee_id'}
     _order = 'name'
 
@@ -7,9 +7,12 @@ from odoo.exceptions import ValidationError
 class FacultyAttendance(models.Model):
     _name = 'faculty.attendance'
     _description = 'Faculty Attendance'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.attendance.daily.mixin']
     _order = 'date desc, faculty_id'
 
+    # Changes to these fields refresh the daily attendance summary
+    _attendance_summary_fields = ['faculty_id', 'date', 'state']
+
     name = fields.Char(string='Reference', compute='_compute_name', store=True)
 
     # Faculty
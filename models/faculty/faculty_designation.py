@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class FacultyDesignation(models.Model):
     _name = 'faculty.designation'
     _description = 'Faculty Designation (Professor, Assistant Prof, etc.)'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'sequence, name'
 
     name = fields.Char(string='Designation Name', required=True, tracking=True,
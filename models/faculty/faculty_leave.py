@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class FacultyLeave(models.Model):
     _name = 'faculty.leave'
     _description = 'Faculty Leave Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'date_from desc'
 
     name = fields.Char(string='Leave Number', required=True, readonly=True,
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class FeePayment(models.Model):
     _name = 'fee.payment'
     _description = 'Fee Payment Records'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _order = 'payment_date desc'
 
     name = fields.Char(string='Payment Receipt Number', required=True, readonly=True,
@@ -26,14 +26,14 @@ class FeeReminder(models.Model):
 
     # Fee Structure
     fee_structure_id = fields.Many2one('fee.structure', string='Fee Structure',
-                                       required=True, tracking=True)
+                                       required=True, tracking=True, index=True)
     total_fee = fields.Monetary(related='fee_structure_id.total_amount',
                                 string='Total Fee', currency_field='currency_id')
     due_date = fields.Date(related='fee_structure_id.due_date', string='Due Date')
 
     # Reminder Details
     reminder_date = fields.Date(string='Reminder Date', default=fields.Date.today(),
-                                required=True, tracking=True)
+                                required=True, tracking=True, index=True)
     reminder_type = fields.Selection([
         ('before_due', 'Before Due Date'),
         ('on_due', 'On Due Date'),
@@ -87,11 +87,25 @@ class FeeReminder(models.Model):
         ('name_unique', 'unique(name)', 'Reminder Number must be unique!'),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get('name', '/') == '/':
-            vals['name'] = self.env['ir.sequence'].next_by_code('fee.reminder') or '/'
-        return super(FeeReminder, self).create(vals)
+    # Reminder type sent when the due date is this many days away (negative: overdue)
+    _reminder_schedule = {
+        7: 'before_due',
+        0: 'on_due',
+        -7: 'after_due',
+        -14: 'second',
+        -30: 'final',
+    }
+
+    # Reminders created or sent per batch by the scheduled actions
+    _reminder_batch_size = 500
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Reminder numbers are reserved in one block per batch
+        pending = [vals for vals in vals_list if vals.get('name', '/') == '/']
+        for vals, number in zip(pending, self.env['ir.sequence'].next_block_by_code('fee.reminder', len(pending))):
+            vals['name'] = number or '/'
+        return super(FeeReminder, self).create(vals_list)
 
     @api.depends('student_id')
     def _compute_parents(self):
@@ -147,50 +161,57 @@ class FeeReminder(models.Model):
         return True
 
     def action_send_reminder(self):
-        """Send reminder via email and SMS"""
-        for record in self:
-            if not record.parent_ids:
-                raise ValidationError(_(
-                    'No parent contact details found for this student. '
-                    'Please update parent information before sending reminders.'
-                ))
-
-            success = True
-
-            try:
-                if record.send_email:
-                    record._send_email_reminder()
-
-                if record.send_sms:
-                    record._send_sms_reminder()
-
-                record.write({'state': 'sent'})
-            except Exception as e:
-                _logger.error(f"Failed to send reminder {record.name}: {str(e)}")
-                record.write({'state': 'failed'})
-                success = False
+        """Send reminder via email and SMS
+
+        The reminders are sent as one batch; if the batch fails they are
+        retried one by one so that a single failing reminder is the only one
+        marked as failed.
+        """
+        if self.filtered(lambda r: not r.parent_ids):
+            raise ValidationError(_(
+                'No parent contact details found for this student. '
+                'Please update parent information before sending reminders.'
+            ))
+
+        try:
+            with self.env.cr.savepoint():
+                self._send_reminders()
+        except Exception as e:
+            _logger.error(f"Failed to send {len(self)} fee reminders as a batch: {str(e)}")
+            for record in self:
+                try:
+                    with self.env.cr.savepoint():
+                        record._send_reminders()
+                except Exception as e:
+                    _logger.error(f"Failed to send reminder {record.name}: {str(e)}")
+                    record.write({'state': 'failed'})
 
         return True
 
+    def _send_reminders(self):
+        """Send emails and SMS of all reminders and mark them sent"""
+        self.filtered('send_email')._send_email_reminder()
+        self.filtered('send_sms')._send_sms_reminder()
+        self.write({'state': 'sent'})
+
     def action_resend(self):
         """Resend reminder"""
-        for record in self:
-            record.write({
-                'email_sent': False,
-                'email_sent_date': False,
-                'sms_sent': False,
-                'sms_sent_date': False,
-                'state': 'scheduled'
-            })
-            record.action_send_reminder()
-        return True
+        self.write({
+            'email_sent': False,
+            'email_sent_date': False,
+            'sms_sent': False,
+            'sms_sent_date': False,
+            'state': 'scheduled'
+        })
+        return self.action_send_reminder()
 
     def _send_email_reminder(self):
-        """Send email reminder"""
+        """Send email reminders, rendering the template once for all of them"""
         template = self.env.ref('university_management.email_template_fee_reminder',
                                 raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
+        if template and self:
+            # Queued sending leaves delivery to the mail queue instead of SMTP inline
+            template.send_mail_batch(self.ids, force_send=not self.env.context.get('fee_reminder_queued'))
             self.write({
                 'email_sent': True,
                 'email_sent_date': fields.Datetime.now()
@@ -207,69 +228,96 @@ class FeeReminder(models.Model):
 
     @api.model
     def _cron_generate_reminders(self):
-        """Scheduled action to generate automatic reminders"""
-        today = fields.Date.today()
+        """Scheduled action to generate automatic reminders
 
-        # Get all active fee structures
-        fee_structures = self.env['fee.structure'].search([('state', '=', 'active')])
+        Works per fee structure with a constant number of queries: one grouped
+        query for the paid amounts of every student, one for the reminders
+        already generated today and batched creates. Sending is left to the
+        ``send_pending_reminders`` scheduled action.
+        """
+        today = fields.Date.today()
 
+        # Only structures with a reminder due today need any work
+        fee_structures = self.env['fee.structure'].search([
+            ('state', '=', 'active'),
+            ('due_date', 'in', [today + timedelta(days=days) for days in self._reminder_schedule]),
+        ])
+        if not fee_structures:
+            return
+
+        # Enrolled students per program
+        students_by_program = {
+            program.id: student_ids
+            for program, student_ids in self.env['student.student']._read_group(
+                [('program_id', 'in', fee_structures.program_id.ids), ('state', 'in', ['enrolled', 'active'])],
+                ['program_id'],
+                ['id:array_agg'],
+            )
+        }
+
+        # Paid amounts per structure and student
+        paid_amounts = {
+            (fee_structure.id, student.id): amount
+            for fee_structure, student, amount in self.env['fee.payment']._read_group(
+                [('fee_structure_id', 'in', fee_structures.ids), ('state', '=', 'paid')],
+                ['fee_structure_id', 'student_id'],
+                ['amount:sum'],
+            )
+        }
+
+        # Reminders already generated today
+        existing = {
+            (fee_structure.id, student.id, reminder_type)
+            for fee_structure, student, reminder_type in self._read_group(
+                [('fee_structure_id', 'in', fee_structures.ids), ('reminder_date', '=', today)],
+                ['fee_structure_id', 'student_id', 'reminder_type'],
+            )
+        }
+
+        vals_list = []
         for fee_structure in fee_structures:
-            if not fee_structure.due_date:
-                continue
-
-            # Get students with this fee structure
-            students = self.env['student.student'].search([
-                ('program_id', '=', fee_structure.program_id.id),
-                ('state', 'in', ['enrolled', 'active'])
-            ])
+            reminder_type = self._reminder_schedule[(fee_structure.due_date - today).days]
+            for student_id in students_by_program.get(fee_structure.program_id.id, []):
+                if (fee_structure.id, student_id, reminder_type) in existing:
+                    continue
+                outstanding = fee_structure.total_amount - paid_amounts.get((fee_structure.id, student_id), 0.0)
+                if outstanding > 0:
+                    vals_list.append({
+                        'student_id': student_id,
+                        'fee_structure_id': fee_structure.id,
+                        'reminder_type': reminder_type,
+                        'outstanding_amount': outstanding,
+                        'state': 'scheduled',
+                    })
 
-            for student in students:
-                # Check if fee is paid
-                paid_amount = sum(self.env['fee.payment'].search([
-                    ('student_id', '=', student.id),
-                    ('fee_structure_id', '=', fee_structure.id),
-                    ('state', '=', 'paid')
-                ]).mapped('amount'))
+        for start in range(0, len(vals_list), self._reminder_batch_size):
+            self.create(vals_list[start:start + self._reminder_batch_size])
 
-                outstanding = fee_structure.total_amount - paid_amount
+        _logger.info(f"Fee reminders generated: {len(vals_list)} for {len(fee_structures)} fee structures")
 
-                if outstanding > 0:
-                    # Generate reminders based on due date
-                    days_diff = (fee_structure.due_date - today).days
-
-                    # Before due date (7 days before)
-                    if days_diff == 7:
-                        self._create_reminder(student, fee_structure, 'before_due', outstanding)
-
-                    # On due date
-                    elif days_diff == 0:
-                        self._create_reminder(student, fee_structure, 'on_due', outstanding)
-
-                    # After due date
-                    elif days_diff < 0:
-                        days_overdue = abs(days_diff)
-                        if days_overdue == 7:
-                            self._create_reminder(student, fee_structure, 'after_due', outstanding)
-                        elif days_overdue == 14:
-                            self._create_reminder(student, fee_structure, 'second', outstanding)
-                        elif days_overdue == 30:
-                            self._create_reminder(student, fee_structure, 'final', outstanding)
-
-    def _create_reminder(self, student, fee_structure, reminder_type, outstanding):
-        """Create and send reminder"""
-        existing = self.search([
-            ('student_id', '=', student.id),
-            ('fee_structure_id', '=', fee_structure.id),
-            ('reminder_type', '=', reminder_type),
-            ('reminder_date', '=', fields.Date.today())
-        ])
+        if vals_list:
+            sender = self.env.ref('university_management.cron_send_fee_reminders', raise_if_not_found=False)
+            if sender:
+                sender._trigger()
 
-        if not existing:
-            reminder = self.create({
-                'student_id': student.id,
-                'fee_structure_id': fee_structure.id,
-                'reminder_type': reminder_type,
-                'outstanding_amount': outstanding,
-                'state': 'scheduled'
-            })
-            reminder.action_send_reminder()
+    @api.model
+    def send_pending_reminders(self):
+        """Scheduled action sending scheduled reminders in batches
+
+        Each run handles one batch in its own transaction; when reminders
+        remain the cron re-triggers itself instead of sending everything at once.
+        """
+        reminders = self.search([('state', '=', 'scheduled')], limit=self._reminder_batch_size,
+                                order='reminder_date, id')
+        if not reminders:
+            return
+
+        # Without parent contacts a reminder can never be delivered
+        unreachable = reminders.filtered(lambda r: not r.parent_ids)
+        unreachable.write({'state': 'failed'})
+
+        (reminders - unreachable).with_context(fee_reminder_queued=True).action_send_reminder()
+        _logger.info(f"Fee reminders processed: {len(reminders)} ({len(unreachable)} without parent contacts)")
+
+        if self.search_count([('state', '=', 'scheduled')], limit=1):
+            self.env.ref('university_management.cron_send_fee_reminders')._trigger()
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class Scholarship(models.Model):
     _name = 'scholarship.scholarship'
     _description = 'Scholarship Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'name'
 
     name = fields.Char(string='Scholarship Name', required=True, tracking=True)
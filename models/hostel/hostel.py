@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class Hostel(models.Model):
     _name = 'hostel.hostel'
     _description = 'Hostel Master'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'name'
 
     name = fields.Char(string='Hostel Name', required=True, tracking=True)
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class HostelAllocation(models.Model):
     _name = 'hostel.allocation'
     _description = 'Student Hostel Room Allocation'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'allocation_date desc'
 
     name = fields.Char(string='Allocation Number', required=True, readonly=True,
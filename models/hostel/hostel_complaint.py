@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class HostelComplaint(models.Model):
     _name = 'hostel.complaint'
     _description = 'Hostel Complaint Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'complaint_date desc'
 
     name = fields.Char(string='Complaint Number', required=True, readonly=True,
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class HostelRoom(models.Model):
     _name = 'hostel.room'
     _description = 'Hostel Room Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'hostel_id, room_number'
 
     name = fields.Char(string='Room Name', compute='_compute_name', store=True)
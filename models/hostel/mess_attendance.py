@@ -6,6 +6,7 @@ from odoo import models, fields, api
 class MessAttendance(models.Model):
     _name = 'mess.attendance'
     _description = 'Mess Attendance/Meal Tracking'
+    _inherit = ['university.dashboard.cache.mixin']
     _order = 'date desc, student_id'
 
     name = fields.Char(string='Reference', compute='_compute_name', store=True)
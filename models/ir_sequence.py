@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api
+
+
+class IrSequence(models.Model):
+    _inherit = 'ir.sequence'
+
+    @api.model
+    def next_block_by_code(self, sequence_code, count):
+        """Return ``count`` consecutive numbers of a sequence
+
+        Standard sequences reserve the whole block with a single query;
+        no-gap and date range sequences fall back to one number at a time.
+        """
+        if count <= 0:
+            return []
+        sequence = self.sudo().search([
+            ('code', '=', sequence_code),
+            ('company_id', 'in', [self.env.company.id, False]),
+        ], order='company_id', limit=1)
+        if not sequence:
+            return [self.next_by_code(sequence_code) for _ in range(count)]
+        if sequence.implementation != 'standard' or sequence.use_date_range:
+            return [sequence._next() for _ in range(count)]
+
+        self.env.cr.execute("SELECT nextval(%s) FROM generate_series(1, %s)",
+                            ['ir_sequence_%03d' % sequence.id, count])
+        return [sequence.get_next_char(number) for number, in self.env.cr.fetchall()]
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class LibraryBook(models.Model):
     _name = 'library.book'
     _description = 'Library Book Master'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _inherits = {'product.product': 'product_id'}  # Integration with stock module
     _order = 'name'
 
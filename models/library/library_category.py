@@ -6,6 +6,7 @@ from odoo import models, fields, api
 class LibraryCategory(models.Model):
     _name = 'library.category'
     _description = 'Library Book Categories'
+    _inherit = ['university.dashboard.cache.mixin']
     _order = 'name'
     _parent_store = True
 
@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class LibraryFine(models.Model):
     _name = 'library.fine'
     _description = 'Library Fine Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'date desc'
 
     name = fields.Char(string='Fine Number', required=True, readonly=True,
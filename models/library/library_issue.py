@@ -8,7 +8,7 @@ from datetime import timedelta
 class LibraryIssue(models.Model):
     _name = 'library.issue'
     _description = 'Library Book Issue/Return Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'issue_date desc'
 
     name = fields.Char(string='Issue Number', required=True, readonly=True,
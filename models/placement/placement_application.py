@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class PlacementApplication(models.Model):
     _name = 'placement.application'
     _description = 'Student Placement Applications'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _order = 'application_date desc'
 
     name = fields.Char(string='Application Number', required=True, readonly=True,
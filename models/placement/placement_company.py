@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class PlacementCompany(models.Model):
     _name = 'placement.company'
     _description = 'Placement Company Master'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _inherits = {'res.partner': 'partner_id'}  # Integration with contacts module
     _order = 'name'
 
@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class PlacementDrive(models.Model):
     _name = 'placement.drive'
     _description = 'Campus Placement Drives'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'drive_date desc'
 
     name = fields.Char(string='Drive Name', required=True, tracking=True)
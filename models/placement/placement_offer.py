@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class PlacementOffer(models.Model):
     _name = 'placement.offer'
     _description = 'Placement Offer Letters'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _order = 'offer_date desc'
 
     name = fields.Char(string='Offer Letter Number', required=True, readonly=True,
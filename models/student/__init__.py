@@ -3,6 +3,10 @@ from . import student_admission
 from . import student_document
 from . import student_registration
 from . import student_attendance
+from . import qr_code
+from . import report_cache
 from . import student_id_card
+from . import id_card_generation
 from . import student_parent
-from . import student_discipline
\ No newline at end of file
+from . import student_discipline
+from . import student_promotion
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class StudentIdCardGeneration(models.Model):
+    """Resumable bulk generation run of student ID cards
+
+    Started from the bulk ID card wizard; kept as a regular record so that a
+    queued or failed run survives the cleanup of the wizard and can be
+    resumed later by the ID card cron.
+    """
+    _name = 'student.id.card.generation'
+    _description = 'Student ID Card Generation Run'
+    _order = 'create_date desc'
+
+    student_ids = fields.Many2many('student.student', string='Students', readonly=True)
+    validity_date = fields.Date(string='Valid Until', required=True, readonly=True)
+    regenerate_existing = fields.Boolean(string='Regenerate Existing Cards', readonly=True)
+
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='queued', required=True, readonly=True, index=True)
+    run_started = fields.Datetime(string='Started On', default=fields.Datetime.now, readonly=True)
+    progress_total = fields.Integer(string='Cards to Process', readonly=True)
+    progress_done = fields.Integer(string='Cards Generated', readonly=True)
+    progress_percentage = fields.Float(string='Progress', compute='_compute_progress_percentage')
+    generated_card_ids = fields.Many2many('student.id.card', string='Generated Cards', readonly=True)
+    error_message = fields.Text(string='Last Error', readonly=True)
+
+    # Cards created per chunk; larger runs are generated in the background
+    _generation_chunk_size = 1000
+
+    @api.depends('progress_total', 'progress_done')
+    def _compute_progress_percentage(self):
+        for generation in self:
+            generation.progress_percentage = (
+                generation.progress_done / generation.progress_total * 100) if generation.progress_total else 0.0
+
+    def _get_pending_students(self):
+        """Students of the run still waiting for a card
+
+        Without regeneration, one query maps the students to their current
+        cards and students holding one are skipped. With it, only the
+        students already handled by this run are skipped, so an interrupted
+        run resumes where it stopped.
+        """
+        students = self.student_ids
+        if self.regenerate_existing:
+            done = set(self.generated_card_ids.student_id.ids)
+            return students.filtered(lambda s: s.id not in done)
+
+        carded = {
+            student.id for [student] in self.env['student.id.card']._read_group([
+                ('student_id', 'in', students.ids),
+                ('state', 'in', ['draft', 'printed', 'issued']),
+            ], ['student_id'])
+        }
+        return students.filtered(lambda s: s.id not in carded)
+
+    def _start(self):
+        """Run the generation inline, or queue it for the cron when it is large
+
+        Returns True when the generation was queued.
+        """
+        self.ensure_one()
+        pending = len(self._get_pending_students())
+        self.write({
+            'state': 'queued',
+            'progress_total': self.progress_done + pending,
+            'error_message': False,
+        })
+        if pending > self._generation_chunk_size:
+            self.env.ref('university_management.cron_generate_id_cards')._trigger()
+            return True
+        self._run_generation()
+        return False
+
+    def _run_generation(self, commit=False):
+        """Generate the pending cards chunk by chunk
+
+        The pending students are computed once and sliced into chunks. Each
+        chunk runs in a savepoint: a failing chunk is rolled back, the run is
+        marked as failed and resuming it starts again from the students that
+        still have no card.
+        """
+        self.ensure_one()
+        pending = self._get_pending_students()
+        for start in range(0, len(pending), self._generation_chunk_size):
+            students = pending[start:start + self._generation_chunk_size]
+            try:
+                with self.env.cr.savepoint():
+                    cards = self._generate_chunk(students)
+            except Exception as e:
+                _logger.error(f"ID card generation error: {str(e)}")
+                self.write({'state': 'failed', 'error_message': str(e)})
+                return False
+
+            self.write({
+                'progress_done': self.progress_done + len(cards),
+                'generated_card_ids': [(4, card_id) for card_id in cards.ids],
+            })
+            if commit:
+                self.env.cr.commit()
+
+        self.state = 'done'
+        return True
+
+    def _generate_chunk(self, students):
+        """Create the cards of one chunk in a single batch
+
+        Card numbers are reserved as one block of the ``student.id.card``
+        sequence and ``student.student.id_card_id`` follows the new cards
+        through its stored compute, recomputed once for the whole chunk.
+        """
+        today = fields.Date.today()
+        return self.env['student.id.card'].create([{
+            'student_id': student.id,
+            'card_type': 'regular',
+            'issue_date': today,
+            'expiry_date': self.validity_date,
+        } for student in students])
+
+    @api.model
+    def _cron_generate_id_cards(self):
+        """Cron job generating queued runs in committed chunks"""
+        for generation in self.search([('state', '=', 'queued')], order='id'):
+            generation._run_generation(commit=True)
+            self.env.cr.commit()
+
+    def action_view_cards(self):
+        """Show the cards generated by this run"""
+        return {
+            'name': _('Generated ID Cards'),
+            'type': 'ir.actions.act_window',
+            'res_model': 'student.id.card',
+            'view_mode': 'list,form',
+            'domain': [('id', 'in', self.generated_card_ids.ids)],
+            'target': 'current',
+        }
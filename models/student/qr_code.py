@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+from datetime import timedelta
+from io import BytesIO
+import base64
+import hashlib
+import logging
+import time
+import psycopg2
+import qrcode
+
+_logger = logging.getLogger(__name__)
+
+
+def render_qr_png(payload):
+    """Render ``payload`` as a 1-bit PNG, without touching the database"""
+    qr = qrcode.QRCode(version=1, box_size=10, border=5)
+    qr.add_data(payload)
+    qr.make(fit=True)
+
+    # Black on white gives a mode "1" image, saved as a 1-bit PNG
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffer = BytesIO()
+    img.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+class UniversityQrCode(models.Model):
+    """Content addressed QR code cache shared by hall tickets and ID cards
+
+    One entry per distinct payload, keyed by the SHA-1 of the payload. Images
+    are rendered on first use only, each distinct payload once per batch.
+    Entries that have not been used for a while are evicted once the cache
+    grows past ``university_management.qr_cache_size`` entries.
+    """
+    _name = 'university.qr.code'
+    _description = 'QR Code Cache'
+    _rec_name = 'key'
+
+    key = fields.Char(string='Payload Hash', required=True, readonly=True)
+    image = fields.Binary(string='QR Code', attachment=True, readonly=True)
+    last_used = fields.Datetime(string='Last Used', readonly=True, index=True)
+
+    _sql_constraints = [
+        ('key_unique', 'UNIQUE(key)', 'Only one QR code per payload!'),
+    ]
+
+    # Entries are marked as used at most this often, to keep reads write free
+    _touch_interval = timedelta(days=1)
+    _default_cache_size = 50000
+
+    # Models carrying ``qr_data``/``qr_key`` whose images are served by /university/qr
+    _qr_models = ['examination.hall.ticket', 'student.id.card']
+
+    def init(self):
+        # Images stored per record before the cache existed are dropped, they are rendered again on demand
+        self.env['ir.attachment'].sudo().search([
+            ('res_model', 'in', self._qr_models),
+            ('res_field', '=', 'qr_code'),
+        ]).unlink()
+
+    @api.model
+    def _get_qr_key(self, payload):
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    @api.model
+    def render_qr_codes(self, payloads):
+        """Render the distinct ``payloads`` and return ``{payload: png bytes}``
+
+        Rendering is in process: building the QR matrix is pure Python and
+        holds the GIL, so a thread pool does not speed it up, and forking a
+        threaded server worker is unsafe. Caching makes every payload a one
+        time cost.
+        """
+        payloads = list(dict.fromkeys(payload for payload in payloads if payload))
+        if not payloads:
+            return {}
+
+        start = time.perf_counter()
+        images = [render_qr_png(payload) for payload in payloads]
+
+        elapsed = time.perf_counter() - start
+        _logger.info(f"Rendered {len(payloads)} QR codes in {elapsed:.2f}s "
+                     f"({len(payloads) / elapsed if elapsed else 0:.0f}/s)")
+        return dict(zip(payloads, images))
+
+    @api.model
+    def get_qr_images(self, payloads):
+        """Return ``{payload: base64 png}``, rendering and caching the missing images"""
+        keys = {payload: self._get_qr_key(payload) for payload in set(payloads) if payload}
+        if not keys:
+            return {}
+
+        cache = self.sudo()
+        entries = {entry.key: entry for entry in cache.search([('key', 'in', list(keys.values()))])}
+        now = fields.Datetime.now()
+
+        stale = cache.browse([entry.id for entry in entries.values()
+                              if not entry.last_used or entry.last_used < now - self._touch_interval])
+        if stale:
+            stale.write({'last_used': now})
+
+        images = {key: entry.image for key, entry in entries.items()}
+        missing = [payload for payload, key in keys.items() if key not in entries]
+        if missing:
+            rendered = {keys[payload]: base64.b64encode(image)
+                        for payload, image in self.render_qr_codes(missing).items()}
+            try:
+                with self.env.cr.savepoint():
+                    cache.create([{'key': key, 'image': image, 'last_used': now} for key, image in rendered.items()])
+            except psycopg2.IntegrityError:
+                # Another transaction cached some of them first, serve ours uncached
+                _logger.info("QR code cache: concurrent insert, images served without caching")
+            images.update(rendered)
+
+        return {payload: images[key] for payload, key in keys.items()}
+
+    @api.model
+    def _find_payload(self, key):
+        """Return the payload hashed to ``key`` among the records the user can read"""
+        for model_name in self._qr_models:
+            if not self.env[model_name].has_access('read'):
+                continue
+            record = self.env[model_name].search([('qr_key', '=', key)], limit=1)
+            if record:
+                return record.qr_data
+        return None
+
+    @api.autovacuum
+    def _gc_least_recently_used(self):
+        size = self.env['ir.config_parameter'].sudo().get_param('university_management.qr_cache_size')
+        try:
+            size = int(size) if size else self._default_cache_size
+        except ValueError:
+            _logger.warning(f"Invalid QR cache size: {size}")
+            size = self._default_cache_size
+        evicted = self.sudo().search([], order='last_used desc, id desc', offset=size)
+        evicted.unlink()
+        _logger.info(f"QR code cache: {len(evicted)} least recently used entries evicted")
+
+    @api.model
+    def benchmark(self, count=1000):
+        """Render ``count`` distinct ID card like payloads and return the throughput"""
+        payloads = [f"ID:BENCH{index:06d}|REG:REG{index:06d}|NAME:Benchmark Student {index}|"
+                    f"PROGRAM:Benchmark Program|VALID:2025-01-01 to 2025-12-31" for index in range(count)]
+        start = time.perf_counter()
+        self.render_qr_codes(payloads)
+        elapsed = time.perf_counter() - start
+        return {
+            'count': count,
+            'seconds': round(elapsed, 3),
+            'cards_per_second': round(count / elapsed, 1) if elapsed else 0.0,
+        }
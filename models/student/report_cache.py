@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+from odoo.http import Stream
+from odoo.tools.pdf import PdfFileReader, PdfFileWriter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import timedelta
+import base64
+import hashlib
+import logging
+import os
+import tempfile
+import time
+import psycopg2
+
+_logger = logging.getLogger(__name__)
+
+
+class UniversityReportCacheMixin(models.AbstractModel):
+    """Drop the cached PDFs of documents as soon as they change
+
+    ``_report_cache_depends`` lists the relational paths of the records the
+    reports print besides the document itself; their last write is part of
+    the cache key, so that a change to them renders the document again.
+    """
+    _name = 'university.report.cache.mixin'
+    _description = 'Rendered Report Cache Mixin'
+
+    _report_cache_depends = []
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env['university.report.cache']._invalidate_records(self)
+        return res
+
+    def unlink(self):
+        self.env['university.report.cache']._invalidate_records(self)
+        return super().unlink()
+
+
+class UniversityReportCache(models.Model):
+    """Rendered PDF cache for portal and bulk document downloads
+
+    One entry per report, language and list of records, keyed on the last
+    write of every record and of the related records it prints, so that any
+    change renders the document again.
+    Entries of a single document also remember it, and are dropped when it
+    is written. Large lists are rendered in chunks by a thread pool, each
+    thread driving its own wkhtmltopdf run on its own cursor, and the chunk
+    files are merged on disk instead of rendering everything in one call.
+
+    The least recently used entries are evicted once the cache grows past
+    ``university_management.report_cache_size`` megabytes.
+    """
+    _name = 'university.report.cache'
+    _description = 'Rendered Report Cache'
+    _rec_name = 'key'
+
+    key = fields.Char(string='Cache Key', required=True, readonly=True)
+    report_ref = fields.Char(string='Report', required=True, readonly=True)
+    res_model = fields.Char(string='Model', readonly=True)
+    res_id = fields.Many2oneReference(string='Document', model_field='res_model', readonly=True, index=True)
+    record_count = fields.Integer(string='Documents', readonly=True)
+    pdf = fields.Binary(string='PDF', attachment=True, readonly=True)
+    file_size = fields.Integer(string='Size (bytes)', readonly=True)
+    last_used = fields.Datetime(string='Last Used', readonly=True, index=True)
+
+    _sql_constraints = [
+        ('key_unique', 'UNIQUE(key)', 'Only one rendered document per report and records!'),
+    ]
+
+    # Records rendered per wkhtmltopdf run
+    _chunk_size = 50
+    # Entries are marked as used at most this often, to keep hits write free
+    _touch_interval = timedelta(days=1)
+    # Entries unused for this many days are dropped
+    _max_age_days = 30
+    # Default cache size in megabytes
+    _default_cache_size = 2048
+
+    @api.model
+    def _get_key(self, report_ref, records):
+        """Digest of the report, language and last write of every record, in order
+
+        Each record also stamps the last write of the records reached through
+        its ``_report_cache_depends`` paths.
+        """
+        depends = getattr(records, '_report_cache_depends', [])
+        stamps = ','.join(
+            ':'.join([str(record.id), str(record.write_date)] + [
+                ';'.join(f'{related.id}@{related.write_date}' for related in record.mapped(path))
+                for path in depends
+            ])
+            for record in records
+        )
+        lang = self.env.context.get('lang') or ''
+        return hashlib.sha1(f'{report_ref}|{lang}|{records._name}|{stamps}'.encode()).hexdigest()
+
+    @api.model
+    def _get_workers(self):
+        workers = self.env['ir.config_parameter'].sudo().get_param('university_management.report_workers')
+        try:
+            return max(int(workers), 1) if workers else min(os.cpu_count() or 1, 4)
+        except ValueError:
+            _logger.warning(f"Invalid report worker count: {workers}")
+            return 1
+
+    @api.model
+    def get_pdf_stream(self, report_ref, records, filename):
+        """Return an ``odoo.http.Stream`` of ``report_ref`` rendered for ``records``
+
+        The PDF is served from the cache when possible, otherwise rendered and
+        stored. It is rendered as superuser: callers check access to
+        ``records`` themselves. The cache key is the stream's ETag, so
+        browsers revalidating an unchanged document get a 304 response.
+        """
+        cache = self.sudo()
+        key = self._get_key(report_ref, records)
+        now = fields.Datetime.now()
+
+        entry = cache.search([('key', '=', key)], limit=1)
+        if not entry:
+            pdf = self._render_pdf(report_ref, records)
+            try:
+                with self.env.cr.savepoint():
+                    entry = cache.create({
+                        'key': key,
+                        'report_ref': report_ref,
+                        'res_model': records._name,
+                        'res_id': records.id if len(records) == 1 else False,
+                        'record_count': len(records),
+                        'pdf': base64.b64encode(pdf),
+                        'file_size': len(pdf),
+                        'last_used': now,
+                    })
+            except psycopg2.IntegrityError:
+                # Another request cached it first, serve ours uncached
+                _logger.info(f"Report cache: concurrent insert for {report_ref}, document served without caching")
+                return Stream(type='data', data=pdf, mimetype='application/pdf',
+                              download_name=filename, size=len(pdf), etag=key)
+        elif not entry.last_used or entry.last_used < now - self._touch_interval:
+            entry.last_used = now
+
+        stream = self.env['ir.binary']._get_stream_from(entry, 'pdf', filename=filename,
+                                                        mimetype='application/pdf')
+        stream.etag = key
+        return stream
+
+    @api.model
+    def _invalidate_records(self, records):
+        """Drop the cached PDFs of ``records``"""
+        if records.ids:
+            self.sudo().search([('res_model', '=', records._name), ('res_id', 'in', records.ids)]).unlink()
+
+    # ==================== RENDERING ====================
+
+    @api.model
+    def _render_pdf(self, report_ref, records):
+        """Render ``records`` in chunks and return the merged PDF"""
+        chunks = [records[index:index + self._chunk_size].ids
+                  for index in range(0, len(records), self._chunk_size)]
+        workers = min(self._get_workers(), len(chunks))
+        start = time.perf_counter()
+
+        with tempfile.TemporaryDirectory(prefix='university_report_') as directory:
+            paths = [os.path.join(directory, f'{index:05d}.pdf') for index in range(len(chunks))]
+            if workers > 1:
+                self._render_chunks_concurrently(report_ref, list(zip(chunks, paths)), workers)
+            else:
+                for res_ids, path in zip(chunks, paths):
+                    self._render_chunk(report_ref, res_ids, path)
+            pdf = self._merge_pdf_files(paths, os.path.join(directory, 'merged.pdf'))
+
+        _logger.info(f"Rendered {report_ref} for {len(records)} records in {len(chunks)} chunks "
+                     f"in {time.perf_counter() - start:.2f}s ({workers} workers)")
+        return pdf
+
+    @api.model
+    def _render_chunk(self, report_ref, res_ids, path):
+        pdf, _report_type = self.env['ir.actions.report'].sudo()._render_qweb_pdf(report_ref, res_ids)
+        with open(path, 'wb') as file:
+            file.write(pdf)
+
+    def _render_chunks_concurrently(self, report_ref, chunks, workers):
+        """Run ``_render_chunk`` for each ``(res_ids, path)`` in a thread pool
+
+        Each thread renders on its own cursor, so only committed data is
+        printed.
+        """
+        registry, uid, context = self.env.registry, self.env.uid, self.env.context
+
+        def render(chunk):
+            res_ids, path = chunk
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                env[self._name]._render_chunk(report_ref, res_ids, path)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results to raise the first rendering error, if any
+            list(executor.map(render, chunks))
+
+    @api.model
+    def _merge_pdf_files(self, paths, merged_path):
+        """Merge the chunk files page by page, reading them from disk"""
+        if len(paths) > 1:
+            writer = PdfFileWriter()
+            with ExitStack() as stack:
+                for path in paths:
+                    reader = PdfFileReader(stack.enter_context(open(path, 'rb')), strict=False)
+                    for page in range(reader.getNumPages()):
+                        writer.addPage(reader.getPage(page))
+                with open(merged_path, 'wb') as file:
+                    writer.write(file)
+        else:
+            merged_path = paths[0]
+
+        with open(merged_path, 'rb') as file:
+            return file.read()
+
+    @api.autovacuum
+    def _gc_unused_entries(self):
+        self.sudo().search([
+            ('last_used', '<', fields.Datetime.now() - timedelta(days=self._max_age_days)),
+        ]).unlink()
+
+    @api.autovacuum
+    def _gc_least_recently_used(self):
+        size = self.env['ir.config_parameter'].sudo().get_param('university_management.report_cache_size')
+        try:
+            size = int(size) if size else self._default_cache_size
+        except ValueError:
+            _logger.warning(f"Invalid report cache size: {size}")
+            size = self._default_cache_size
+
+        # Keep the most recently used entries that fit in the size budget
+        self.env.cr.execute("""
+            SELECT id FROM (
+                SELECT id, SUM(file_size) OVER (ORDER BY last_used DESC NULLS LAST, id DESC) AS total
+                FROM university_report_cache
+            ) entries
+            WHERE total > %s
+        """, [size * 1024 * 1024])
+        evicted = self.sudo().browse([entry_id for entry_id, in self.env.cr.fetchall()])
+        evicted.unlink()
+        _logger.info(f"Report cache: {len(evicted)} least recently used entries evicted")
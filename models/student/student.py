@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
+from collections import defaultdict
 import re
 
 
 class Student(models.Model):
     _name = 'student.student'
     _description = 'University Student Master'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _inherits = {'res.partner': 'partner_id'}
     _order = 'registration_number'
 
@@ -90,6 +92,8 @@ class Student(models.Model):
 
     # ID Card
     id_card_ids = fields.One2many('student.id.card', 'student_id', string='ID Cards')
+    id_card_id = fields.Many2one('student.id.card', string='Current ID Card', compute='_compute_id_card',
+                                 store=True, index=True)
 
     # Parents/Guardians
     parent_ids = fields.One2many('student.parent', 'student_id', string='Parents/Guardians')
@@ -165,26 +169,43 @@ class Student(models.Model):
          'Aadhar Number must be unique!'),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get('student_code', '/') == '/':
-            vals['student_code'] = self.env['ir.sequence'].next_by_code('student.student') or '/'
-        if vals.get('registration_number', '/') == '/':
-            vals['registration_number'] = self.env['ir.sequence'].next_by_code('student.registration') or '/'
-
-        # Create partner if not exists
-        if not vals.get('partner_id'):
-            partner_vals = {
-                'name': vals.get('name'),
-                'email': vals.get('email'),
-                'phone': vals.get('mobile'),
-                'is_company': False,
-                'customer_rank': 0,
-            }
-            partner = self.env['res.partner'].create(partner_vals)
-            vals['partner_id'] = partner.id
-
-        return super(Student, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Sequence numbers are reserved in one block per batch
+        IrSequence = self.env['ir.sequence']
+        for field_name, code in (('student_code', 'student.student'),
+                                 ('registration_number', 'student.registration')):
+            pending = [vals for vals in vals_list if vals.get(field_name, '/') == '/']
+            for vals, number in zip(pending, IrSequence.next_block_by_code(code, len(pending))):
+                vals[field_name] = number or '/'
+
+        # Partners are created in batch through _inherits
+        for vals in vals_list:
+            if not vals.get('partner_id'):
+                if vals.get('mobile'):
+                    vals.setdefault('phone', vals['mobile'])
+                vals.setdefault('is_company', False)
+                vals.setdefault('customer_rank', 0)
+
+        students = super(Student, self).create(vals_list)
+        if any(vals.get('user_id') for vals in vals_list):
+            self.env.registry.clear_cache()
+        return students
+
+    def write(self, vals):
+        # The portal user of a student is cached per worker
+        links = self._get_portal_links() if 'user_id' in vals or 'active' in vals else None
+        result = super().write(vals)
+        if links is not None and links != self._get_portal_links():
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        has_users = any(self.mapped('user_id'))
+        result = super().unlink()
+        if has_users:
+            self.env.registry.clear_cache()
+        return result
 
     @api.depends('date_of_birth')
     def _compute_age(self):
@@ -198,12 +219,13 @@ class Student(models.Model):
             else:
                 record.age = 0
 
-    @api.depends('attendance_ids')
+    @api.depends('attendance_ids', 'attendance_ids.state')
     def _compute_attendance(self):
+        # Counted in the database for every student at once
+        summary = self.env['student.attendance']._get_summary(self._origin.ids)
         for record in self:
-            total = len(record.attendance_ids)
-            present = len(record.attendance_ids.filtered(lambda a: a.state == 'present'))
-            record.attendance_percentage = (present / total * 100) if total > 0 else 0.0
+            counters = summary.get((record._origin.id,))
+            record.attendance_percentage = counters['percentage'] if counters else 0.0
 
     @api.depends('document_ids', 'document_ids.is_verified')
     def _compute_documents(self):
@@ -213,6 +235,12 @@ class Student(models.Model):
             else:
                 record.documents_verified = False
 
+    @api.depends('id_card_ids.state', 'id_card_ids.issue_date')
+    def _compute_id_card(self):
+        for record in self:
+            cards = record.id_card_ids.filtered(lambda c: c.state in ('draft', 'printed', 'issued'))
+            record.id_card_id = cards.sorted(lambda c: (c.issue_date, c.id), reverse=True)[:1]
+
     @api.depends('fee_payment_ids')
     def _compute_fees(self):
         for record in self:
@@ -221,22 +249,30 @@ class Student(models.Model):
                 lambda p: p.state == 'paid').mapped('amount'))
             record.total_fee_due = 0.0  # Calculate from fee structure
 
-    @api.depends('exam_result_ids')
+    @api.depends('exam_result_ids', 'exam_result_ids.state', 'exam_result_ids.credit_points',
+                 'exam_result_ids.is_absent', 'current_semester')
     def _compute_academic_performance(self):
+        Result = self.env['examination.result']
+        # Published credit totals of every student per semester, in one query
+        totals = Result._get_credit_totals(self._origin, ['semester_id'])
+        semester_numbers = {
+            semester.id: semester.semester_number
+            for semester in self.env['university.semester'].browse({key[1] for key in totals if key[1]})
+        }
+
+        cumulative = defaultdict(lambda: [0.0, 0])
+        current = defaultdict(lambda: [0.0, 0])
+        current_semesters = {record._origin.id: record.current_semester for record in self}
+        for (student_id, semester_id), (credit_points, credits) in totals.items():
+            cumulative[student_id][0] += credit_points
+            cumulative[student_id][1] += credits
+            if semester_id and semester_numbers[semester_id] == current_semesters.get(student_id):
+                current[student_id][0] += credit_points
+                current[student_id][1] += credits
+
         for record in self:
-            results = record.exam_result_ids.filtered(lambda r: r.state == 'published')
-            if results:
-                record.cgpa = sum(results.mapped('grade_point')) / len(results)
-                current_sem_results = results.filtered(
-                    lambda r: r.semester_id.semester_number == record.current_semester
-                )
-                if current_sem_results:
-                    record.sgpa = sum(current_sem_results.mapped('grade_point')) / len(current_sem_results)
-                else:
-                    record.sgpa = 0.0
-            else:
-                record.cgpa = 0.0
-                record.sgpa = 0.0
+            record.cgpa = Result._get_grade_point_average(*cumulative[record._origin.id])
+            record.sgpa = Result._get_grade_point_average(*current[record._origin.id])
 
     @api.constrains('aadhar_number')
     def _check_aadhar(self):
@@ -272,6 +308,41 @@ class Student(models.Model):
             })
             self.user_id = user.id
 
+    # ==================== PORTAL ====================
+
+    def _get_portal_links(self):
+        """Portal user and active flag of the records linked to a user, as seen by the resolver"""
+        return [(record.user_id.id, record.active) if record.user_id else False for record in self]
+
+    @api.model
+    def _get_current_student(self):
+        """Student of the current user, resolved through a per-worker cache"""
+        return self.browse(self._get_student_id_for_user(self.env.uid))
+
+    @api.model
+    @tools.ormcache('uid')
+    def _get_student_id_for_user(self, uid):
+        return self.sudo().search([('user_id', '=', uid)], limit=1).id
+
+    def _get_portal_counters(self):
+        """Portal home counters of the student, counted side by side in one query"""
+        self.ensure_one()
+        counters = {
+            'fee_count': ('fee.payment', [('student_id', '=', self.id)]),
+            'fee_due_count': ('fee.payment', [('student_id', '=', self.id), ('state', '=', 'pending')]),
+            'attendance_count': ('student.attendance', [('student_id', '=', self.id)]),
+            'result_count': ('examination.result', [('student_id', '=', self.id)]),
+            'library_issue_count': ('library.issue', [
+                ('member_id', '=', self.library_member_id.id),
+                ('state', 'in', ['issued', 'overdue']),
+            ]),
+        }
+        [row] = self.env.execute_query(SQL("SELECT %s", SQL(", ").join(
+            SQL("(%s)", self.env[model_name]._search(domain).select(SQL("COUNT(*)")))
+            for model_name, domain in counters.values()
+        )))
+        return dict(zip(counters, row))
+
     def action_student_attendance(self):
         """Open student attendance records"""
         self.ensure_one()
@@ -322,4 +393,3 @@ class Student(models.Model):
             'domain': [('student_id', '=', self.id)],
             'context': {'default_student_id': self.id},
         }
-
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class StudentAdmission(models.Model):
     _name = 'student.admission'
     _description = 'Student Admission Process'
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'university.dashboard.cache.mixin']
     _order = 'application_date desc'
 
     name = fields.Char(string='Application Number', required=True, readonly=True,
@@ -137,11 +137,12 @@ class StudentAdmission(models.Model):
         ('name_unique', 'unique(name)', 'Application Number must be unique!'),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get('name', '/') == '/':
-            vals['name'] = self.env['ir.sequence'].next_by_code('student.admission') or '/'
-        return super(StudentAdmission, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        pending = [vals for vals in vals_list if vals.get('name', '/') == '/']
+        for vals, number in zip(pending, self.env['ir.sequence'].next_block_by_code('student.admission', len(pending))):
+            vals['name'] = number or '/'
+        return super(StudentAdmission, self).create(vals_list)
 
     @api.depends('document_ids', 'document_ids.is_verified')
     def _compute_documents_verified(self):
@@ -304,11 +305,14 @@ class StudentAdmission(models.Model):
             template.send_mail(self.id, force_send=True)
 
     def _send_approval_notification(self):
-        """Send approval notification"""
+        """Send approval notification
+
+        A single approval is sent right away; batches go through the mail queue.
+        """
         template = self.env.ref('university_management.email_template_application_approved',
                                 raise_if_not_found=False)
-        if template:
-            template.send_mail(self.id, force_send=True)
+        if template and self:
+            template.send_mail_batch(self.ids, force_send=len(self) == 1)
 
     def _send_rejection_notification(self):
         """Send rejection notification"""
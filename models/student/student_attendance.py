@@ -2,14 +2,18 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from collections import defaultdict
 
 
 class StudentAttendance(models.Model):
     _name = 'student.attendance'
     _description = 'Student Attendance Tracking'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.attendance.daily.mixin']
     _order = 'date desc, student_id'
 
+    # Changes to these fields refresh the daily attendance summary
+    _attendance_summary_fields = ['student_id', 'date', 'state']
+
     name = fields.Char(string='Reference', compute='_compute_name', store=True)
 
     # Student
@@ -74,6 +78,39 @@ class StudentAttendance(models.Model):
             if record.time_in and record.time_out and record.time_out <= record.time_in:
                 raise ValidationError(_('Time Out must be after Time In!'))
 
+    # ==================== SUMMARY ====================
+
+    @api.model
+    def _get_summary(self, student_ids, groupby=(), domain=None):
+        """Attendance counters of students, from one grouped query
+
+        Returns ``{(student id, *groupby values): counters}`` where counters
+        hold the ``present``, ``absent``, ``late`` and ``total`` counts and the
+        ``percentage`` of classes attended. Only the groups that have
+        attendance are returned. Record rules apply, so portal users only
+        count what they can read.
+        """
+        groups = self._read_group(
+            [('student_id', 'in', list(student_ids))] + (domain or []),
+            ['student_id', *groupby, 'state'], ['__count'])
+
+        summary = defaultdict(lambda: dict.fromkeys(['present', 'absent', 'late', 'total'], 0))
+        for student, *keys, state, count in groups:
+            counters = summary[(student.id, *keys)]
+            counters['total'] += count
+            if state in counters:
+                counters[state] += count
+
+        for counters in summary.values():
+            counters['percentage'] = counters['present'] / counters['total'] * 100 if counters['total'] else 0.0
+        return dict(summary)
+
+    @api.model
+    def _get_subject_summary(self, student, domain=None):
+        """Return ``{subject name: counters}`` of one student, see ``_get_summary``"""
+        summary = self._get_summary(student.ids, ['subject_id'], domain)
+        return {subject.name: counters for (student_id, subject), counters in summary.items()}
+
     def action_print_receipt(self):
         """Print Attendance report"""
         self.write({'receipt_printed': True})
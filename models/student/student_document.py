@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class StudentDocument(models.Model):
     _name = 'student.document'
     _description = 'Student Document Verification (Aadhaar, TC, etc.)'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'sequence, name'
 
     name = fields.Char(string='Document Name', required=True, tracking=True)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
 
 
@@ -76,6 +76,28 @@ class StudentParent(models.Model):
     # Notes
     notes = fields.Text(string='Notes')
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        parents = super().create(vals_list)
+        if any(vals.get('user_id') for vals in vals_list):
+            self.env.registry.clear_cache()
+        return parents
+
+    def write(self, vals):
+        # The parent records of a portal user are cached per worker
+        links = self._get_portal_links() if 'user_id' in vals or 'active' in vals else None
+        result = super().write(vals)
+        if links is not None and links != self._get_portal_links():
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        has_users = any(self.mapped('user_id'))
+        result = super().unlink()
+        if has_users:
+            self.env.registry.clear_cache()
+        return result
+
     @api.depends('user_id')
     def _compute_portal_access(self):
         for record in self:
@@ -105,3 +127,22 @@ class StudentParent(models.Model):
                 'groups_id': [(6, 0, [self.env.ref('base.group_portal').id])],
             })
             self.user_id = user.id
+
+    # ==================== PORTAL ====================
+
+    def _get_portal_links(self):
+        """Portal user and active flag of the records linked to a user, as seen by the resolver"""
+        return [(record.user_id.id, record.active) if record.user_id else False for record in self]
+
+    @api.model
+    def _get_current_parents(self):
+        """Parent records of the current user, one per linked student
+
+        Resolved through a per-worker cache.
+        """
+        return self.browse(self._get_parent_ids_for_user(self.env.uid))
+
+    @api.model
+    @tools.ormcache('uid')
+    def _get_parent_ids_for_user(self, uid):
+        return tuple(self.sudo().search([('user_id', '=', uid)]).ids)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+
+
+class StudentPromotion(models.Model):
+    _name = 'student.promotion'
+    _description = 'Student Promotion History'
+    _order = 'promotion_date desc, id desc'
+
+    # Student
+    student_id = fields.Many2one('student.student', string='Student',
+                                 required=True, index=True, ondelete='cascade')
+    registration_number = fields.Char(related='student_id.registration_number',
+                                      string='Registration Number')
+    program_id = fields.Many2one(related='student_id.program_id', string='Program', store=True)
+
+    # Promotion
+    from_semester = fields.Integer(string='From Semester')
+    to_semester = fields.Integer(string='To Semester')
+    from_batch_id = fields.Many2one('university.batch', string='From Batch')
+    to_batch_id = fields.Many2one('university.batch', string='To Batch')
+    academic_year_id = fields.Many2one('university.academic.year', string='Academic Year')
+    promotion_date = fields.Date(string='Promotion Date', default=fields.Date.today, required=True)
+    promotion_type = fields.Selection([
+        ('semester', 'Next Semester'),
+        ('year', 'Next Year'),
+        ('graduate', 'Graduated'),
+    ], string='Promotion Type', required=True, default='semester')
+
+    # Status
+    state = fields.Selection([
+        ('promoted', 'Promoted'),
+        ('reverted', 'Reverted'),
+    ], string='Status', default='promoted')
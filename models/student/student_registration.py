@@ -57,11 +57,12 @@ class StudentRegistration(models.Model):
         ('name_unique', 'unique(name)', 'Registration Number must be unique!'),
     ]
 
-    @api.model
-    def create(self, vals):
-        if vals.get('name', '/') == '/':
-            vals['name'] = self.env['ir.sequence'].next_by_code('student.registration') or '/'
-        return super(StudentRegistration, self).create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        pending = [vals for vals in vals_list if vals.get('name', '/') == '/']
+        for vals, number in zip(pending, self.env['ir.sequence'].next_block_by_code('student.registration', len(pending))):
+            vals['name'] = number or '/'
+        return super(StudentRegistration, self).create(vals_list)
 
     @api.depends('course_ids', 'course_ids.credits')
     def _compute_credits(self):
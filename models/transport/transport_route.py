@@ -6,7 +6,7 @@ from odoo import models, fields, api, _
 class TransportRoute(models.Model):
     _name = 'transport.route'
     _description = 'Transport Bus Routes'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'name'
 
     name = fields.Char(string='Route Name', required=True, tracking=True)
@@ -7,7 +7,7 @@ from odoo.exceptions import ValidationError
 class TransportVehicle(models.Model):
     _name = 'transport.vehicle'
     _description = 'Transport Vehicle/Bus Management'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'university.dashboard.cache.mixin']
     _order = 'name'
 
     name = fields.Char(string='Vehicle Name', required=True, tracking=True)
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+from . import test_dashboard_statistics
+from . import test_dashboard_cache
+from . import test_attendance_summary
+from . import test_fee_reminder_benchmark
+from . import test_result_publication
+from . import test_exam_seating
+from . import test_exam_seating_benchmark
+from . import test_dashboard_analytics
+from . import test_id_card_generation
+from . import test_report_cache
+from . import test_grade_point_average
+from . import test_qr_code_benchmark
+from . import test_qr_code_route
+from . import test_portal_resolver
+from . import test_bulk_admission
+from . import test_grade_lookup
+from . import test_hall_ticket_generation
+from . import test_student_promotion
+from . import test_kpi_timeseries
+from . import test_dashboard_widgets
+from . import test_attendance_counts
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date, timedelta
+
+from odoo import fields
+from odoo.tests.common import TransactionCase
+
+
+class UniversityTestCommon(TransactionCase):
+    """Academic structure shared by the module tests"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        today = fields.Date.today()
+
+        cls.department = cls.env['university.department'].create({
+            'name': 'Computer Science',
+            'code': 'TCS',
+        })
+        cls.program = cls.env['university.program'].create({
+            'name': 'B.Tech Computer Science',
+            'code': 'TBTCS',
+            'program_type': 'undergraduate',
+            'department_id': cls.department.id,
+        })
+        cls.academic_year = cls.env['university.academic.year'].create({
+            'name': 'Test Year',
+            'code': 'TY',
+            'start_date': today.replace(month=1, day=1),
+            'end_date': today.replace(month=12, day=31),
+        })
+        cls.semester = cls.env['university.semester'].create({
+            'name': 'Semester 1',
+            'code': 'TS1',
+            'academic_year_id': cls.academic_year.id,
+            'semester_number': 1,
+            'start_date': today.replace(month=1, day=1),
+            'end_date': today.replace(month=12, day=31),
+        })
+        cls.subject = cls.env['university.subject'].create({
+            'name': 'Data Structures',
+            'code': 'TDS',
+            'department_id': cls.department.id,
+            'credits': 4,
+        })
+        cls.course = cls.env['university.course'].create({
+            'name': 'Data Structures',
+            'code': 'TDS101',
+            'program_id': cls.program.id,
+            'department_id': cls.department.id,
+            'semester_id': cls.semester.id,
+            'academic_year_id': cls.academic_year.id,
+            'subject_id': cls.subject.id,
+            'credits': 4,
+            'total_hours': 60,
+        })
+
+    @classmethod
+    def _create_students(cls, count, **values):
+        """Create ``count`` students of the test program"""
+        return cls.env['student.student'].create([dict({
+            'name': f'Test Student {index}',
+            'date_of_birth': date(2004, 1, 1),
+            'gender': 'male',
+            'program_id': cls.program.id,
+            'department_id': cls.department.id,
+            'academic_year_id': cls.academic_year.id,
+            'state': 'enrolled',
+        }, **values) for index in range(count)])
+
+    @classmethod
+    def _create_examination(cls, **values):
+        today = fields.Date.today()
+        return cls.env['examination.examination'].create(dict({
+            'name': 'Test Examination',
+            'code': 'TEX',
+            'academic_year_id': cls.academic_year.id,
+            'semester_id': cls.semester.id,
+            'start_date': today,
+            'end_date': today + timedelta(days=7),
+        }, **values))
+
+    @classmethod
+    def _create_results(cls, examination, students, **values):
+        """Create one result per student for the test course"""
+        return cls.env['examination.result'].create([dict({
+            'student_id': student.id,
+            'examination_id': examination.id,
+            'course_id': cls.course.id,
+            'internal_marks': 20,
+            'external_marks': 50,
+        }, **values) for student in students])
+
+    @classmethod
+    def _create_hall_tickets(cls, examination, students, **values):
+        """Create one issued hall ticket per student"""
+        return cls.env['examination.hall.ticket'].create([dict({
+            'student_id': student.id,
+            'examination_id': examination.id,
+            'state': 'issued',
+        }, **values) for student in students])
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceCounts(UniversityTestCommon):
+    """Attendance counters per student and subject come from one grouped query"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Attendance = cls.env['student.attendance']
+        cls.today = fields.Date.today()
+        cls.students = cls._create_students(3)
+        cls.lab_subject = cls.env['university.subject'].create({
+            'name': 'Algorithms Lab',
+            'code': 'TAL',
+            'department_id': cls.department.id,
+            'credits': 2,
+        })
+        cls.lab_course = cls.env['university.course'].create({
+            'name': 'Algorithms Lab',
+            'code': 'TAL101',
+            'program_id': cls.program.id,
+            'department_id': cls.department.id,
+            'semester_id': cls.semester.id,
+            'academic_year_id': cls.academic_year.id,
+            'subject_id': cls.lab_subject.id,
+            'credits': 2,
+        })
+        # Five days of lectures and labs; the third student has no attendance
+        states = ['present', 'absent', 'late', 'on_leave', 'present']
+        cls.Attendance.create([{
+            'student_id': student.id,
+            'course_id': course.id,
+            'date': cls.today - timedelta(days=day),
+            'state': state if student == cls.students[0] or course == cls.lab_course else 'present',
+        } for student in cls.students[:2] for course in (cls.course, cls.lab_course)
+            for day, state in enumerate(states)])
+
+    def _expected(self, domain, key):
+        """Counters built from the attendance rows, as the portal used to"""
+        expected = {}
+        for attendance in self.Attendance.search(domain):
+            counters = expected.setdefault(key(attendance), Counter())
+            counters['total'] += 1
+            counters[attendance.state] += 1
+        return {
+            group: {
+                'present': counters['present'],
+                'absent': counters['absent'],
+                'late': counters['late'],
+                'total': counters['total'],
+                'percentage': counters['present'] / counters['total'] * 100,
+            } for group, counters in expected.items()
+        }
+
+    def test_summary_per_student(self):
+        summary = self.Attendance._get_summary(self.students.ids)
+        self.assertEqual(summary, self._expected(
+            [('student_id', 'in', self.students.ids)], lambda attendance: (attendance.student_id.id,)))
+        self.assertNotIn((self.students[2].id,), summary)
+        self.assertEqual(summary[(self.students[1].id,)]['present'], 7)
+        self.assertEqual(summary[(self.students[1].id,)]['total'], 10)
+
+    def test_summary_per_subject_and_period(self):
+        domain = [('date', '>=', self.today - timedelta(days=2))]
+        summary = self.Attendance._get_summary(self.students.ids, ['subject_id'], domain)
+        self.assertEqual(summary, self._expected(
+            [('student_id', 'in', self.students.ids)] + domain,
+            lambda attendance: (attendance.student_id.id, attendance.subject_id)))
+
+        subjects = self.Attendance._get_subject_summary(self.students[0])
+        self.assertEqual(set(subjects), {self.subject.name, self.lab_subject.name})
+        self.assertEqual(subjects[self.lab_subject.name], {
+            'present': 2, 'absent': 1, 'late': 1, 'total': 5, 'percentage': 40.0})
+
+    def test_summary_runs_one_query(self):
+        self.env.flush_all()
+        with self.assertQueryCount(1):
+            self.Attendance._get_summary(self.students.ids, ['subject_id'])
+
+    def test_student_percentage_follows_state(self):
+        student = self.students[1]
+        self.assertAlmostEqual(student.attendance_percentage, 70.0)
+        attendance = self.Attendance.search([('student_id', '=', student.id), ('state', '=', 'late')])
+        attendance.state = 'present'
+        self.assertAlmostEqual(student.attendance_percentage, 80.0)
+        self.assertEqual(self.students[2].attendance_percentage, 0.0)
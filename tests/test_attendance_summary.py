@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestAttendanceSummary(UniversityTestCommon):
+    """The incremental rollup must match a rebuild from the raw attendance"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Summary = cls.env['university.attendance.daily']
+        cls.students = cls._create_students(3)
+        cls.today = fields.Date.today()
+        cls.yesterday = cls.today - timedelta(days=1)
+
+    def _snapshot(self):
+        self.env.flush_all()
+        self.env.cr.execute("""
+            SELECT date, program_id, batch_id, department_id,
+                   present_count, absent_count, late_count, total_count
+            FROM university_attendance_daily
+            WHERE member_type = 'student' AND total_count != 0
+            ORDER BY 1, 2, 3, 4
+        """)
+        return self.env.cr.fetchall()
+
+    def _assertMatchesRebuild(self):
+        incremental = self._snapshot()
+        self.Summary._rebuild('student')
+        self.assertEqual(incremental, self._snapshot())
+
+    def _mark(self, states, date):
+        return self.env['student.attendance'].create([{
+            'student_id': student.id,
+            'course_id': self.course.id,
+            'date': date,
+            'state': state,
+        } for student, state in zip(self.students, states)])
+
+    def test_create_applies_delta(self):
+        self._mark(['present', 'absent', 'late'], self.today)
+        self._mark(['present', 'present', 'absent'], self.yesterday)
+        totals = self.Summary.get_daily_totals(self.yesterday, self.today)
+        self.assertEqual(totals[self.today], {'present': 1, 'absent': 1, 'late': 1, 'total': 3})
+        self.assertEqual(totals[self.yesterday], {'present': 2, 'absent': 1, 'late': 0, 'total': 3})
+        self._assertMatchesRebuild()
+
+    def test_write_and_unlink_apply_delta(self):
+        attendances = self._mark(['present', 'absent', 'late'], self.today)
+        attendances[1].write({'state': 'present'})
+        attendances[2].write({'date': self.yesterday})
+        attendances[0].write({'state': 'on_leave'})
+        self.assertEqual(self.Summary.get_daily_totals(self.today, self.today)[self.today],
+                         {'present': 1, 'absent': 0, 'late': 0, 'total': 2})
+        self._assertMatchesRebuild()
+
+        attendances[:2].unlink()
+        self.assertEqual(self.Summary.get_daily_totals(self.today, self.today)[self.today]['total'], 0)
+        self._assertMatchesRebuild()
+
+    def test_count_attendance(self):
+        self._mark(['present', 'absent', 'late'], self.today)
+        self._mark(['present', 'present', 'absent'], self.yesterday)
+        Attendance = self.env['student.attendance']
+        for domain in (
+            [],
+            [('state', '=', 'present')],
+            [('date', '=', self.today), ('state', 'in', ['absent', 'late'])],
+            [('program_id', '=', self.program.id), ('date', '>=', self.yesterday)],
+        ):
+            self.assertEqual(self.Summary._count_attendance('student.attendance', domain),
+                             Attendance.search_count(domain), domain)
+        self.assertIsNone(self.Summary._count_attendance('student.attendance', [('course_id', '=', self.course.id)]))
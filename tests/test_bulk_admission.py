@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import csv
+import io
+
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestBulkAdmission(UniversityTestCommon):
+    """The bulk admission importer creates, rejects and approves row by row"""
+
+    _header = [
+        'name', 'email', 'mobile', 'date_of_birth', 'gender', 'previous_qualification', 'previous_school',
+        'previous_board', 'previous_percentage', 'previous_year', 'address', 'father_name', 'mother_name',
+        'aadhar_number',
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        start = cls.academic_year.start_date.year
+        cls.batch = cls.env['university.batch'].create({
+            'name': 'Test Batch',
+            'code': 'TB',
+            'program_id': cls.program.id,
+            'start_year': start,
+            'end_year': start + 4,
+        })
+        cls.Admission = type(cls.env['student.admission'])
+
+    def _row(self, index, **values):
+        return dict({
+            'name': f'Applicant {index}',
+            'email': f'applicant{index}@example.com',
+            'mobile': f'98765{index:05d}',
+            'date_of_birth': '2005-06-15',
+            'gender': 'F' if index % 2 else 'M',
+            'previous_qualification': 'HSC',
+            'previous_school': 'Test School',
+            'previous_board': 'State Board',
+            'previous_percentage': '82.5',
+            'previous_year': '2023',
+            'address': 'Test Street',
+            'father_name': 'Father',
+            'mother_name': 'Mother',
+            'aadhar_number': f'1234 5678 {index:04d}',
+        }, **values)
+
+    def _import(self, rows, **values):
+        stream = io.StringIO()
+        writer = csv.DictWriter(stream, fieldnames=self._header)
+        writer.writeheader()
+        writer.writerows(rows)
+        wizard = self.env['bulk.admission.wizard'].create(dict({
+            'import_file': base64.b64encode(stream.getvalue().encode()),
+            'filename': 'admissions.csv',
+            'file_type': 'csv',
+            'program_id': self.program.id,
+            'department_id': self.department.id,
+            'batch_id': self.batch.id,
+            'academic_year_id': self.academic_year.id,
+            'send_email': False,
+        }, **values))
+        wizard.action_import_admissions()
+        return wizard
+
+    def _report(self, wizard):
+        report = base64.b64decode(wizard.result_file).decode()
+        return {int(line['Row']): line for line in csv.DictReader(io.StringIO(report))}
+
+    def test_import_rows(self):
+        self.patch(type(self.env['bulk.admission.wizard']), '_import_chunk_size', 2)
+        wizard = self._import([self._row(index) for index in range(5)])
+        self.assertEqual(wizard.state, 'done')
+        self.assertEqual(wizard.imported_count, 5)
+        self.assertEqual(wizard.error_count, 0)
+        admissions = wizard.admission_ids
+        self.assertEqual(sorted(admissions.mapped('applicant_name')), [f'Applicant {index}' for index in range(5)])
+        self.assertEqual(set(admissions.mapped('state')), {'draft'})
+        self.assertEqual(admissions.student_id.batch_id, self.batch)
+        self.assertEqual(admissions.filtered(lambda a: a.applicant_name == 'Applicant 1').gender, 'female')
+        self.assertEqual(sorted(self._report(wizard)), [2, 3, 4, 5, 6])
+
+    def test_invalid_and_duplicate_rows(self):
+        """Bad rows are reported on their own and do not reject the others"""
+        self._create_students(1, email='taken@example.com')
+        wizard = self._import([
+            self._row(0),
+            self._row(1, email='APPLICANT0@example.com', aadhar_number=''),
+            self._row(2, aadhar_number='1234 5678 0000'),
+            self._row(3, email='taken@example.com'),
+            self._row(4, date_of_birth='not a date'),
+            self._row(5, mother_name=''),
+            self._row(6),
+        ])
+        self.assertEqual(wizard.imported_count, 2)
+        self.assertEqual(wizard.error_count, 5)
+        self.assertEqual(sorted(wizard.admission_ids.mapped('applicant_name')), ['Applicant 0', 'Applicant 6'])
+
+        report = self._report(wizard)
+        self.assertEqual([line['Status'] for _row, line in sorted(report.items())],
+                         ['imported', 'error', 'error', 'error', 'error', 'error', 'imported'])
+        self.assertIn('Duplicate email', report[3]['Message'])
+        self.assertIn('Duplicate Aadhar', report[4]['Message'])
+        self.assertIn('Duplicate email', report[5]['Message'])
+        self.assertIn('date of birth', report[6]['Message'])
+        self.assertIn('mother_name', report[7]['Message'])
+
+    def test_auto_approve_uses_approval_flow(self):
+        """Auto-approval goes through ``action_approve``, once per chunk"""
+        action_approve = self.Admission.action_approve
+        approved = []
+
+        def _action_approve(admissions):
+            approved.append(admissions)
+            return action_approve(admissions)
+
+        self.patch(self.Admission, 'action_approve', _action_approve)
+        self.patch(type(self.env['bulk.admission.wizard']), '_import_chunk_size', 2)
+        wizard = self._import([self._row(index) for index in range(3)], auto_approve=True)
+        self.assertEqual([len(admissions) for admissions in approved], [2, 1])
+        self.assertEqual(set(wizard.admission_ids.mapped('state')), {'approved'})
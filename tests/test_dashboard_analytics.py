@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+from odoo import Command
+from odoo.exceptions import AccessError
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardAnalytics(UniversityTestCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Users = cls.env['res.users'].with_context(no_reset_password=True)
+        cls.admin_user = Users.create({
+            'name': 'Analytics Admin',
+            'login': 'analytics_admin',
+            'groups_id': [Command.set([cls.env.ref('university_management.group_university_admin').id])],
+        })
+        cls.internal_user = Users.create({
+            'name': 'Analytics Employee',
+            'login': 'analytics_employee',
+            'groups_id': [Command.set([cls.env.ref('base.group_user').id])],
+        })
+        cls.portal_user = Users.create({
+            'name': 'Analytics Portal',
+            'login': 'analytics_portal',
+            'groups_id': [Command.set([cls.env.ref('base.group_portal').id])],
+        })
+        cls.group = cls.env['res.groups'].create({'name': 'Analytics Readers'})
+
+        Analytics = cls.env['university.dashboard.analytics']
+        cls.model_analytics = Analytics.create({
+            'name': 'Students per Program',
+            'code': 'test_students_per_program',
+            'category': 'student',
+            'model_name': 'student.student',
+            'groupby': 'program_id',
+        })
+        cls.sql_analytics = Analytics.create({
+            'name': 'Students (SQL)',
+            'code': 'test_students_sql',
+            'category': 'student',
+            'query': 'SELECT state, COUNT(*) FROM student_student GROUP BY state',
+            'is_public': True,
+        })
+
+    def test_denied_by_default(self):
+        """Without groups nor ``is_public`` only administrators may run an analytics"""
+        self.assertTrue(self.model_analytics._can_run(self.admin_user))
+        self.assertFalse(self.model_analytics._can_run(self.internal_user))
+        with self.assertRaises(AccessError):
+            self.model_analytics.with_user(self.internal_user).get_analytics_data()
+        with self.assertRaises(AccessError):
+            self.model_analytics.with_user(self.internal_user).export_csv()
+
+    def test_groups_and_public(self):
+        self.model_analytics.group_ids = self.group
+        self.assertFalse(self.model_analytics._can_run(self.internal_user))
+        self.internal_user.groups_id = [Command.link(self.group.id)]
+        self.assertTrue(self.model_analytics._can_run(self.internal_user))
+
+        self.model_analytics.write({'group_ids': [Command.clear()], 'is_public': True})
+        self.assertTrue(self.model_analytics._can_run(self.internal_user))
+
+    def test_internal_users_only(self):
+        """Portal users are denied even when they belong to the analytics groups"""
+        self.model_analytics.write({'group_ids': [Command.set(self.portal_user.groups_id.ids)], 'is_public': True})
+        self.assertFalse(self.model_analytics._can_run(self.portal_user))
+        self.assertFalse(self.model_analytics._can_run(self.env.ref('base.public_user')))
+
+    def test_sql_reserved_to_admins(self):
+        self.sql_analytics.group_ids = self.group
+        self.internal_user.groups_id = [Command.link(self.group.id)]
+        self.assertFalse(self.sql_analytics._can_run(self.internal_user))
+        self.assertTrue(self.sql_analytics._can_run(self.admin_user))
+        with self.assertRaises(AccessError):
+            self.sql_analytics.with_user(self.internal_user).get_analytics_data()
+
+    def test_cache_per_user_context(self):
+        """Cached model analytics are not shared across users, companies or languages"""
+        Analytics = type(self.model_analytics)
+        runs = []
+
+        def _get_model_analytics(analytics, params, limit=None):
+            runs.append(analytics.env.uid)
+            return analytics._format_result(['User'], [[analytics.env.uid]])
+
+        self.patch(Analytics, '_get_model_analytics', _get_model_analytics)
+        self.model_analytics.is_public = True
+
+        as_admin = self.model_analytics.with_user(self.admin_user).sudo()
+        as_employee = self.model_analytics.with_user(self.internal_user).sudo()
+        self.assertEqual(as_admin.get_analytics_data()['rows'], [[self.admin_user.id]])
+        self.assertEqual(as_employee.get_analytics_data()['rows'], [[self.internal_user.id]])
+        self.assertEqual(as_admin.get_analytics_data()['rows'], [[self.admin_user.id]])
+        self.assertEqual(runs, [self.admin_user.id, self.internal_user.id])
+
+        Cache = self.env['university.dashboard.analytics.cache']
+        params = {'date_from': None, 'date_to': None}
+        key = Cache.with_user(self.admin_user)._get_key(params)
+        self.assertEqual(key, Cache.with_user(self.admin_user)._get_key(dict(params)))
+        self.assertNotEqual(key, Cache.with_user(self.internal_user)._get_key(params))
+        self.env['res.lang']._activate_lang('fr_FR')
+        self.assertNotEqual(key, Cache.with_user(self.admin_user).with_context(lang='fr_FR')._get_key(params))
+        company = self.env['res.company'].create({'name': 'Second Campus'})
+        self.admin_user.write({'company_ids': [Command.link(company.id)]})
+        self.assertNotEqual(key, Cache.with_user(self.admin_user).with_context(
+            allowed_company_ids=[self.admin_user.company_id.id, company.id])._get_key(params))
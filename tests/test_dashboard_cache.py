@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from odoo import fields, models
+from odoo.tests import tagged
+from psycopg2.errors import SerializationFailure
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardCache(UniversityTestCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Cache = cls.env['university.dashboard.cache']
+        cls.Statistics = cls.env['university.dashboard.statistics']
+        cls.students = cls._create_students(2)
+
+    def _pending_sections(self):
+        pending = self.env.cr.postcommit.data.get('university_dashboard_cache.sections')
+        return pending['sections'] if pending else set()
+
+    def test_section_models_cover_queries(self):
+        """Every model a section builder queries is one of its dependencies"""
+        queried = set()
+        search = models.BaseModel._search
+
+        def _search(model, *args, **kwargs):
+            queried.add(model._name)
+            return search(model, *args, **kwargs)
+
+        self.env.flush_all()
+        self.patch(models.BaseModel, '_search', _search)
+        for section, method in self.Statistics._dashboard_sections:
+            queried.clear()
+            getattr(self.Statistics, method)()
+            self.assertLessEqual(queried, set(self.Statistics._section_models[section]), section)
+
+    def test_write_invalidates_section(self):
+        self.env.cr.postcommit.clear()
+        self.students[0].write({'gender': 'female'})
+        self.assertLessEqual(
+            {'overview', 'academic', 'student', 'fee', 'placement', 'alerts'}, self._pending_sections())
+
+        self.env.cr.postcommit.clear()
+        examination = self._create_examination()
+        self._create_results(examination, self.students)
+        self.assertLessEqual({'examination', 'recent_activities', 'upcoming_events'}, self._pending_sections())
+        self.assertNotIn('library', self._pending_sections())
+
+    def test_attendance_invalidates_section(self):
+        """Attendance reaches the dashboard through the daily rollup"""
+        self.env.cr.postcommit.clear()
+        self.env['university.attendance.daily'].action_rebuild_all()
+        self.assertLessEqual({'attendance', 'faculty'}, self._pending_sections())
+
+    def test_mixin_restricted_to_section_models(self):
+        section_models = set().union(*self.Statistics._section_models.values())
+        inheriting = set(self.env['university.dashboard.cache.mixin']._inherit_children)
+        self.assertLessEqual(inheriting, section_models)
+        self.assertNotIn('student.attendance', inheriting)
+
+    def test_raw_attendance_invalidates_through_rollup(self):
+        self.env.cr.postcommit.clear()
+        self.env['student.attendance'].create({
+            'student_id': self.students[0].id,
+            'course_id': self.course.id,
+            'date': fields.Date.today(),
+            'state': 'present',
+        })
+        self.assertEqual({'attendance', 'faculty'}, self._pending_sections())
+
+    def test_concurrent_store_is_tolerated(self):
+        """A serialization failure on the upsert serves the section uncached"""
+        execute = type(self.env.cr).execute
+
+        def _execute(cr, query, *args, **kwargs):
+            if 'INSERT INTO university_dashboard_cache' in str(query):
+                raise SerializationFailure('could not serialize access due to concurrent update')
+            return execute(cr, query, *args, **kwargs)
+
+        self.patch(type(self.env.cr), 'execute', _execute)
+        expected = json.loads(json.dumps(self.Statistics._get_student_statistics(), default=str))
+        self.assertEqual(self.Cache._get_section('student'), expected)
+        self.assertFalse(self.Cache.search([('section', '=', 'student')]))
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardStatistics(UniversityTestCommon):
+    """The grouped engine must return what per-record counting returns"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Statistics = cls.env['university.dashboard.statistics']
+        cls._create_students(3, current_semester=1)
+        cls._create_students(2, gender='female', current_semester=4)
+        cls._create_students(1, current_semester=8)
+        cls._create_students(2, state='graduated', current_semester=8)
+        cls._create_students(1, state='suspended', gender='other')
+
+        structure = cls.env['fee.structure'].create({
+            'name': 'Tuition',
+            'code': 'TTUI',
+            'program_id': cls.program.id,
+            'academic_year_id': cls.academic_year.id,
+        })
+        today = fields.Date.today()
+        enrolled = cls.env['student.student'].search([('state', '=', 'enrolled')])
+        cls.env['fee.payment'].create([{
+            'student_id': student.id,
+            'fee_structure_id': structure.id,
+            'amount': 1000,
+            'state': 'pending',
+            'payment_method': method,
+            'due_date': today - timedelta(days=days),
+        } for student, method, days in zip(enrolled, ['cash', 'online', 'cheque', 'cash'], [5, 5, -5, 1])])
+
+        examination = cls._create_examination()
+        results = cls._create_results(examination, enrolled[:4])
+        results[:2].write({'state': 'published'})
+        results[2].write({'state': 'published', 'external_marks': 0, 'internal_marks': 0})
+
+    def _reference_student_statistics(self):
+        """Straightforward per-bucket counting the engine replaced"""
+        Student = self.env['student.student']
+        enrolled = [('state', '=', 'enrolled')]
+        return {
+            'total': Student.search_count([]),
+            'enrolled': Student.search_count(enrolled),
+            'graduated': Student.search_count([('state', '=', 'graduated')]),
+            'suspended': Student.search_count([('state', '=', 'suspended')]),
+            'gender_distribution': {
+                gender: Student.search_count(enrolled + [('gender', '=', gender)])
+                for gender in ('male', 'female', 'other')
+            },
+            'by_year': [
+                {'year': year,
+                 'count': Student.search_count(enrolled + [('current_semester', 'in', [2 * year - 1, 2 * year])])}
+                for year in range(1, 5)
+            ],
+        }
+
+    def test_full_payload(self):
+        """Every section builds without touching unknown models or fields"""
+        statistics = self.Statistics.get_dashboard_statistics()
+        self.assertEqual(
+            list(statistics), [section for section, _method in self.Statistics._dashboard_sections])
+
+    def test_student_statistics(self):
+        statistics = self.Statistics._get_student_statistics()
+        reference = self._reference_student_statistics()
+        for key, value in reference.items():
+            self.assertEqual(statistics[key], value, key)
+
+    def test_overview_statistics(self):
+        overview = self.Statistics._get_overview_statistics()
+        self.assertEqual(overview['total_students'],
+                         self.env['student.student'].search_count([('state', '=', 'enrolled')]))
+
+    def test_fee_statistics(self):
+        fee = self.Statistics._get_fee_statistics()
+        FeePayment = self.env['fee.payment']
+        today = fields.Date.today()
+        overdue = FeePayment.search([('state', '=', 'pending'), ('due_date', '<', today)])
+        self.assertEqual(fee['pending_payments'], FeePayment.search_count([('state', '=', 'pending')]))
+        self.assertEqual(fee['overdue_payments'], len(overdue))
+        self.assertEqual(fee['defaulters'], len(overdue.student_id.filtered(lambda s: s.state == 'enrolled')))
+        for method in ('cash', 'online', 'cheque'):
+            self.assertEqual(fee['payment_modes'][method], FeePayment.search_count([
+                ('payment_method', '=', method),
+                ('payment_date', '>=', today.replace(day=1)),
+            ]), method)
+
+    def test_examination_statistics(self):
+        examination = self.Statistics._get_examination_statistics()
+        Result = self.env['examination.result']
+        published = Result.search([('state', '=', 'published')])
+        self.assertEqual(examination['results']['published'], len(published))
+        self.assertEqual(examination['results']['pending'], Result.search_count([('state', '!=', 'published')]))
+        self.assertEqual(examination['results']['passed'], len(published.filtered(lambda r: r.result == 'pass')))
+        self.assertEqual(examination['results']['failed'], len(published.filtered(lambda r: r.result == 'fail')))
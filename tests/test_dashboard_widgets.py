@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import ast
+from types import SimpleNamespace
+
+from odoo.tests import new_test_user, tagged
+from odoo.tools import mute_logger
+
+from odoo.addons.university_management.models.dashboard import university_dashboard
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardWidgets(UniversityTestCommon):
+    """Widget domains are parsed once and KPI widgets are counted per model"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.students = cls._create_students(3) | cls._create_students(2, state='draft')
+        cls.dashboard = cls.env['university.dashboard'].create({
+            'name': 'Test Dashboard',
+            'code': 'test_dashboard',
+            'user_type': 'admin',
+        })
+        cls.widgets = cls._create_widgets([
+            ('all', 'student.student', f"[('id', 'in', {cls.students.ids})]"),
+            ('enrolled', 'student.student', f"[('id', 'in', {cls.students.ids}), ('state', '=', 'enrolled')]"),
+            ('enrolled_again', 'student.student', f"[('id', 'in', {cls.students.ids}), ('state', '=', 'enrolled')]"),
+            ('mine', 'student.student', f"[('id', 'in', {cls.students.ids}), ('create_uid', '=', uid)]"),
+            ('broken', 'university.course', "[('no_such_field', '=', 1)]"),
+        ])
+
+    @classmethod
+    def _create_widgets(cls, specs):
+        return cls.env['university.dashboard.widget'].create([{
+            'name': code.title(),
+            'code': code,
+            'dashboard_id': cls.dashboard.id,
+            'widget_type': 'counter',
+            'model_name': model_name,
+            'domain': domain,
+        } for code, model_name, domain in specs])
+
+    def _count_parses(self):
+        parses = []
+
+        def literal_eval(source):
+            parses.append(source)
+            return ast.literal_eval(source)
+
+        self.patch(university_dashboard, 'ast', SimpleNamespace(literal_eval=literal_eval))
+        return parses
+
+    def test_literal_domain_parsed_once(self):
+        widget = self.widgets[1]
+        self.env.registry.clear_cache()
+        parses = self._count_parses()
+        domain = widget._get_domain()
+        self.assertEqual(domain, [('id', 'in', self.students.ids), ('state', '=', 'enrolled')])
+        domain.append(('name', '=', 'Changed by the caller'))
+        self.assertEqual(widget._get_domain(), domain[:2])
+        self.assertEqual(len(parses), 1)
+
+        widget.domain = "[('state', '=', 'draft')]"
+        self.assertEqual(widget._get_domain(), [('state', '=', 'draft')])
+        self.assertEqual(len(parses), 2)
+
+    def test_dynamic_domain_evaluated_per_call(self):
+        widget = self.widgets[3]
+        user = new_test_user(self.env, login='widget_user', groups='base.group_user')
+        self.assertEqual(widget._get_domain()[1], ('create_uid', '=', self.env.uid))
+        self.assertEqual(widget.with_user(user)._get_domain()[1], ('create_uid', '=', user.id))
+
+    @mute_logger('odoo.addons.university_management.models.dashboard.university_dashboard')
+    def test_widget_counts(self):
+        data = {item['code']: item['data'] for item in self.dashboard.widget_ids._get_widgets_data()}
+        self.assertEqual(data['all'], {'value': 5, 'label': 'All'})
+        self.assertEqual(data['enrolled']['value'], 3)
+        self.assertEqual(data['enrolled_again']['value'], 3)
+        self.assertEqual(data['mine']['value'], 5)
+        # A failing model falls back to the per-widget path, which reports the error
+        self.assertEqual(data['broken']['value'], 0)
+        self.assertIn('error', data['broken'])
+
+    def test_counts_query_per_model(self):
+        """Adding widgets on a model already counted adds no query"""
+        student_widgets = self.widgets[:2]
+        more_widgets = self._create_widgets([
+            ('draft', 'student.student', f"[('id', 'in', {self.students.ids}), ('state', '=', 'draft')]"),
+            ('none', 'student.student', "[('id', '=', 0)]"),
+        ])
+        counts = []
+        for widgets in (student_widgets, student_widgets | more_widgets):
+            widgets._get_kpi_counts()
+            self.env.flush_all()
+            before = self.env.cr.sql_log_count
+            result = widgets._get_kpi_counts()
+            counts.append(self.env.cr.sql_log_count - before)
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(result[more_widgets[0].id], 2)
+        self.assertEqual(result[more_widgets[1].id], 0)
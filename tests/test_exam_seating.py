@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from odoo.exceptions import ValidationError
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestExamSeating(UniversityTestCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Seating = cls.env['examination.seating']
+        cls.other_program = cls.env['university.program'].create({
+            'name': 'B.Sc Physics',
+            'code': 'TBSCP',
+            'program_type': 'undergraduate',
+            'department_id': cls.department.id,
+        })
+        cls.examination = cls._create_examination()
+        cls.classrooms = cls.env['university.classroom'].create([
+            {'name': 'Room A', 'building_name': 'Main', 'capacity': 4},
+            {'name': 'Room B', 'building_name': 'Main', 'capacity': 3},
+        ])
+
+    def _create_candidates(self, count, program):
+        students = self._create_students(count, program_id=program.id)
+        self._create_hall_tickets(self.examination, students)
+        return students
+
+    def _generate(self):
+        return self.Seating.generate_seating_arrangement(self.examination.id, classroom_ids=self.classrooms.ids)
+
+    def test_interleave_by_group(self):
+        records = ['a1', 'a2', 'a3', 'b1', 'b2', 'c1']
+        ordered = self.Seating._interleave_by_group(records, lambda record: record[0])
+        self.assertEqual(sorted(ordered), sorted(records))
+        self.assertTrue(all(left[0] != right[0] for left, right in zip(ordered, ordered[1:])), ordered)
+
+        # A dominant group can only be spread out, its surplus sits together at the end
+        ordered = self.Seating._interleave_by_group(['a1', 'a2', 'a3', 'a4', 'b1'], lambda record: record[0])
+        self.assertEqual(ordered, ['a1', 'b1', 'a2', 'a3', 'a4'])
+
+    def test_seats_alternate_programs(self):
+        self._create_candidates(3, self.program)
+        self._create_candidates(3, self.other_program)
+        seats = self._generate()
+        self.assertEqual(len(seats), 6)
+        for classroom in self.classrooms:
+            room_seats = seats.filtered(lambda s: s.room_number_id == classroom).sorted('seat_number')
+            programs = [seat.student_id.program_id for seat in room_seats]
+            self.assertTrue(all(left != right for left, right in zip(programs, programs[1:])), classroom.name)
+        self.assertEqual(seats.hall_ticket_id.student_id, seats.student_id)
+
+    def test_room_capacity(self):
+        self._create_candidates(6, self.program)
+        seats = self._generate()
+        self.assertEqual(len(seats.filtered(lambda s: s.room_number_id == self.classrooms[0])), 4)
+        self.assertEqual(len(seats.filtered(lambda s: s.room_number_id == self.classrooms[1])), 2)
+
+    def test_more_students_than_free_seats(self):
+        self._create_candidates(6, self.program)
+        self._generate()
+
+        # One free seat left for two new candidates: nothing is seated
+        self._create_candidates(2, self.other_program)
+        with self.assertRaises(ValidationError):
+            self._generate()
+        self.assertEqual(self.Seating.search_count([('examination_id', '=', self.examination.id)]), 6)
+
+    def test_regenerate_keeps_existing_seats(self):
+        seated = self._create_candidates(3, self.program)
+        first = self._generate()
+        self._create_candidates(2, self.other_program)
+        second = self._generate()
+        self.assertEqual(len(second), 2)
+        self.assertFalse(second.student_id & seated)
+        taken = {(seat.room_number_id.id, seat.seat_number) for seat in first}
+        self.assertFalse(taken & {(seat.room_number_id.id, seat.seat_number) for seat in second})
+        self.assertFalse(self._generate())
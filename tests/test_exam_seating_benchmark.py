@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import time
+
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('-standard', 'university_benchmark')
+class TestExamSeatingBenchmark(UniversityTestCommon):
+    """Compare the seating engine with the per-student lookup and create loop
+
+    Not part of the standard run: ``--test-tags university_benchmark``.
+    """
+
+    # Candidates per run
+    _benchmark_sizes = (1000, 10000, 50000)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Seating = cls.env['examination.seating']
+        cls.examination = cls._create_examination()
+        cls.classrooms = cls.env['university.classroom'].create([
+            {'name': f'Room {index}', 'building_name': 'Main', 'capacity': 60}
+            for index in range(max(cls._benchmark_sizes) // 60 + 1)
+        ])
+
+    def _seat_per_student(self):
+        """Seating as it ran before: a hall ticket filter and a create per student"""
+        hall_tickets = self.env['examination.hall.ticket'].search([
+            ('examination_id', '=', self.examination.id),
+            ('is_eligible', '=', True),
+            ('state', 'in', ['issued', 'printed'])
+        ])
+        seats = [
+            (classroom, f"S{index + 1:03d}")
+            for classroom in self.classrooms for index in range(classroom.capacity)
+        ]
+        for student, (classroom, seat_number) in zip(hall_tickets.mapped('student_id'), seats):
+            self.Seating.create({
+                'examination_id': self.examination.id,
+                'student_id': student.id,
+                'hall_ticket_id': hall_tickets.filtered(lambda h: h.student_id == student).id,
+                'room_number_id': classroom.id,
+                'seat_number': seat_number,
+            })
+
+    def _run(self, generate):
+        self.Seating.search([]).unlink()
+        self.env.flush_all()
+        self.env.invalidate_all()
+        start = time.perf_counter()
+        generate()
+        self.env.flush_all()
+        elapsed = time.perf_counter() - start
+        return elapsed, self.Seating.search_count([('examination_id', '=', self.examination.id)])
+
+    def test_benchmark_generate_seating(self):
+        candidates = 0
+        for size in self._benchmark_sizes:
+            for start in range(candidates, size, 1000):
+                students = self._create_students(min(1000, size - start))
+                self._create_hall_tickets(self.examination, students)
+            candidates = size
+
+            before, expected = self._run(self._seat_per_student)
+            after, seated = self._run(lambda: self.Seating.generate_seating_arrangement(
+                self.examination.id, classroom_ids=self.classrooms.ids))
+            self.assertEqual(seated, expected)
+            _logger.info("Seating for %s candidates: per student %.2fs, seating engine %.2fs (x%.1f)",
+                         size, before, after, before / after if after else 0.0)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import time
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('-standard', 'university_benchmark')
+class TestFeeReminderBenchmark(UniversityTestCommon):
+    """Compare the set-based reminder generation with the per-student loop
+
+    Not part of the standard run: ``--test-tags university_benchmark``.
+    """
+
+    # Enrolled students per run
+    _benchmark_sizes = (1000, 10000, 50000)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Reminder = cls.env['fee.reminder']
+        cls.fee_structure = cls.env['fee.structure'].create({
+            'name': 'Benchmark Tuition',
+            'code': 'TBENCH',
+            'program_id': cls.program.id,
+            'academic_year_id': cls.academic_year.id,
+            'due_date': fields.Date.today() + timedelta(days=7),
+            'state': 'active',
+            'fee_line_ids': [(0, 0, {'name': 'Tuition', 'fee_type': 'tuition', 'amount': 1000})],
+        })
+
+    def _generate_reminders_per_student(self):
+        """Reminder generation as it ran before: queries and creates per student
+
+        Sending is left out since the old loop sent each reminder inline.
+        """
+        today = fields.Date.today()
+        for fee_structure in self.env['fee.structure'].search([('state', '=', 'active')]):
+            if not fee_structure.due_date:
+                continue
+            reminder_type = self.Reminder._reminder_schedule.get((fee_structure.due_date - today).days)
+            students = self.env['student.student'].search([
+                ('program_id', '=', fee_structure.program_id.id),
+                ('state', 'in', ['enrolled', 'active'])
+            ])
+            for student in students:
+                paid_amount = sum(self.env['fee.payment'].search([
+                    ('student_id', '=', student.id),
+                    ('fee_structure_id', '=', fee_structure.id),
+                    ('state', '=', 'paid')
+                ]).mapped('amount'))
+                outstanding = fee_structure.total_amount - paid_amount
+                if outstanding > 0 and reminder_type and not self.Reminder.search([
+                    ('student_id', '=', student.id),
+                    ('fee_structure_id', '=', fee_structure.id),
+                    ('reminder_type', '=', reminder_type),
+                    ('reminder_date', '=', today)
+                ]):
+                    self.Reminder.create({
+                        'student_id': student.id,
+                        'fee_structure_id': fee_structure.id,
+                        'reminder_type': reminder_type,
+                        'outstanding_amount': outstanding,
+                        'state': 'scheduled'
+                    })
+
+    def _run(self, generate):
+        """Time ``generate`` and return the reminders it created"""
+        self.Reminder.search([]).unlink()
+        self.env.flush_all()
+        self.env.invalidate_all()
+        start = time.perf_counter()
+        generate()
+        self.env.flush_all()
+        elapsed = time.perf_counter() - start
+        reminders = {
+            (reminder.student_id.id, reminder.reminder_type, reminder.outstanding_amount)
+            for reminder in self.Reminder.search([])
+        }
+        return elapsed, reminders
+
+    def test_benchmark_generate_reminders(self):
+        students = self.env['student.student']
+        for size in self._benchmark_sizes:
+            for start in range(len(students), size, 1000):
+                batch = self._create_students(min(1000, size - start))
+                # A third of the students already paid part of the fee
+                self.env['fee.payment'].create([{
+                    'student_id': student.id,
+                    'fee_structure_id': self.fee_structure.id,
+                    'amount': 400,
+                    'state': 'paid',
+                } for student in batch[::3]])
+                students |= batch
+
+            before, expected = self._run(self._generate_reminders_per_student)
+            after, reminders = self._run(self.Reminder._cron_generate_reminders)
+            self.assertEqual(reminders, expected)
+            _logger.info("Fee reminders for %s students: per student %.2fs, set-based %.2fs (x%.1f)",
+                         size, before, after, before / after if after else 0.0)
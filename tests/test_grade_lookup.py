@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestGradeLookup(UniversityTestCommon):
+    """Bisecting the cached grade bands matches a search over the grade table"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.GradeSystem = cls.env['examination.grade.system']
+        # Band edges, the gaps between two-decimal bands and out-of-range values
+        cls.percentages = [-1, 0, 20, 34.99, 34.995, 35, 39.99, 40, 55.5, 69.99, 69.995,
+                           70, 89.99, 89.995, 90, 95, 100, 100.5]
+
+    def _search_grade(self, percentage):
+        return self.GradeSystem.search([
+            ('min_percentage', '<=', percentage),
+            ('max_percentage', '>=', percentage),
+        ], limit=1)
+
+    def _assert_lookup_matches_search(self):
+        for percentage in self.percentages:
+            with self.subTest(percentage=percentage):
+                self.assertEqual(self.GradeSystem._get_grade_for_percentage(percentage),
+                                 self._search_grade(percentage))
+
+    def test_default_bands(self):
+        self._assert_lookup_matches_search()
+        lookup = self.GradeSystem._get_grade_for_percentage
+        self.assertEqual(lookup(90).grade, 'O')
+        self.assertEqual(lookup(89.99).grade, 'A+')
+        self.assertEqual(lookup(0).grade, 'F')
+        self.assertFalse(lookup(89.995))
+        self.assertFalse(lookup(100.5))
+
+    def test_warm_lookup_runs_no_query(self):
+        self.GradeSystem._get_grade_for_percentage(50)
+        with self.assertQueryCount(0):
+            for percentage in self.percentages:
+                self.GradeSystem._get_grade_for_percentage(percentage)
+
+    def test_lookup_follows_band_edits(self):
+        """Creating, editing, archiving and deleting bands clears the cached bands"""
+        grade_o = self.env.ref('university_management.grade_o')
+        grade_d = self.env.ref('university_management.grade_d')
+        self.GradeSystem._get_grade_for_percentage(50)
+
+        grade_o.min_percentage = 95
+        self.assertFalse(self.GradeSystem._get_grade_for_percentage(92))
+        self._assert_lookup_matches_search()
+
+        distinction = self.GradeSystem.create({
+            'name': 'Distinction',
+            'grade': 'S',
+            'grade_point': 9.5,
+            'min_percentage': 90,
+            'max_percentage': 94.99,
+        })
+        self.assertEqual(self.GradeSystem._get_grade_for_percentage(92), distinction)
+        self._assert_lookup_matches_search()
+
+        grade_d.active = False
+        self.assertFalse(self.GradeSystem._get_grade_for_percentage(36))
+        self._assert_lookup_matches_search()
+
+        distinction.unlink()
+        self.assertFalse(self.GradeSystem._get_grade_for_percentage(92))
+        self._assert_lookup_matches_search()
+
+    def test_result_grade(self):
+        examination = self._create_examination()
+        students = self._create_students(3)
+        results = self._create_results(examination, students[0], internal_marks=30, external_marks=65) \
+            | self._create_results(examination, students[1], internal_marks=10, external_marks=20) \
+            | self._create_results(examination, students[2], internal_marks=0, external_marks=0, is_absent=True)
+        self.assertEqual(results.mapped(lambda result: result.grade_id.grade), ['O', 'F', False])
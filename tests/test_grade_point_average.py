@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from odoo import Command
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestGradePointAverage(UniversityTestCommon):
+    """CGPA and SGPA are credit-weighted over the published, attended results"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.student = cls._create_students(1, current_semester=1)
+        cls.examination = cls._create_examination()
+        cls.lab_course = cls._create_course('TDS102', credits=2)
+        cls.elective_course = cls._create_course('TDS103', credits=3)
+
+        # 70% on 4 credits (A, 8) and 90% on 2 credits (O, 10): 52 credit points over 6 credits
+        cls.results = (
+            cls._create_results(cls.examination, cls.student)
+            | cls._create_results(cls.examination, cls.student, course_id=cls.lab_course.id,
+                                  internal_marks=28, external_marks=62)
+        )
+        cls.absent_result = cls._create_results(cls.examination, cls.student, course_id=cls.elective_course.id,
+                                                internal_marks=0, external_marks=0, is_absent=True)
+
+    @classmethod
+    def _create_course(cls, code, **values):
+        return cls.env['university.course'].create(dict({
+            'name': f'Course {code}',
+            'code': code,
+            'program_id': cls.program.id,
+            'department_id': cls.department.id,
+            'semester_id': cls.semester.id,
+            'academic_year_id': cls.academic_year.id,
+            'subject_id': cls.subject.id,
+            'credits': 4,
+        }, **values))
+
+    def _create_marksheet(self, results, academic_year=None):
+        return self.env['examination.marksheet'].create({
+            'student_id': self.student.id,
+            'semester_id': self.semester.id,
+            'academic_year_id': (academic_year or self.academic_year).id,
+            'marksheet_type': 'semester',
+            'result_ids': [Command.set(results.ids)],
+        })
+
+    def test_credit_weighted_average(self):
+        (self.results | self.absent_result).write({'state': 'published'})
+        self.assertAlmostEqual(self.student.cgpa, 52 / 6)
+        self.assertAlmostEqual(self.student.sgpa, 52 / 6)
+
+    def test_absent_results_are_left_out(self):
+        """SGPA and CGPA agree on a marksheet with an absent result"""
+        all_results = self.results | self.absent_result
+        all_results.write({'state': 'published'})
+        marksheet = self._create_marksheet(all_results)
+        self.assertEqual(marksheet.total_credits, 6)
+        self.assertAlmostEqual(marksheet.sgpa, 52 / 6)
+        self.assertAlmostEqual(marksheet.cgpa, marksheet.sgpa)
+        self.assertAlmostEqual(self.student.cgpa, marksheet.cgpa)
+        totals = self.env['examination.result']._get_credit_totals(self.student)
+        self.assertEqual(totals[(self.student.id,)], (52.0, 6))
+
+    def test_publishing_recomputes_marksheet_cgpa(self):
+        marksheet = self._create_marksheet(self.results)
+        self.assertEqual(marksheet.cgpa, 0.0)
+        self.results.write({'state': 'published'})
+        self.assertAlmostEqual(marksheet.cgpa, 52 / 6)
+        self.results[1].write({'external_marks': 12})
+        self.assertAlmostEqual(marksheet.cgpa, self.student.cgpa)
+        self.assertLess(marksheet.cgpa, 52 / 6)
+
+    def test_cgpa_follows_academic_year_dates(self):
+        """Earlier years count towards a marksheet even when created after it"""
+        start = self.academic_year.start_date
+        previous_year = self.env['university.academic.year'].create({
+            'name': 'Previous Year',
+            'code': 'TYP',
+            'start_date': start.replace(year=start.year - 1),
+            'end_date': start.replace(year=start.year - 1, month=12, day=31),
+        })
+        self.assertGreater(previous_year.id, self.academic_year.id)
+        previous_semester = self.env['university.semester'].create({
+            'name': 'Previous Semester',
+            'code': 'TS0',
+            'academic_year_id': previous_year.id,
+            'semester_number': 1,
+            'start_date': previous_year.start_date,
+            'end_date': previous_year.end_date,
+        })
+        previous_examination = self._create_examination(
+            academic_year_id=previous_year.id, semester_id=previous_semester.id,
+            start_date=previous_year.start_date, end_date=previous_year.end_date)
+        # 50% on 4 credits (B, 6): 24 credit points
+        previous_results = self._create_results(previous_examination, self.student,
+                                                internal_marks=15, external_marks=35)
+        (self.results | previous_results).write({'state': 'published'})
+
+        current = self._create_marksheet(self.results)
+        previous = self._create_marksheet(previous_results, academic_year=previous_year)
+        self.assertAlmostEqual(current.cgpa, (52 + 24) / 10)
+        self.assertAlmostEqual(previous.cgpa, 6.0)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import Command, fields
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestHallTicketGeneration(UniversityTestCommon):
+    """Hall ticket eligibility is evaluated for the whole candidate set at once"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        today = fields.Date.today()
+        start = cls.semester.start_date
+        cls.examination = cls._create_examination()
+        # regular, low attendance, overdue fee, unverified document
+        cls.students = cls._create_students(4, current_semester=1)
+        regular, absentee, debtor, undocumented = cls.students
+
+        cls.env['student.attendance'].create([{
+            'student_id': student.id,
+            'course_id': cls.course.id,
+            'date': start + timedelta(days=day),
+            'state': 'absent' if student == absentee and day else 'present',
+        } for student in cls.students for day in range(4)])
+        # Attendance outside the examination semester is not counted
+        cls.env['student.attendance'].create({
+            'student_id': regular.id,
+            'course_id': cls.course.id,
+            'date': start - timedelta(days=1),
+            'state': 'absent',
+        })
+
+        fee_structure = cls.env['fee.structure'].create({
+            'name': 'Semester Tuition',
+            'code': 'TSEM',
+            'program_id': cls.program.id,
+            'academic_year_id': cls.academic_year.id,
+            'semester_id': cls.semester.id,
+            'fee_line_ids': [Command.create({'name': 'Tuition', 'fee_type': 'tuition', 'amount': 1000})],
+        })
+        cls.env['fee.payment'].create([{
+            'student_id': student.id,
+            'fee_structure_id': fee_structure.id,
+            'amount': 1000,
+            'due_date': today - timedelta(days=days),
+            'state': 'pending',
+        } for student, days in ((debtor, 10), (regular, -10))])
+
+        attachment = cls.env['ir.attachment'].create({'name': 'aadhar.pdf', 'raw': b'%PDF-1.4'})
+        cls.env['student.document'].create([{
+            'name': 'Aadhar Card',
+            'student_id': student.id,
+            'document_type': 'aadhar',
+            'attachment_id': attachment.id,
+            'state': state,
+        } for student, state in ((regular, 'verified'), (undocumented, 'submitted'))])
+
+    def _create_wizard(self, **values):
+        return self.env['generate.hall.ticket.wizard'].create(dict({
+            'examination_id': self.examination.id,
+            'program_id': self.program.id,
+            'semester': '1',
+            'check_documents': True,
+            'send_email': False,
+        }, **values))
+
+    def _preview(self, wizard):
+        return {line.student_id: (line.eligible, line.reason) for line in wizard.preview_lines}
+
+    def test_preview_eligibility(self):
+        regular, absentee, debtor, undocumented = self.students
+        preview = self._preview(self._create_wizard())
+        self.assertEqual(set(preview), set(self.students))
+        self.assertEqual(preview[regular], (True, 'Attendance: 100.0%, Fee paid, Documents verified'))
+        self.assertEqual(preview[absentee], (False, 'Low attendance: 25.0%'))
+        self.assertEqual(preview[debtor], (False, 'Fee payment pending'))
+        self.assertEqual(preview[undocumented], (False, 'Documents not verified'))
+
+    def test_preview_follows_options(self):
+        wizard = self._create_wizard()
+        wizard.write({'check_fee_payment': False, 'check_documents': False, 'min_attendance': 0})
+        preview = self._preview(wizard)
+        self.assertTrue(all(eligible for eligible, _reason in preview.values()))
+        self.assertEqual(preview[self.students[2]][1], 'Attendance: 100.0%')
+
+        wizard.check_eligibility = False
+        self.assertEqual(set(self._preview(wizard).values()), {(True, 'No eligibility check')})
+
+    def test_query_count_is_flat(self):
+        """Evaluating one student or all of them runs the same queries"""
+        wizard = self._create_wizard()
+        counts = []
+        for students in (self.students[:1], self.students):
+            self.env.flush_all()
+            self.env.invalidate_all()
+            before = self.env.cr.sql_log_count
+            wizard._evaluate_eligibility(students)
+            counts.append(self.env.cr.sql_log_count - before)
+        self.assertEqual(counts[0], counts[1])
+
+    def test_generate_and_reissue(self):
+        cancelled = self._create_hall_tickets(self.examination, self.students[2], state='cancelled')
+        wizard = self._create_wizard(check_fee_payment=False, check_documents=False, min_attendance=0)
+        action = wizard.action_generate_hall_tickets()
+
+        tickets = self.env['examination.hall.ticket'].search([('examination_id', '=', self.examination.id)])
+        self.assertEqual(tickets.student_id, self.students)
+        self.assertIn(cancelled, tickets)
+        self.assertEqual(set(tickets.mapped('state')), {'issued'})
+        self.assertEqual(sorted(action['domain'][0][2]), sorted(tickets.ids))
+
+        # Issued tickets are left untouched on a second run
+        action = wizard.action_generate_hall_tickets()
+        self.assertEqual(action['domain'][0][2], [])
+        self.assertEqual(self.env['examination.hall.ticket'].search_count([
+            ('examination_id', '=', self.examination.id)]), 4)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from odoo import Command
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestIdCardGeneration(UniversityTestCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.students = cls._create_students(5)
+        cls.Generation = type(cls.env['student.id.card.generation'])
+
+    def _create_wizard(self):
+        return self.env['bulk.id.card.wizard'].create({
+            'card_type': 'student',
+            'student_ids': [Command.set(self.students.ids)],
+        })
+
+    def test_generate_inline(self):
+        wizard = self._create_wizard()
+        wizard.action_generate_id_cards()
+        generation = wizard.generation_id
+        self.assertEqual(generation.state, 'done')
+        self.assertEqual(generation.progress_done, 5)
+        self.assertEqual(generation.generated_card_ids.student_id, self.students)
+        self.assertEqual(wizard.state, 'done')
+
+    def test_resume_failed_generation(self):
+        """A failed chunk is rolled back and resuming generates the missing cards only"""
+        self.patch(self.Generation, '_generation_chunk_size', 2)
+        get_pending_students = self.Generation._get_pending_students
+        generate_chunk = self.Generation._generate_chunk
+        pending_calls = []
+        chunks = []
+
+        def _get_pending_students(generation):
+            pending_calls.append(generation.id)
+            return get_pending_students(generation)
+
+        def _generate_chunk(generation, students):
+            chunks.append(students)
+            if len(chunks) == 2:
+                raise ValueError('Card printer unavailable')
+            return generate_chunk(generation, students)
+
+        self.patch(self.Generation, '_get_pending_students', _get_pending_students)
+        self.patch(self.Generation, '_generate_chunk', _generate_chunk)
+        wizard = self._create_wizard()
+        wizard.action_generate_id_cards()
+        generation = wizard.generation_id
+        self.assertEqual(generation.state, 'queued')
+        self.assertEqual(generation.progress_total, 5)
+
+        # What the cron does, without its commits
+        pending_calls.clear()
+        generation._run_generation()
+        self.assertEqual(pending_calls, [generation.id], "pending students are computed once per run")
+        self.assertEqual(generation.state, 'failed')
+        self.assertEqual(generation.progress_done, 2)
+        self.assertEqual(generation.generated_card_ids.student_id, chunks[0])
+
+        # The wizard is transient; the run survives it and can be resumed
+        wizard.unlink()
+        self.assertTrue(generation.exists())
+        self.assertTrue(generation._start())
+        generation._run_generation()
+        self.assertEqual(generation.state, 'done')
+        self.assertEqual(generation.progress_done, 5)
+        self.assertEqual(generation.generated_card_ids.student_id, self.students)
+        self.assertEqual(sum(len(students) for students in chunks[2:]), 3)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timedelta
+
+from odoo.exceptions import ValidationError
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+
+@tagged('post_install', '-at_install')
+class TestKpiTimeseries(TransactionCase):
+    """Downsampling KPI points keeps the series read back unchanged"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Value = cls.env['university.dashboard.kpi.value']
+        cls.kpi = cls.env['university.dashboard.kpi'].create({
+            'name': 'Enrolled Students',
+            'code': 'TKPI',
+            'category': 'academic',
+        })
+        # Two whole weeks, Monday 2024-01-01 to Sunday 2024-01-14, valued 0 to 13
+        cls.start = datetime(2024, 1, 1)
+        for day in range(14):
+            cls.Value._record_values({cls.kpi.id: float(day)}, cls.start + timedelta(days=day, hours=18))
+
+    def _points(self):
+        return sorted(self.Value.search([('kpi_id', '=', self.kpi.id)]).mapped(
+            lambda point: (point.resolution, point.timestamp, point.value, point.sample_count)))
+
+    def _series(self, bucket):
+        return self.Value.get_series(self.kpi.id, self.start, self.start + timedelta(days=31), bucket)[1]
+
+    def test_record_keeps_latest_value_of_the_day(self):
+        self.Value._record_values({self.kpi.id: 42.0}, self.start + timedelta(hours=23))
+        points = self._points()
+        self.assertEqual(len(points), 14)
+        self.assertEqual(points[0], ('day', self.start, 42.0, 1))
+
+    def test_series_buckets(self):
+        self.assertEqual([value for _period, value in self._series('day')], [float(day) for day in range(14)])
+        self.assertEqual(self._series('week'), [(self.start, 3.0), (self.start + timedelta(days=7), 10.0)])
+        self.assertEqual(self._series('month'), [(self.start, 6.5)])
+        with self.assertRaises(ValidationError):
+            self._series('hour')
+
+    def test_auto_bucket(self):
+        self.assertEqual(self.Value._get_bucket(self.start, self.start + timedelta(days=30)), 'day')
+        self.assertEqual(self.Value._get_bucket(self.start, self.start + timedelta(days=365)), 'week')
+        self.assertEqual(self.Value._get_bucket(self.start, self.start + timedelta(days=1000)), 'month')
+        bucket, points = self.Value.get_series(self.kpi.id, self.start, self.start + timedelta(days=365))
+        self.assertEqual(bucket, 'week')
+        self.assertEqual(len(points), 2)
+
+    def test_downsample_whole_periods_only(self):
+        """The week still in retention stays daily; a late daily point merges weighted"""
+        weeks = self._series('week')
+        moved = self.Value._downsample('day', self.start + timedelta(days=10))
+        self.assertEqual(moved, 1)
+        points = self._points()
+        self.assertEqual(len(points), 8)
+        self.assertEqual(points[-1], ('week', self.start, 3.0, 7))
+        self.assertEqual(self._series('week'), weeks)
+
+        # A point recorded late for the rolled up week
+        self.Value._record_values({self.kpi.id: 11.0}, self.start + timedelta(days=2))
+        self.Value._downsample('day', self.start + timedelta(days=10))
+        self.assertEqual(self._points()[-1], ('week', self.start, 4.0, 8))
+
+    def test_cron_rolls_up_to_months(self):
+        month = self._series('month')
+        points = self._points()
+        Param = self.env['ir.config_parameter'].sudo()
+        Param.set_param('university_management.kpi_retention.day', '10000')
+        self.Value.cron_downsample_kpi_values()
+        self.assertEqual(self._points(), points)
+
+        Param.set_param('university_management.kpi_retention.day', False)
+        self.Value.cron_downsample_kpi_values()
+        self.assertEqual(self._points(), [('month', self.start, 6.5, 14)])
+        self.assertEqual(self._series('month'), month)
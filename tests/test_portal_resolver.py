@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import new_test_user, tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestPortalResolver(UniversityTestCommon):
+    """The cached portal resolver follows user links and unlinks"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.student = cls._create_students(1)
+        cls.portal_user = new_test_user(cls.env, login='resolver_portal', groups='base.group_portal')
+        cls.parent = cls.env['student.parent'].create({
+            'name': 'Test Parent',
+            'student_id': cls.student.id,
+            'relationship': 'father',
+        })
+
+    def _count_cache_clears(self):
+        Registry = type(self.env.registry)
+        clear_cache = Registry.clear_cache
+        clears = []
+
+        def _clear_cache(registry, *cache_names):
+            clears.append(cache_names)
+            return clear_cache(registry, *cache_names)
+
+        self.patch(Registry, 'clear_cache', _clear_cache)
+        return clears
+
+    def test_student_follows_user_link(self):
+        Student = self.env['student.student'].with_user(self.portal_user)
+        self.assertFalse(Student._get_current_student())
+
+        self.student.user_id = self.portal_user
+        self.assertEqual(Student._get_current_student(), self.student)
+
+        self.student.active = False
+        self.assertFalse(Student._get_current_student())
+        self.student.active = True
+        self.assertEqual(Student._get_current_student(), self.student)
+
+        self.student.user_id = False
+        self.assertFalse(Student._get_current_student())
+
+    def test_parent_follows_user_link(self):
+        Parent = self.env['student.parent'].with_user(self.portal_user)
+        self.assertFalse(Parent._get_current_parents())
+
+        self.parent.user_id = self.portal_user
+        self.assertEqual(Parent._get_current_parents(), self.parent)
+
+        self.parent.user_id = False
+        self.assertFalse(Parent._get_current_parents())
+
+    def test_unchanged_link_keeps_cache(self):
+        """Writing the same user or active flag does not flush the registry caches"""
+        self.student.user_id = self.portal_user
+        self.parent.user_id = self.portal_user
+        clears = self._count_cache_clears()
+
+        self.student.write({'user_id': self.portal_user.id, 'active': True})
+        self.parent.write({'user_id': self.portal_user.id})
+        # Toggling a student without portal user is invisible to the resolver
+        other = self._create_students(1)
+        other.write({'active': False})
+        self.assertFalse(clears)
+
+        self.student.write({'user_id': False})
+        self.assertTrue(clears)
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('-standard', 'university_benchmark')
+class TestQrCodeBenchmark(TransactionCase):
+    """Measure the QR code rendering throughput
+
+    Not part of the standard run: ``--test-tags university_benchmark``.
+    """
+
+    # Distinct payloads per run
+    _benchmark_sizes = (200, 1000)
+
+    def test_benchmark_render_qr_codes(self):
+        QrCode = self.env['university.qr.code']
+        for size in self._benchmark_sizes:
+            result = QrCode.benchmark(size)
+            self.assertEqual(result['count'], size)
+            _logger.info("QR codes for %s cards: %.2fs, %.1f cards/s",
+                         size, result['seconds'], result['cards_per_second'])
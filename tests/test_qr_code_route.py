@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import HttpCase, new_test_user, tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestQrCodeRoute(UniversityTestCommon, HttpCase):
+    """``/university/qr/<key>.png`` only serves the QR codes of readable records"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.student = cls._create_students(1)
+        cls.card = cls.env['student.id.card'].create({
+            'student_id': cls.student.id,
+            'expiry_date': fields.Date.today() + timedelta(days=365),
+        })
+        cls.admin_user = new_test_user(cls.env, login='qr_admin',
+                                       groups='university_management.group_university_admin')
+        cls.employee_user = new_test_user(cls.env, login='qr_employee', groups='base.group_user')
+
+    def test_serve_readable_key(self):
+        self.authenticate('qr_admin', 'qr_admin')
+        response = self.url_open(self.card.qr_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Type'], 'image/png')
+        self.assertTrue(response.content.startswith(b'\x89PNG'))
+        etag = response.headers['ETag']
+        self.assertEqual(etag, f'"{self.card.qr_key}"')
+
+        response = self.url_open(self.card.qr_url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.content)
+
+    def test_unknown_key(self):
+        self.authenticate('qr_admin', 'qr_admin')
+        response = self.url_open('/university/qr/0000000000000000000000000000000000000000.png')
+        self.assertEqual(response.status_code, 404)
+
+    def test_unreadable_key(self):
+        """Users who cannot read the card get a 404, not its payload"""
+        QrCode = self.env['university.qr.code']
+        self.assertEqual(QrCode.with_user(self.admin_user)._find_payload(self.card.qr_key), self.card.qr_data)
+        self.assertIsNone(QrCode.with_user(self.employee_user)._find_payload(self.card.qr_key))
+
+        self.authenticate('qr_employee', 'qr_employee')
+        response = self.url_open(self.card.qr_url)
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import Command, fields
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestReportCache(UniversityTestCommon):
+    """Cached PDFs follow the related records their reports print"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Cache = cls.env['university.report.cache']
+        cls.examination = cls._create_examination()
+        cls.students = cls._create_students(2)
+        cls.hall_tickets = cls._create_hall_tickets(cls.examination, cls.students)
+        cls.results = cls._create_results(cls.examination, cls.students[0])
+        cls.marksheet = cls.env['examination.marksheet'].create({
+            'student_id': cls.students[0].id,
+            'semester_id': cls.semester.id,
+            'academic_year_id': cls.academic_year.id,
+            'marksheet_type': 'semester',
+            'result_ids': [Command.set(cls.results.ids)],
+        })
+
+    def _touch(self, records, **values):
+        """Write ``records`` as a later transaction would, with a newer write date"""
+        later = fields.Datetime.now() + timedelta(minutes=1)
+        records.write(dict(values, write_date=later))
+        self.assertEqual(records.write_date, later)
+
+    def test_hall_ticket_key_follows_student_and_examination(self):
+        ticket = self.hall_tickets[0]
+        key = self.Cache._get_key('hall_ticket', ticket)
+        self.assertEqual(key, self.Cache._get_key('hall_ticket', ticket))
+
+        # Another student's change keeps the cached PDF
+        self._touch(self.students[1], name='Someone Else')
+        self.assertEqual(key, self.Cache._get_key('hall_ticket', ticket))
+
+        self._touch(self.students[0], name='Renamed Student')
+        renamed = self.Cache._get_key('hall_ticket', ticket)
+        self.assertNotEqual(key, renamed)
+
+        self._touch(self.examination, name='Rescheduled Examination')
+        self.assertNotEqual(renamed, self.Cache._get_key('hall_ticket', ticket))
+
+    def test_marksheet_key_follows_results(self):
+        key = self.Cache._get_key('marksheet', self.marksheet)
+        self._touch(self.results, internal_marks=25)
+        self.assertNotEqual(key, self.Cache._get_key('marksheet', self.marksheet))
+
+    def test_bulk_key_follows_each_document(self):
+        key = self.Cache._get_key('hall_ticket', self.hall_tickets)
+        self._touch(self.students[1], name='Renamed Student')
+        self.assertNotEqual(key, self.Cache._get_key('hall_ticket', self.hall_tickets))
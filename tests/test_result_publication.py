@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestResultPublication(UniversityTestCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.examination = cls._create_examination()
+        cls.students = cls._create_students(5)
+        cls.results = cls._create_results(cls.examination, cls.students)
+        cls.results.write({'state': 'verified'})
+
+    def _create_wizard(self):
+        return self.env['publish.result.wizard'].create({
+            'examination_id': self.examination.id,
+            'semester': str(self.semester.semester_number),
+            'generate_marksheet': True,
+            'send_email': False,
+            'send_sms': False,
+        })
+
+    def test_publish_inline(self):
+        IrSequence = type(self.env['ir.sequence'])
+        next_by_code = IrSequence.next_by_code
+        codes = []
+
+        def _next_by_code(sequence, sequence_code, *args, **kwargs):
+            codes.append(sequence_code)
+            return next_by_code(sequence, sequence_code, *args, **kwargs)
+
+        self.patch(IrSequence, 'next_by_code', _next_by_code)
+        wizard = self._create_wizard()
+        wizard.action_publish_results()
+        publication = wizard.publication_id
+        self.assertEqual(publication.state, 'done')
+        self.assertEqual(publication.progress_done, 5)
+        self.assertEqual(set(self.results.mapped('state')), {'published'})
+        self.assertEqual(publication.marksheets_generated, 5)
+
+        # Marksheet numbers are reserved as one block, not one sequence call each
+        marksheets = self.env['examination.marksheet'].search([('student_id', 'in', self.students.ids)])
+        self.assertEqual(len(set(marksheets.mapped('name'))), 5)
+        self.assertNotIn('/', marksheets.mapped('name'))
+        self.assertNotIn('examination.marksheet', codes)
+
+    def test_resume_failed_publication(self):
+        """A failed chunk is rolled back and resuming publishes the rest only"""
+        Publication = type(self.env['examination.result.publication'])
+        self.patch(Publication, '_publish_chunk_size', 2)
+        publish_chunk = Publication._publish_chunk
+        calls = []
+
+        def _publish_chunk(publication, results):
+            calls.append(results)
+            if len(calls) == 2:
+                raise ValueError('Mail server unavailable')
+            return publish_chunk(publication, results)
+
+        self.patch(Publication, '_publish_chunk', _publish_chunk)
+        wizard = self._create_wizard()
+        wizard.action_publish_results()
+        publication = wizard.publication_id
+        self.assertEqual(publication.state, 'queued')
+        # What the cron does, without its commits
+        publication._run_publication()
+        self.assertEqual(publication.state, 'failed')
+        self.assertEqual(publication.progress_done, 2)
+        self.assertEqual(self.results.filtered(lambda r: r.state == 'published'), calls[0])
+
+        # The wizard is transient; the run survives it and can be resumed
+        wizard.unlink()
+        self.assertTrue(publication.exists())
+        self.assertTrue(publication._start())
+        publication._run_publication()
+        self.assertEqual(publication.state, 'done')
+        self.assertEqual(publication.progress_done, 5)
+        self.assertEqual(set(self.results.mapped('state')), {'published'})
+        self.assertEqual(sum(len(results) for results in calls[2:]), 3)
+
+    def test_queue_large_publication(self):
+        Publication = type(self.env['examination.result.publication'])
+        self.patch(Publication, '_publish_chunk_size', 2)
+        wizard = self._create_wizard()
+        wizard.action_publish_results()
+        publication = wizard.publication_id
+        self.assertEqual(publication.state, 'queued')
+        self.assertEqual(publication.progress_total, 5)
+        self.assertEqual(set(self.results.mapped('state')), {'verified'})
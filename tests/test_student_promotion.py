@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.exceptions import UserError
+from odoo.tests import tagged
+
+from .common import UniversityTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestStudentPromotion(UniversityTestCommon):
+    """Promotion eligibility and updates run on the whole candidate set"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        today = fields.Date.today()
+        cls.semester_2 = cls._create_semester(2)
+        cls.semester_3 = cls._create_semester(3)
+        cls.course_2 = cls._create_course('TDS201', cls.semester_2)
+        cls.courses_3 = cls._create_course('TDS301', cls.semester_3) | cls._create_course('TDS302', cls.semester_3)
+
+        year = cls.academic_year.start_date.year
+        cls.batch, cls.next_batch = cls.env['university.batch'].create([{
+            'name': f'Test Batch {code}',
+            'code': code,
+            'program_id': cls.program.id,
+            'start_year': year,
+            'end_year': year + 4,
+        } for code in ('TB1', 'TB2')])
+
+        # regular, low attendance, failed this semester, backlog, backlog cleared on a retake
+        cls.students = cls._create_students(5, current_semester=2, batch_id=cls.batch.id)
+        regular, absentee, failed, backlog, retake = cls.students
+        cls.env['student.attendance'].create([{
+            'student_id': student.id,
+            'course_id': cls.course_2.id,
+            'date': today - timedelta(days=day),
+            'state': 'absent' if student == absentee and day else 'present',
+        } for student in cls.students for day in range(4)])
+
+        examination_1 = cls._create_examination(code='TEX1')
+        supplementary = cls._create_examination(code='TEX1S')
+        examination_2 = cls._create_examination(code='TEX2', semester_id=cls.semester_2.id)
+        fail = {'internal_marks': 5, 'external_marks': 10}
+        results = (
+            cls._create_results(examination_2, regular | absentee | backlog | retake, course_id=cls.course_2.id)
+            | cls._create_results(examination_2, failed, course_id=cls.course_2.id, **fail)
+            | cls._create_results(examination_1, backlog | retake, **fail)
+            | cls._create_results(supplementary, retake)
+        )
+        results.write({'state': 'published'})
+
+    @classmethod
+    def _create_semester(cls, number):
+        return cls.env['university.semester'].create({
+            'name': f'Semester {number}',
+            'code': f'TS{number}',
+            'academic_year_id': cls.academic_year.id,
+            'semester_number': number,
+            'start_date': cls.semester.start_date,
+            'end_date': cls.semester.end_date,
+        })
+
+    @classmethod
+    def _create_course(cls, code, semester):
+        return cls.env['university.course'].create({
+            'name': f'Course {code}',
+            'code': code,
+            'program_id': cls.program.id,
+            'department_id': cls.department.id,
+            'semester_id': semester.id,
+            'academic_year_id': cls.academic_year.id,
+            'subject_id': cls.subject.id,
+            'credits': 4,
+        })
+
+    def _create_wizard(self, **values):
+        return self.env['promote.student.wizard'].create(dict({
+            'current_program_id': self.program.id,
+            'current_batch_id': self.batch.id,
+            'current_semester': '2',
+            'academic_year_id': self.academic_year.id,
+            'send_notification': False,
+        }, **values))
+
+    def _preview(self, wizard):
+        return {line.student_id: (line.eligible, line.reason) for line in wizard.preview_lines}
+
+    def test_preview_eligibility(self):
+        regular, absentee, failed, backlog, retake = self.students
+        wizard = self._create_wizard()
+        self.assertEqual(self._preview(wizard), {
+            regular: (True, 'Attendance: 100.0%, Passed all exams'),
+            absentee: (False, 'Attendance 25.0% < 75.0%'),
+            failed: (False, 'Has pending backlogs'),
+            backlog: (False, 'Has pending backlogs'),
+            retake: (True, 'Attendance: 100.0%, Passed all exams'),
+        })
+
+        wizard.check_backlogs = False
+        preview = self._preview(wizard)
+        self.assertEqual(preview[failed], (False, 'Did not pass all exams'))
+        self.assertTrue(preview[backlog][0])
+
+        wizard.write({'criteria': 'attendance', 'min_attendance_percentage': 20})
+        self.assertTrue(all(eligible for eligible, _reason in self._preview(wizard).values()))
+
+        wizard.criteria = 'all'
+        self.assertEqual(set(self._preview(wizard).values()), {(True, 'Selected for promotion')})
+
+    def test_query_count_is_flat(self):
+        """Evaluating one student or all of them runs the same queries"""
+        wizard = self._create_wizard()
+        counts = []
+        for students in (self.students[:1], self.students):
+            self.env.flush_all()
+            self.env.invalidate_all()
+            before = self.env.cr.sql_log_count
+            wizard._evaluate_eligibility(students)
+            counts.append(self.env.cr.sql_log_count - before)
+        self.assertEqual(counts[0], counts[1])
+
+    def test_promote_students(self):
+        regular, absentee, failed, backlog, retake = self.students
+        promoted = regular | retake
+        wizard = self._create_wizard(next_batch_id=self.next_batch.id)
+        wizard.action_promote_students()
+
+        self.assertEqual(set(promoted.mapped('current_semester')), {3})
+        self.assertEqual(promoted.batch_id, self.next_batch)
+        self.assertEqual(set((self.students - promoted).mapped('current_semester')), {2})
+        self.assertEqual((self.students - promoted).batch_id, self.batch)
+
+        history = self.env['student.promotion'].search([('student_id', 'in', self.students.ids)])
+        self.assertEqual(history.student_id, promoted)
+        self.assertEqual(set(history.mapped(lambda p: (p.from_semester, p.to_semester))), {(2, 3)})
+        self.assertEqual(history.from_batch_id, self.batch)
+        self.assertEqual(history.to_batch_id, self.next_batch)
+
+        registrations = self.env['student.registration'].search([('student_id', 'in', self.students.ids)])
+        self.assertEqual(registrations.student_id, promoted)
+        self.assertEqual(registrations.semester_id, self.semester_3)
+        for registration in registrations:
+            self.assertEqual(registration.course_ids, self.courses_3)
+        self.assertEqual(len(set(registrations.mapped('name'))), 2)
+        for course in self.courses_3:
+            self.assertEqual(course.student_ids, promoted)
+
+    def test_target_semester(self):
+        self.assertEqual(self._create_wizard(promotion_type='year')._get_target_semester(), 4)
+        self.assertEqual(self._create_wizard(next_semester='5')._get_target_semester(), 5)
+        with self.assertRaises(UserError):
+            self._create_wizard(current_semester='8')._get_target_semester()
+
+    def test_failed_promotion_promotes_nobody(self):
+        def _assign_courses(wizard, students, target_semester):
+            raise ValueError('Course registration closed')
+
+        self.patch(type(self.env['promote.student.wizard']), '_assign_courses', _assign_courses)
+        with self.assertRaises(UserError):
+            self._create_wizard().action_promote_students()
+        self.assertEqual(set(self.students.mapped('current_semester')), {2})
+        self.assertFalse(self.env['student.promotion'].search([('student_id', 'in', self.students.ids)]))
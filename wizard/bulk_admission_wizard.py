@@ -2,10 +2,13 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError, ValidationError
+from itertools import islice
 import base64
+import openpyxl
 import xlrd
 import csv
 import io
+import zipfile
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -40,6 +43,26 @@ class BulkAdmissionWizard(models.TransientModel):
                                   default='/university_management/static/src/samples/bulk_admission_sample.xlsx',
                                   readonly=True)
 
+    # Import result
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('done', 'Done'),
+    ], string='Status', default='draft', readonly=True)
+    admission_ids = fields.Many2many('student.admission', string='Imported Admissions', readonly=True)
+    imported_count = fields.Integer(string='Imported', readonly=True)
+    error_count = fields.Integer(string='Errors', readonly=True)
+    result_file = fields.Binary(string='Import Report', readonly=True)
+    result_filename = fields.Char(string='Report Filename', readonly=True)
+
+    # Rows validated, deduplicated and created together
+    _import_chunk_size = 500
+
+    # Columns that must be filled for a row to be imported (required on the admission)
+    _required_columns = [
+        'name', 'email', 'mobile', 'date_of_birth', 'previous_qualification', 'previous_school',
+        'previous_board', 'previous_year', 'address', 'father_name', 'mother_name',
+    ]
+
     def action_download_sample(self):
         """Download sample template file"""
         return {
@@ -49,144 +72,316 @@ class BulkAdmissionWizard(models.TransientModel):
         }
 
     def action_import_admissions(self):
-        """Process bulk admission import"""
+        """Process bulk admission import
+
+        Rows are streamed from the file and imported chunk by chunk; every
+        row ends up in the downloadable report, imported or with its error.
+        Invalid rows only reject themselves, but the import runs in a single
+        transaction: a file that cannot be read to the end imports nothing.
+        """
         self.ensure_one()
 
         if not self.import_file:
             raise UserError(_('Please upload a file to import.'))
 
-        try:
-            if self.file_type == 'excel':
-                records = self._parse_excel_file()
-            else:
-                records = self._parse_csv_file()
-
-            if not records:
-                raise UserError(_('No valid records found in the file.'))
-
-            # Process admissions
-            created_admissions = self._create_admissions(records)
-
-            # Show result
-            return self._show_result(created_admissions)
+        report = io.StringIO()
+        writer = csv.writer(report)
+        writer.writerow(['Row', 'Status', 'Applicant', 'Application Number', 'Message'])
 
+        admission_ids = []
+        errors = 0
+        try:
+            with self._open_import_file() as stream:
+                rows = self._iter_excel_rows(stream) if self.file_type == 'excel' else self._iter_csv_rows(stream)
+                seen = {'aadhar': set(), 'email': set()}
+                while True:
+                    chunk = list(islice(rows, self._import_chunk_size))
+                    if not chunk:
+                        break
+                    for row_number, applicant, admission, message in self._import_chunk(chunk, seen):
+                        writer.writerow([row_number, 'imported' if admission else 'error',
+                                         applicant, admission.name if admission else '', message])
+                        if admission:
+                            admission_ids.append(admission.id)
+                        else:
+                            errors += 1
+                    # Keep the memory of a long import flat
+                    self.env.flush_all()
+                    self.env.invalidate_all()
         except Exception as e:
             _logger.error(f"Bulk admission import error: {str(e)}")
             raise UserError(_('Import failed: %s') % str(e))
 
-    def _parse_excel_file(self):
-        """Parse Excel file and return list of records"""
-        file_data = base64.b64decode(self.import_file)
-        workbook = xlrd.open_workbook(file_contents=file_data)
-        sheet = workbook.sheet_by_index(0)
-
-        records = []
-        headers = [str(cell.value).strip().lower() for cell in sheet.row(0)]
+        if not admission_ids and not errors:
+            raise UserError(_('No valid records found in the file.'))
 
-        for row_idx in range(1, sheet.nrows):
-            row_data = {}
-            for col_idx, header in enumerate(headers):
-                cell = sheet.cell(row_idx, col_idx)
-                row_data[header] = cell.value
+        self.write({
+            'state': 'done',
+            'admission_ids': [(6, 0, admission_ids)],
+            'imported_count': len(admission_ids),
+            'error_count': errors,
+            'result_file': base64.b64encode(report.getvalue().encode('utf-8')),
+            'result_filename': 'bulk_admission_report.csv',
+        })
+        _logger.info(f"Bulk admission import: {len(admission_ids)} imported, {errors} rejected")
 
-            if row_data.get('name') or row_data.get('student_name'):
-                records.append(row_data)
-
-        return records
+        # Show result
+        return {
+            'name': _('Bulk Admission Result'),
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
 
-    def _parse_csv_file(self):
-        """Parse CSV file and return list of records"""
-        file_data = base64.b64decode(self.import_file)
-        csv_data = io.StringIO(file_data.decode('utf-8'))
-        csv_reader = csv.DictReader(csv_data)
+    def action_view_admissions(self):
+        """Open the imported admissions"""
+        return self._show_result(self.admission_ids)
+
+    # ==================== FILE STREAMING ====================
+
+    def _open_import_file(self):
+        """Binary stream over the upload, read straight from the filestore when possible"""
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'import_file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+        if attachment.store_fname:
+            return open(attachment._full_path(attachment.store_fname), 'rb')
+        return io.BytesIO(base64.b64decode(self.import_file))
+
+    def _iter_excel_rows(self, stream):
+        """Yield ``(row number, row dict)`` from the first sheet of an Excel file"""
+        if zipfile.is_zipfile(stream):
+            # .xlsx: read-only mode streams rows without loading the sheet
+            stream.seek(0)
+            workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            close = workbook.close
+        else:
+            # .xls has no streaming reader; rows are still converted lazily
+            stream.seek(0)
+            workbook = xlrd.open_workbook(file_contents=stream.read(), on_demand=True)
+            sheet = workbook.sheet_by_index(0)
+            rows = (
+                [xlrd.xldate_as_datetime(cell.value, workbook.datemode) if cell.ctype == xlrd.XL_CELL_DATE
+                 else cell.value for cell in sheet.row(row_idx)]
+                for row_idx in range(sheet.nrows)
+            )
+            close = workbook.release_resources
 
-        records = []
-        for row in csv_reader:
+        try:
+            headers = [str(value or '').strip().lower() for value in next(rows, [])]
+            for row_number, values in enumerate(rows, start=2):
+                row_data = dict(zip(headers, values))
+                if row_data.get('name') or row_data.get('student_name'):
+                    yield row_number, row_data
+        finally:
+            # Read-only workbooks keep their archive open until closed
+            close()
+
+    def _iter_csv_rows(self, stream):
+        """Yield ``(row number, row dict)`` from a CSV file"""
+        csv_reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+        for row_number, row in enumerate(csv_reader, start=2):
             # Convert keys to lowercase
-            row_data = {k.strip().lower(): v for k, v in row.items()}
+            row_data = {(k or '').strip().lower(): v for k, v in row.items()}
             if row_data.get('name') or row_data.get('student_name'):
-                records.append(row_data)
+                yield row_number, row_data
 
-        return records
+    # ==================== CHUNK IMPORT ====================
 
-    def _create_admissions(self, records):
-        """Create admission records from parsed data"""
-        Admission = self.env['student.admission']
-        Student = self.env['student.student']
+    def _import_chunk(self, chunk, seen):
+        """Validate, deduplicate and create one chunk of rows
 
-        created_admissions = []
-        errors = []
-
-        for idx, record in enumerate(records, start=2):
+        Returns ``(row number, applicant, admission or False, error message)``
+        for every row of the chunk.
+        """
+        outcome = []
+        candidates = []
+        for row_number, record in chunk:
+            applicant = self._get_value(record, 'name', 'student_name')
             try:
-                # Prepare admission data
-                admission_vals = self._prepare_admission_vals(record)
-
-                # Create admission
-                admission = Admission.create(admission_vals)
-                created_admissions.append(admission)
-
-                # Auto approve if enabled
-                if self.auto_approve:
-                    admission.action_approve()
-
-                # Send notifications
-                if self.send_email and admission.student_id.email:
-                    self._send_admission_email(admission)
-
-                if self.send_sms and admission.student_id.mobile:
-                    self._send_admission_sms(admission)
-
-            except Exception as e:
-                error_msg = f"Row {idx}: {str(e)}"
-                errors.append(error_msg)
-                _logger.error(error_msg)
+                student_vals, admission_vals = self._prepare_vals(record)
+            except (ValueError, ValidationError) as e:
+                outcome.append((row_number, applicant, False, str(e)))
+                continue
+            candidates.append((row_number, applicant, student_vals, admission_vals))
+
+        # Duplicates, within the file and against existing students/applications
+        Student = self.env['student.student'].with_context(active_test=False)
+        aadhars = [c[2]['aadhar_number'] for c in candidates if c[2].get('aadhar_number')]
+        emails = [c[3]['email'] for c in candidates]
+        existing_aadhars = set(Student.search([('aadhar_number', 'in', aadhars)]).mapped('aadhar_number'))
+        existing_emails = set(Student.search([('email', 'in', emails)]).mapped('email'))
+        existing_emails |= set(self.env['student.admission'].search([
+            ('email', 'in', emails),
+            ('state', 'not in', ['rejected', 'cancelled']),
+        ]).mapped('email'))
+
+        valid = []
+        for candidate in candidates:
+            row_number, applicant, student_vals, admission_vals = candidate
+            aadhar = student_vals.get('aadhar_number')
+            email = admission_vals['email']
+            if aadhar and (aadhar in existing_aadhars or aadhar in seen['aadhar']):
+                outcome.append((row_number, applicant, False, _('Duplicate Aadhar number %s') % aadhar))
+            elif email in existing_emails or email in seen['email']:
+                outcome.append((row_number, applicant, False, _('Duplicate email %s') % email))
+            else:
+                if aadhar:
+                    seen['aadhar'].add(aadhar)
+                seen['email'].add(email)
+                valid.append(candidate)
 
-        if errors:
-            # Log errors but continue
-            error_log = "\n".join(errors)
-            _logger.warning(f"Bulk admission errors:\n{error_log}")
+        if not valid:
+            return outcome
 
-        return created_admissions
+        try:
+            with self.env.cr.savepoint():
+                admissions = self._create_admissions(valid)
+            created = list(zip(valid, admissions))
+        except Exception as e:
+            # Retry row by row so that one bad row does not reject its whole chunk
+            _logger.warning(f"Bulk admission chunk failed, retrying row by row: {str(e)}")
+            created = []
+            for candidate in valid:
+                try:
+                    with self.env.cr.savepoint():
+                        created.append((candidate, self._create_admissions([candidate])))
+                except Exception as row_error:
+                    outcome.append((candidate[0], candidate[1], False, str(row_error)))
+
+        admissions = self.env['student.admission'].browse([admission.id for _, admission in created])
+        self._post_process_admissions(admissions)
+
+        for (row_number, applicant, student_vals, admission_vals), admission in created:
+            outcome.append((row_number, applicant, admission, ''))
+        return sorted(outcome, key=lambda line: line[0])
+
+    def _create_admissions(self, candidates):
+        """Create the students (with their partners) and admissions of ``candidates`` in batch"""
+        students = self.env['student.student'].create([c[2] for c in candidates])
+        return self.env['student.admission'].create([
+            dict(c[3], student_id=student.id) for c, student in zip(candidates, students)
+        ])
+
+    def _post_process_admissions(self, admissions):
+        """Approve and queue the notifications of a chunk of new admissions"""
+        if not admissions:
+            return
+        if self.auto_approve:
+            admissions.action_approve()
+
+        # Send notifications
+        if self.send_email:
+            self._queue_admission_mail(admissions, 'university_management.email_template_admission_confirmation')
+
+        if self.send_sms:
+            self._send_admission_sms(admissions)
+
+    def _prepare_vals(self, record):
+        """Prepare student and admission values from a row, raising ValueError when invalid"""
+        missing = [column for column in self._required_columns
+                   if not self._get_value(record, *self._column_aliases(column))]
+        if missing:
+            raise ValueError(_('Missing required column(s): %s') % ', '.join(missing))
+
+        name = self._get_value(record, 'name', 'student_name')
+        email = self._get_value(record, 'email').lower()
+        mobile = self._get_value(record, 'mobile', 'phone')
+        date_of_birth = self._parse_date(self._get_value(record, 'date_of_birth', 'dob'))
+        if not date_of_birth:
+            raise ValueError(_('Invalid date of birth'))
+        gender = self._parse_gender(self._get_value(record, 'gender'))
+        current_address = self._get_value(record, 'current_address', 'address')
+        permanent_address = self._get_value(record, 'permanent_address') or current_address
+        category = self._get_value(record, 'category', 'admission_category').lower() or 'general'
+        if category not in dict(self.env['student.admission']._fields['admission_category'].selection):
+            category = 'general'
+        previous_percentage = float(self._get_value(record, 'previous_percentage') or 0)
+        previous_year = int(float(self._get_value(record, 'previous_year')))
+        aadhar = self._get_value(record, 'aadhar_number', 'aadhar').replace(' ', '')
+        blood_group = self._get_value(record, 'blood_group').lower()
 
-    def _prepare_admission_vals(self, record):
-        """Prepare admission values from record data"""
-        # Get or create student
         student_vals = {
-            'name': record.get('name') or record.get('student_name'),
-            'email': record.get('email'),
-            'mobile': record.get('mobile') or record.get('phone'),
-            'date_of_birth': self._parse_date(record.get('date_of_birth') or record.get('dob')),
-            'gender': self._parse_gender(record.get('gender')),
-            'blood_group': record.get('blood_group'),
-            'aadhar_number': record.get('aadhar_number') or record.get('aadhar'),
-            'address': record.get('address'),
-            'city': record.get('city'),
-            'state': record.get('state'),
-            'pincode': record.get('pincode') or record.get('pin_code'),
-            'father_name': record.get('father_name'),
-            'mother_name': record.get('mother_name'),
-            'guardian_mobile': record.get('guardian_mobile') or record.get('parent_mobile'),
+            'name': name,
+            'email': email,
+            'mobile': mobile,
+            'date_of_birth': date_of_birth,
+            'gender': gender,
+            'program_id': self.program_id.id,
+            'department_id': self.department_id.id,
+            'batch_id': self.batch_id.id,
+            'academic_year_id': self.academic_year_id.id,
+            'admission_date': self.admission_date,
+            'admission_category': category,
+            'previous_qualification': self._get_value(record, 'previous_qualification'),
+            'previous_institution': self._get_value(record, 'previous_school'),
+            'previous_percentage': previous_percentage,
+            'previous_year': previous_year,
+            'current_address': current_address,
+            'permanent_address': permanent_address,
+            'city': self._get_value(record, 'city'),
+            'zip': self._get_value(record, 'pincode', 'pin_code'),
         }
-
-        student = self.env['student.student'].create(student_vals)
+        if aadhar:
+            student_vals['aadhar_number'] = aadhar
+        if blood_group in dict(self.env['student.student']._fields['blood_group'].selection):
+            student_vals['blood_group'] = blood_group
+        if not self.auto_generate_registration and self._get_value(record, 'registration_number'):
+            student_vals['registration_number'] = self._get_value(record, 'registration_number')
 
         # Prepare admission values
         admission_vals = {
-            'student_id': student.id,
+            'applicant_name': name,
+            'email': email,
+            'mobile': mobile,
+            'date_of_birth': date_of_birth,
+            'gender': gender,
             'program_id': self.program_id.id,
-            'department_id': self.department_id.id,
             'batch_id': self.batch_id.id,
             'academic_year_id': self.academic_year_id.id,
             'admission_date': self.admission_date,
-            'admission_type': record.get('admission_type', 'regular'),
-            'category': record.get('category', 'general'),
-            'quota': record.get('quota', 'merit'),
-            'previous_school': record.get('previous_school'),
-            'previous_percentage': float(record.get('previous_percentage', 0)),
+            'admission_category': category,
+            'previous_qualification': self._get_value(record, 'previous_qualification'),
+            'previous_school': self._get_value(record, 'previous_school'),
+            'previous_board': self._get_value(record, 'previous_board'),
+            'previous_percentage': previous_percentage,
+            'previous_year': previous_year,
+            'current_address': current_address,
+            'permanent_address': permanent_address,
+            'father_name': self._get_value(record, 'father_name'),
+            'father_mobile': self._get_value(record, 'father_mobile'),
+            'mother_name': self._get_value(record, 'mother_name'),
+            'mother_mobile': self._get_value(record, 'mother_mobile'),
+            'guardian_mobile': self._get_value(record, 'guardian_mobile', 'parent_mobile'),
         }
 
-        return admission_vals
+        return student_vals, admission_vals
+
+    @staticmethod
+    def _column_aliases(column):
+        """Accepted header names of a column"""
+        return {
+            'name': ('name', 'student_name'),
+            'mobile': ('mobile', 'phone'),
+            'date_of_birth': ('date_of_birth', 'dob'),
+            'address': ('current_address', 'address'),
+        }.get(column, (column,))
+
+    @staticmethod
+    def _get_value(record, *columns):
+        """First non-empty value among ``columns``, as a stripped string"""
+        for column in columns:
+            value = record.get(column)
+            if value not in (None, False, ''):
+                if isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                return str(value).strip()
+        return ''
 
     def _parse_date(self, date_str):
         """Parse date from various formats"""
@@ -213,14 +408,13 @@ class BulkAdmissionWizard(models.TransientModel):
         else:
             return 'other'
 
-    def _send_admission_email(self, admission):
-        """Send admission confirmation email"""
-        template = self.env.ref('university_management.email_template_admission_confirmation',
-                                raise_if_not_found=False)
+    def _queue_admission_mail(self, admissions, template_xmlid):
+        """Queue one email per admission through the mail queue"""
+        template = self.env.ref(template_xmlid, raise_if_not_found=False)
         if template:
-            template.send_mail(admission.id, force_send=True)
+            template.send_mail_batch(admissions.ids)
 
-    def _send_admission_sms(self, admission):
+    def _send_admission_sms(self, admissions):
         """Send admission confirmation SMS"""
         # Implement SMS sending logic
         pass
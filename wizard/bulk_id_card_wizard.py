@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, Command, _
 from odoo.exceptions import UserError
+import logging
+_logger = logging.getLogger(__name__)
 
 
 class BulkIdCardWizard(models.TransientModel):
@@ -28,7 +30,6 @@ class BulkIdCardWizard(models.TransientModel):
     faculty_ids = fields.Many2many('faculty.faculty', string='Faculty',
                                    domain=[('state', '=', 'active')])
 
-    card_template_id = fields.Many2one('id.card.template', string='Card Template')
     validity_date = fields.Date(string='Valid Until', required=True,
                                 default=lambda self: fields.Date.today().replace(month=12, day=31))
 
@@ -37,7 +38,23 @@ class BulkIdCardWizard(models.TransientModel):
 
     preview_count = fields.Integer(string='Cards to Generate', compute='_compute_preview_count')
 
-    @api.depends('card_type', 'student_ids', 'faculty_ids', 'program_id', 'department_id', 'batch_id')
+    # Generation run; its progress is kept on the persistent generation record
+    generation_id = fields.Many2one('student.id.card.generation', string='Generation', readonly=True)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', compute='_compute_state')
+    run_started = fields.Datetime(related='generation_id.run_started')
+    progress_total = fields.Integer(related='generation_id.progress_total')
+    progress_done = fields.Integer(related='generation_id.progress_done')
+    progress_percentage = fields.Float(related='generation_id.progress_percentage')
+    generated_card_ids = fields.Many2many(related='generation_id.generated_card_ids')
+    error_message = fields.Text(related='generation_id.error_message')
+
+    @api.depends('card_type', 'student_ids', 'faculty_ids', 'program_id', 'department_id', 'batch_id',
+                 'regenerate_existing')
     def _compute_preview_count(self):
         """Compute number of cards to be generated"""
         for wizard in self:
@@ -45,32 +62,17 @@ class BulkIdCardWizard(models.TransientModel):
                 if wizard.student_ids:
                     wizard.preview_count = len(wizard.student_ids)
                 else:
-                    domain = [('state', '=', 'enrolled')]
-                    if wizard.program_id:
-                        domain.append(('program_id', '=', wizard.program_id.id))
-                    if wizard.department_id:
-                        domain.append(('department_id', '=', wizard.department_id.id))
-                    if wizard.batch_id:
-                        domain.append(('batch_id', '=', wizard.batch_id.id))
-
+                    domain = wizard._get_student_domain()
                     if not wizard.regenerate_existing:
                         domain.append(('id_card_id', '=', False))
-
                     wizard.preview_count = self.env['student.student'].search_count(domain)
             else:
                 wizard.preview_count = len(wizard.faculty_ids)
 
-    @api.onchange('card_type')
-    def _onchange_card_type(self):
-        """Update default template based on card type"""
-        if self.card_type == 'student':
-            self.card_template_id = self.env.ref(
-                'university_management.id_card_template_student',
-                raise_if_not_found=False)
-        elif self.card_type == 'faculty':
-            self.card_template_id = self.env.ref(
-                'university_management.id_card_template_faculty',
-                raise_if_not_found=False)
+    @api.depends('generation_id.state')
+    def _compute_state(self):
+        for wizard in self:
+            wizard.state = wizard.generation_id.state or 'draft'
 
     def action_generate_id_cards(self):
         """Generate ID cards in bulk"""
@@ -78,128 +80,65 @@ class BulkIdCardWizard(models.TransientModel):
 
         if self.card_type == 'student':
             return self._generate_student_cards()
-        elif self.card_type == 'faculty':
-            return self._generate_faculty_cards()
+        raise UserError(_('Only student ID cards can be generated in bulk.'))
+
+    def _get_student_domain(self):
+        domain = [('state', '=', 'enrolled')]
+        if self.program_id:
+            domain.append(('program_id', '=', self.program_id.id))
+        if self.department_id:
+            domain.append(('department_id', '=', self.department_id.id))
+        if self.batch_id:
+            domain.append(('batch_id', '=', self.batch_id.id))
+        return domain
+
+    def _get_students(self):
+        """Selected students, or the enrolled students matching the filters"""
+        return self.student_ids or self.env['student.student'].search(self._get_student_domain())
 
     def _generate_student_cards(self):
-        """Generate student ID cards"""
-        # Get students
-        if self.student_ids:
-            students = self.student_ids
-        else:
-            domain = [('state', '=', 'enrolled')]
-            if self.program_id:
-                domain.append(('program_id', '=', self.program_id.id))
-            if self.department_id:
-                domain.append(('department_id', '=', self.department_id.id))
-            if self.batch_id:
-                domain.append(('batch_id', '=', self.batch_id.id))
-
-            if not self.regenerate_existing:
-                domain.append(('id_card_id', '=', False))
-
-            students = self.env['student.student'].search(domain)
-
+        """Generate student ID cards
+
+        The selection is recorded on a ``student.id.card.generation``; small
+        runs are generated inline, larger ones are queued for the ID card
+        cron, which commits after every chunk. Generating a failed run again
+        resumes it.
+        """
+        if not self.generation_id:
+            self.generation_id = self.env['student.id.card.generation'].create({
+                'student_ids': [Command.set(self._get_students().ids)],
+                'validity_date': self.validity_date,
+                'regenerate_existing': self.regenerate_existing,
+            })
+        generation = self.generation_id
+
+        students = generation._get_pending_students()
         if not students:
             raise UserError(_('No students found matching the criteria.'))
 
-        # Generate cards
-        StudentIdCard = self.env['student.id.card']
-        generated_cards = self.env['student.id.card']
-
-        for student in students:
-            # Check if card exists
-            existing_card = StudentIdCard.search([
-                ('student_id', '=', student.id),
-                ('state', 'in', ['generated', 'printed'])
-            ], limit=1)
-
-            if existing_card and not self.regenerate_existing:
-                continue
-
-            # Generate new card
-            card_vals = {
-                'student_id': student.id,
-                'card_number': self._generate_card_number(student),
-                'issue_date': fields.Date.today(),
-                'valid_until': self.validity_date,
-                'template_id': self.card_template_id.id if self.card_template_id else False,
-                'state': 'generated'
+        if generation._start():
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('ID Cards Queued'),
+                    'message': _('%s ID cards will be generated in the background in chunks of %s.')
+                               % (len(students), generation._generation_chunk_size),
+                    'type': 'info',
+                    'sticky': True,
+                }
             }
 
-            card = StudentIdCard.create(card_vals)
-            generated_cards |= card
-
-            # Update student record
-            student.write({'id_card_id': card.id})
+        if generation.state == 'failed':
+            raise UserError(_('ID card generation failed: %s') % generation.error_message)
 
         # Auto print if enabled
-        if self.auto_print and generated_cards:
-            return self.env.ref('university_management.action_report_student_id_card').report_action(generated_cards)
-
-        # Show result
-        return {
-            'name': _('Generated ID Cards'),
-            'type': 'ir.actions.act_window',
-            'res_model': 'student.id.card',
-            'view_mode': 'list,form',
-            'domain': [('id', 'in', generated_cards.ids)],
-            'target': 'current',
-        }
-
-    def _generate_faculty_cards(self):
-        """Generate faculty ID cards"""
-        if not self.faculty_ids:
-            raise UserError(_('Please select faculty members.'))
-
-        FacultyIdCard = self.env['faculty.id.card']
-        generated_cards = self.env['faculty.id.card']
-
-        for faculty in self.faculty_ids:
-            # Check if card exists
-            existing_card = FacultyIdCard.search([
-                ('faculty_id', '=', faculty.id),
-                ('state', 'in', ['generated', 'printed'])
-            ], limit=1)
-
-            if existing_card and not self.regenerate_existing:
-                continue
-
-            # Generate new card
-            card_vals = {
-                'faculty_id': faculty.id,
-                'card_number': self._generate_card_number(faculty),
-                'issue_date': fields.Date.today(),
-                'valid_until': self.validity_date,
-                'template_id': self.card_template_id.id if self.card_template_id else False,
-                'state': 'generated'
-            }
+        if self.auto_print and generation.generated_card_ids:
+            return self.env.ref('university_management.action_report_student_id_card').report_action(
+                generation.generated_card_ids)
 
-            card = FacultyIdCard.create(card_vals)
-            generated_cards |= card
+        return generation.action_view_cards()
 
-            # Update faculty record
-            faculty.write({'id_card_id': card.id})
-
-        # Auto print if enabled
-        if self.auto_print and generated_cards:
-            return self.env.ref('university_management.action_report_faculty_id_card').report_action(generated_cards)
-
-        # Show result
-        return {
-            'name': _('Generated ID Cards'),
-            'type': 'ir.actions.act_window',
-            'res_model': 'faculty.id.card',
-            'view_mode': 'list,form',
-            'domain': [('id', 'in', generated_cards.ids)],
-            'target': 'current',
-        }
-
-    def _generate_card_number(self, record):
-        """Generate unique card number"""
-        if hasattr(record, 'registration_number') and record.registration_number:
-            return f"ID-{record.registration_number}"
-        elif hasattr(record, 'employee_id') and record.employee_id:
-            return f"ID-{record.employee_id}"
-        else:
-            return self.env['ir.sequence'].next_by_code('id.card.sequence') or 'ID-NEW'
+    def action_view_cards(self):
+        """Show the cards generated by this wizard"""
+        return self.generation_id.action_view_cards()
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, Command, _
 from odoo.exceptions import UserError
+from collections import defaultdict
 import logging
 _logger = logging.getLogger(__name__)
 
@@ -43,22 +44,19 @@ class GenerateHallTicketWizard(models.TransientModel):
     preview_lines = fields.One2many('generate.hall.ticket.wizard.line', 'wizard_id',
                                     string='Students Preview', compute='_compute_preview_lines')
 
-    @api.depends('examination_id', 'program_id', 'department_id', 'batch_id', 'semester', 'student_ids')
+    @api.depends('examination_id', 'program_id', 'department_id', 'batch_id', 'semester', 'student_ids',
+                 'check_eligibility', 'min_attendance', 'check_fee_payment', 'check_documents')
     def _compute_preview_lines(self):
         """Compute preview of students and their eligibility"""
         for wizard in self:
             students = wizard.student_ids if wizard.student_ids else wizard._get_students()
+            eligibility = wizard._evaluate_eligibility(students)
 
-            lines = []
-            for student in students:
-                eligible, reason = wizard._check_student_eligibility(student)
-                lines.append((0, 0, {
-                    'student_id': student.id,
-                    'eligible': eligible,
-                    'reason': reason
-                }))
-
-            wizard.preview_lines = lines
+            wizard.preview_lines = [Command.clear()] + [Command.create({
+                'student_id': student.id,
+                'eligible': eligibility[student.id][0],
+                'reason': eligibility[student.id][1],
+            }) for student in students]
 
     def _get_students(self):
         """Get students based on filters"""
@@ -76,125 +74,117 @@ class GenerateHallTicketWizard(models.TransientModel):
 
         return self.env['student.student'].search(domain)
 
-    def _check_student_eligibility(self, student):
-        """Check if student is eligible for hall ticket"""
-        if not self.check_eligibility:
-            return True, 'No eligibility check'
-
-        reasons = []
-
-        # Check attendance
-        attendance_percentage = self._get_student_attendance(student)
-        if attendance_percentage < self.min_attendance:
-            return False, f'Low attendance: {attendance_percentage:.1f}%'
-        reasons.append(f'Attendance: {attendance_percentage:.1f}%')
-
-        # Check fee payment
-        if self.check_fee_payment:
-            fee_status = self._check_fee_status(student)
-            if not fee_status:
-                return False, 'Fee payment pending'
-            reasons.append('Fee paid')
-
-        # Check documents
-        if self.check_documents:
-            docs_verified = self._check_documents(student)
-            if not docs_verified:
-                return False, 'Documents not verified'
-            reasons.append('Documents verified')
-
-        return True, ', '.join(reasons)
-
-    def _get_student_attendance(self, student):
-        """Calculate student attendance percentage"""
-        Attendance = self.env['student.attendance']
-
-        total = Attendance.search_count([
-            ('student_id', '=', student.id),
-            ('semester', '=', self.semester)
-        ])
+    def _evaluate_eligibility(self, students):
+        """Return ``{student_id: (eligible, reason)}`` for the whole candidate set
 
-        present = Attendance.search_count([
-            ('student_id', '=', student.id),
-            ('semester', '=', self.semester),
-            ('state', '=', 'present')
-        ])
+        Attendance, pending fees and unverified documents are each read
+        with one grouped query, whatever the number of students.
+        """
+        if not self.check_eligibility:
+            return {student.id: (True, 'No eligibility check') for student in students}
 
-        return (present / total * 100) if total > 0 else 0.0
+        attendance = self._get_attendance_percentages(students)
+        pending_fees = self._get_students_with_pending_fees(students) if self.check_fee_payment else set()
+        unverified = self._get_students_with_unverified_documents(students) if self.check_documents else set()
 
-    def _check_fee_status(self, student):
-        """Check if student has paid required fees"""
-        pending_fees = self.env['fee.payment'].search_count([
-            ('student_id', '=', student.id),
-            ('semester', '=', self.semester),
+        eligibility = {}
+        for student in students:
+            attendance_percentage = attendance.get(student.id, 0.0)
+            if attendance_percentage < self.min_attendance:
+                eligibility[student.id] = (False, f'Low attendance: {attendance_percentage:.1f}%')
+                continue
+            reasons = [f'Attendance: {attendance_percentage:.1f}%']
+
+            # Check fee payment
+            if self.check_fee_payment:
+                if student.id in pending_fees:
+                    eligibility[student.id] = (False, 'Fee payment pending')
+                    continue
+                reasons.append('Fee paid')
+
+            # Check documents
+            if self.check_documents:
+                if student.id in unverified:
+                    eligibility[student.id] = (False, 'Documents not verified')
+                    continue
+                reasons.append('Documents verified')
+
+            eligibility[student.id] = (True, ', '.join(reasons))
+        return eligibility
+
+    def _get_attendance_percentages(self, students):
+        """Attendance percentage per student over the examination's semester"""
+        domain = [('student_id', 'in', students.ids)]
+        semester = self.examination_id.semester_id
+        if semester:
+            domain += [('date', '>=', semester.start_date), ('date', '<=', semester.end_date)]
+
+        totals = defaultdict(int)
+        present = defaultdict(int)
+        for student, state, count in self.env['student.attendance']._read_group(
+                domain, ['student_id', 'state'], ['__count']):
+            totals[student.id] += count
+            if state == 'present':
+                present[student.id] += count
+
+        return {student_id: present[student_id] / total * 100 for student_id, total in totals.items()}
+
+    def _get_students_with_pending_fees(self, students):
+        """Ids of the students with overdue pending payments for the semester"""
+        return {student.id for [student] in self.env['fee.payment']._read_group([
+            ('student_id', 'in', students.ids),
+            ('semester_id.semester_number', '=', int(self.semester)),
             ('state', '=', 'pending'),
             ('due_date', '<', fields.Date.today())
-        ])
-
-        return pending_fees == 0
+        ], ['student_id'])}
 
-    def _check_documents(self, student):
-        """Check if student documents are verified"""
-        unverified = self.env['student.document'].search_count([
-            ('student_id', '=', student.id),
-            ('verification_status', '!=', 'verified'),
+    def _get_students_with_unverified_documents(self, students):
+        """Ids of the students with mandatory documents not verified yet"""
+        return {student.id for [student] in self.env['student.document']._read_group([
+            ('student_id', 'in', students.ids),
+            ('state', '!=', 'verified'),
             ('is_mandatory', '=', True)
-        ])
-
-        return unverified == 0
+        ], ['student_id'])}
 
     def action_generate_hall_tickets(self):
         """Generate hall tickets for eligible students"""
         self.ensure_one()
 
         # Get eligible students
-        eligible_lines = self.preview_lines.filtered(lambda l: l.eligible)
+        eligible_students = self.preview_lines.filtered(lambda l: l.eligible).student_id
 
-        if not eligible_lines:
+        if not eligible_students:
             raise UserError(_('No eligible students found for hall ticket generation.'))
 
-        HallTicket = self.env['hall.ticket']
-        generated_tickets = self.env['hall.ticket']
+        HallTicket = self.env['examination.hall.ticket']
 
-        for line in eligible_lines:
-            student = line.student_id
-
-            # Check if hall ticket already exists
-            existing = HallTicket.search([
-                ('student_id', '=', student.id),
+        # One existence check for the whole selection
+        existing = {
+            ticket.student_id.id: ticket
+            for ticket in HallTicket.search([
+                ('student_id', 'in', eligible_students.ids),
                 ('examination_id', '=', self.examination_id.id)
-            ], limit=1)
+            ])
+        }
 
-            if existing:
-                if existing.state == 'cancelled':
-                    existing.write({'state': 'generated'})
-                    generated_tickets |= existing
-                continue
+        # Cancelled tickets are reissued, active ones left untouched
+        reissued = HallTicket.browse([
+            ticket.id for ticket in existing.values() if ticket.state == 'cancelled'
+        ])
+        reissued.write({'state': 'issued', 'is_eligible': True})
 
-            # Generate hall ticket
-            ticket_vals = {
-                'student_id': student.id,
-                'examination_id': self.examination_id.id,
-                'hall_ticket_number': self._generate_hall_ticket_number(student),
-                'program_id': student.program_id.id,
-                'department_id': student.department_id.id,
-                'semester': self.semester,
-                'batch_id': student.batch_id.id,
-                'issue_date': fields.Date.today(),
-                'exam_center': self.examination_id.exam_center if hasattr(self.examination_id, 'exam_center') else '',
-                'template_id': self.hall_ticket_template_id.id if self.hall_ticket_template_id else False,
-                'state': 'generated'
-            }
-
-            ticket = HallTicket.create(ticket_vals)
-            generated_tickets |= ticket
-
-            # Update student record
-            student.write({'hall_ticket_id': ticket.id})
-
-            # Send email
-            if self.send_email and student.email:
-                self._send_hall_ticket_email(ticket)
+        generated_tickets = reissued | HallTicket.create([{
+            'name': self._generate_hall_ticket_number(student),
+            'student_id': student.id,
+            'examination_id': self.examination_id.id,
+            'issue_date': fields.Date.today(),
+            'is_eligible': True,
+            'state': 'issued'
+        } for student in eligible_students if student.id not in existing])
+
+        # Send email
+        if self.send_email:
+            self._send_hall_ticket_email(generated_tickets.filtered(lambda t: t.student_id.email))
 
         # Auto print if enabled
         if self.auto_print and generated_tickets:
@@ -204,7 +194,7 @@ class GenerateHallTicketWizard(models.TransientModel):
         return {
             'name': _('Generated Hall Tickets'),
             'type': 'ir.actions.act_window',
-            'res_model': 'hall.ticket',
+            'res_model': 'examination.hall.ticket',
             'view_mode': 'list,form',
             'domain': [('id', 'in', generated_tickets.ids)],
             'target': 'current',
@@ -212,17 +202,17 @@ class GenerateHallTicketWizard(models.TransientModel):
 
     def _generate_hall_ticket_number(self, student):
         """Generate unique hall ticket number"""
-        exam_code = self.examination_id.code if hasattr(self.examination_id, 'code') else 'EX'
+        exam_code = self.examination_id.code or 'EX'
         reg_no = student.registration_number or student.id
         return f"HT-{exam_code}-{reg_no}-{fields.Date.today().year}"
 
-    def _send_hall_ticket_email(self, hall_ticket):
-        """Send hall ticket via email"""
+    def _send_hall_ticket_email(self, hall_tickets):
+        """Queue the hall ticket emails"""
         try:
             template = self.env.ref('university_management.email_template_hall_ticket',
                                     raise_if_not_found=False)
-            if template:
-                template.send_mail(hall_ticket.id, force_send=True)
+            if template and hall_tickets:
+                template.send_mail_batch(hall_tickets.ids)
                 return True
             return False
         except Exception as e:
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, Command, _
 from odoo.exceptions import UserError, ValidationError
+from collections import defaultdict
 
 
 class PromoteStudentWizard(models.TransientModel):
@@ -63,7 +64,8 @@ class PromoteStudentWizard(models.TransientModel):
     preview_lines = fields.One2many('promote.student.wizard.line', 'wizard_id',
                                     string='Students Preview', compute='_compute_preview_lines')
 
-    @api.depends('current_program_id', 'current_batch_id', 'current_semester', 'criteria', 'student_ids')
+    @api.depends('current_program_id', 'current_batch_id', 'current_semester', 'criteria', 'student_ids',
+                 'min_attendance_percentage', 'check_backlogs')
     def _compute_preview_lines(self):
         """Compute preview of students to be promoted"""
         for wizard in self:
@@ -72,17 +74,13 @@ class PromoteStudentWizard(models.TransientModel):
             else:
                 students = wizard._get_eligible_students()
 
-            lines = []
-            for student in students:
-                eligible, reason = wizard._check_eligibility(student)
-                lines.append((0, 0, {
-                    'student_id': student.id,
-                    'current_semester': wizard.current_semester,
-                    'eligible': eligible,
-                    'reason': reason
-                }))
-
-            wizard.preview_lines = lines
+            eligibility = wizard._evaluate_eligibility(students)
+            wizard.preview_lines = [Command.clear()] + [Command.create({
+                'student_id': student.id,
+                'current_semester': wizard.current_semester,
+                'eligible': eligibility[student.id][0],
+                'reason': eligibility[student.id][1],
+            }) for student in students]
 
     def _get_eligible_students(self):
         """Get students eligible for promotion"""
@@ -95,74 +93,87 @@ class PromoteStudentWizard(models.TransientModel):
 
         return self.env['student.student'].search(domain)
 
-    def _check_eligibility(self, student):
-        """Check if student is eligible for promotion"""
-        if self.criteria == 'all':
-            return True, 'Selected for promotion'
-
-        reasons = []
-
-        # Check attendance
-        if self.criteria in ['attendance', 'result']:
-            attendance_percentage = self._get_student_attendance(student)
-            if attendance_percentage < self.min_attendance_percentage:
-                return False, f'Attendance {attendance_percentage:.1f}% < {self.min_attendance_percentage}%'
-            reasons.append(f'Attendance: {attendance_percentage:.1f}%')
-
-        # Check results
-        if self.criteria == 'result':
-            has_backlogs = self._check_student_backlogs(student)
-            if has_backlogs and self.check_backlogs:
-                return False, 'Has pending backlogs'
-
-            if not self._check_passed_exams(student):
-                return False, 'Did not pass all exams'
-
-            reasons.append('Passed all exams')
-
-        return True, ', '.join(reasons) if reasons else 'Eligible'
+    def _evaluate_eligibility(self, students):
+        """Return ``{student_id: (eligible, reason)}`` for all candidates
 
-    def _get_student_attendance(self, student):
-        """Calculate student attendance percentage"""
-        Attendance = self.env['student.attendance']
-
-        # Get attendance for current semester
-        total = Attendance.search_count([
-            ('student_id', '=', student.id),
-            ('semester', '=', self.current_semester)
-        ])
-
-        present = Attendance.search_count([
-            ('student_id', '=', student.id),
-            ('semester', '=', self.current_semester),
-            ('state', '=', 'present')
-        ])
-
-        return (present / total * 100) if total > 0 else 0.0
+        Attendance, backlogs and current semester failures are each read
+        with one grouped query for the whole candidate set.
+        """
+        if self.criteria == 'all':
+            return {student.id: (True, 'Selected for promotion') for student in students}
 
-    def _check_student_backlogs(self, student):
-        """Check if student has backlogs"""
-        ExamResult = self.env['exam.result']
+        check_attendance = self.criteria in ['attendance', 'result']
+        check_results = self.criteria == 'result'
+        attendance = self._get_attendance_percentages(students) if check_attendance else {}
+        backlogs = self._get_students_with_backlogs(students) if check_results and self.check_backlogs else set()
+        failed = self._get_students_with_failed_exams(students) if check_results else set()
 
-        backlogs = ExamResult.search_count([
-            ('student_id', '=', student.id),
+        eligibility = {}
+        for student in students:
+            reasons = []
+
+            # Check attendance
+            if check_attendance:
+                attendance_percentage = attendance.get(student.id, 0.0)
+                if attendance_percentage < self.min_attendance_percentage:
+                    eligibility[student.id] = (
+                        False, f'Attendance {attendance_percentage:.1f}% < {self.min_attendance_percentage}%')
+                    continue
+                reasons.append(f'Attendance: {attendance_percentage:.1f}%')
+
+            # Check results
+            if check_results:
+                if student.id in backlogs:
+                    eligibility[student.id] = (False, 'Has pending backlogs')
+                    continue
+                if student.id in failed:
+                    eligibility[student.id] = (False, 'Did not pass all exams')
+                    continue
+                reasons.append('Passed all exams')
+
+            eligibility[student.id] = (True, ', '.join(reasons) if reasons else 'Eligible')
+        return eligibility
+
+    def _get_attendance_percentages(self, students):
+        """Attendance percentage per student over the current semester's courses"""
+        totals = defaultdict(int)
+        present = defaultdict(int)
+        for student, state, count in self.env['student.attendance']._read_group([
+            ('student_id', 'in', students.ids),
+            ('course_id.semester_id.semester_number', '=', int(self.current_semester)),
+        ], ['student_id', 'state'], ['__count']):
+            totals[student.id] += count
+            if state == 'present':
+                present[student.id] += count
+
+        return {student_id: present[student_id] / total * 100 for student_id, total in totals.items()}
+
+    def _get_students_with_backlogs(self, students):
+        """Ids of the students with a course failed and never passed since"""
+        return {student.id for student, course, passed in self.env['examination.result']._read_group([
+            ('student_id', 'in', students.ids),
+            ('state', '=', 'published'),
+        ], ['student_id', 'course_id'], ['is_pass:bool_or']) if not passed}
+
+    def _get_students_with_failed_exams(self, students):
+        """Ids of the students who failed an exam of the current semester"""
+        return {student.id for [student] in self.env['examination.result']._read_group([
+            ('student_id', 'in', students.ids),
+            ('semester_id.semester_number', '=', int(self.current_semester)),
             ('result', '=', 'fail'),
-            ('is_cleared', '=', False)
-        ])
-
-        return backlogs > 0
-
-    def _check_passed_exams(self, student):
-        """Check if student passed all current semester exams"""
-        ExamResult = self.env['exam.result']
-
-        failed_count = ExamResult.search_count([
-            ('student_id', '=', student.id),
-            ('semester', '=', self.current_semester),
-            ('result', '=', 'fail')
-        ])
+        ], ['student_id'])}
 
-        return failed_count == 0
+    def _get_target_semester(self):
+        """Semester number the students are promoted to"""
+        if self.promotion_type == 'graduate':
+            return int(self.current_semester)
+        if self.next_semester:
+            return int(self.next_semester)
+        target = int(self.current_semester) + (2 if self.promotion_type == 'year' else 1)
+        if target > 8:
+            raise UserError(_('Students in semester %s cannot be promoted further; mark them as graduated.')
+                            % self.current_semester)
+        return target
 
     def action_promote_students(self):
         """Promote selected students"""
@@ -177,20 +188,19 @@ class PromoteStudentWizard(models.TransientModel):
         if not students:
             raise UserError(_('No eligible students found for promotion.'))
 
-        promoted_count = 0
-        errors = []
+        target_semester = self._get_target_semester()
+        try:
+            with self.env.cr.savepoint():
+                self._promote_students(students, target_semester)
+        except Exception as e:
+            raise UserError(_('Promotion failed, no student was promoted:\n%s') % str(e))
 
-        for student in students:
-            try:
-                self._promote_student(student)
-                promoted_count += 1
-            except Exception as e:
-                errors.append(f"{student.name}: {str(e)}")
+        # Send notification
+        if self.send_notification:
+            self._send_promotion_notification(students)
 
         # Show result message
-        message = _('%s students promoted successfully.') % promoted_count
-        if errors:
-            message += _('\n\nErrors:\n') + '\n'.join(errors[:5])
+        message = _('%s students promoted successfully.') % len(students)
 
         return {
             'type': 'ir.actions.client',
@@ -198,70 +208,78 @@ class PromoteStudentWizard(models.TransientModel):
             'params': {
                 'title': _('Student Promotion'),
                 'message': message,
-                'type': 'success' if not errors else 'warning',
+                'type': 'success',
                 'sticky': True,
             }
         }
 
-    def _promote_student(self, student):
-        """Promote individual student"""
-        promotion_vals = {
+    def _promote_students(self, students, target_semester):
+        """Promote ``students`` with batched creates and one write per target"""
+        # Create promotion records
+        self.env['student.promotion'].create([{
             'student_id': student.id,
-            'from_semester': self.current_semester,
-            'to_semester': self.next_semester,
-            'from_batch_id': self.current_batch_id.id,
-            'to_batch_id': self.next_batch_id.id if self.next_batch_id else self.current_batch_id.id,
+            'from_semester': student.current_semester,
+            'to_semester': target_semester,
+            'from_batch_id': student.batch_id.id,
+            'to_batch_id': self.next_batch_id.id or student.batch_id.id,
             'academic_year_id': self.academic_year_id.id,
             'promotion_date': self.promotion_date,
             'promotion_type': self.promotion_type,
             'state': 'promoted'
-        }
-
-        # Create promotion record
-        self.env['student.promotion'].create(promotion_vals)
-
-        # Update student record
-        update_vals = {
-            'current_semester': self.next_semester if self.promotion_type != 'graduate' else self.current_semester,
-            'batch_id': self.next_batch_id.id if self.next_batch_id else student.batch_id.id,
-        }
+        } for student in students])
 
+        # Update student records; students keep their own batch without a next batch
+        update_vals = {'current_semester': target_semester}
+        if self.next_batch_id:
+            update_vals['batch_id'] = self.next_batch_id.id
         if self.promotion_type == 'graduate':
             update_vals['state'] = 'graduated'
-            update_vals['graduation_date'] = self.promotion_date
-
-        student.write(update_vals)
+        students.write(update_vals)
 
         # Auto assign courses
         if self.auto_assign_courses and self.promotion_type != 'graduate':
-            self._assign_courses(student)
-
-        # Send notification
-        if self.send_notification:
-            self._send_promotion_notification(student)
-
-    def _assign_courses(self, student):
-        """Auto assign courses for next semester"""
-        courses = self.env['university.course'].search([
-            ('program_id', '=', student.program_id.id),
-            ('semester', '=', self.next_semester)
-        ])
-
-        for course in courses:
-            self.env['student.course.enrollment'].create({
+            self._assign_courses(students, target_semester)
+
+    def _assign_courses(self, students, target_semester):
+        """Register students for their program's courses of the target semester
+
+        The courses of every program come from one search; registrations are
+        created in one batch and each course gets its students in one write.
+        """
+        courses_by_program = defaultdict(lambda: self.env['university.course'])
+        for course in self.env['university.course'].search([
+            ('program_id', 'in', students.program_id.ids),
+            ('semester_id.semester_number', '=', target_semester),
+        ]):
+            courses_by_program[course.program_id.id] |= course
+
+        registrations = []
+        students_by_course = defaultdict(list)
+        for student in students:
+            courses = courses_by_program.get(student.program_id.id)
+            if not courses:
+                continue
+            registrations.append({
                 'student_id': student.id,
-                'course_id': course.id,
-                'semester': self.next_semester,
                 'academic_year_id': self.academic_year_id.id,
-                'state': 'enrolled'
+                'semester_id': courses[0].semester_id.id,
+                'course_ids': [Command.set(courses.ids)],
+                'state': 'registered',
             })
+            for course in courses:
+                students_by_course[course].append(student.id)
+
+        self.env['student.registration'].create(registrations)
+        for course, student_ids in students_by_course.items():
+            course.write({'student_ids': [Command.link(student_id) for student_id in student_ids]})
 
-    def _send_promotion_notification(self, student):
-        """Send promotion notification to student"""
+    def _send_promotion_notification(self, students):
+        """Queue promotion notifications to students"""
         template = self.env.ref('university_management.email_template_student_promotion',
                                 raise_if_not_found=False)
-        if template and student.email:
-            template.send_mail(student.id, force_send=True)
+        recipients = students.filtered(lambda s: s.email)
+        if template and recipients:
+            template.send_mail_batch(recipients.ids)
 
 
 class PromoteStudentWizardLine(models.TransientModel):
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, Command, _
 from odoo.exceptions import UserError
 import logging
 _logger = logging.getLogger(__name__)
@@ -44,6 +44,20 @@ class PublishResultWizard(models.TransientModel):
     fail_count = fields.Integer(string='Failed', compute='_compute_statistics')
     pass_percentage = fields.Float(string='Pass %', compute='_compute_statistics')
 
+    # Publication run; its progress is kept on the persistent publication record
+    publication_id = fields.Many2one('examination.result.publication', string='Publication', readonly=True)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', compute='_compute_state')
+    progress_total = fields.Integer(related='publication_id.progress_total')
+    progress_done = fields.Integer(related='publication_id.progress_done')
+    progress_percentage = fields.Float(related='publication_id.progress_percentage')
+    marksheets_generated = fields.Integer(related='publication_id.marksheets_generated')
+    error_message = fields.Text(related='publication_id.error_message')
+
     @api.depends('examination_id', 'program_id', 'department_id', 'semester', 'result_ids')
     def _compute_preview_count(self):
         """Compute number of results to publish"""
@@ -66,12 +80,17 @@ class PublishResultWizard(models.TransientModel):
             total = wizard.pass_count + wizard.fail_count
             wizard.pass_percentage = (wizard.pass_count / total * 100) if total > 0 else 0.0
 
+    @api.depends('publication_id.state')
+    def _compute_state(self):
+        for wizard in self:
+            wizard.state = wizard.publication_id.state or 'draft'
+
     def _get_results(self):
         """Get results to be published"""
         domain = [
             ('examination_id', '=', self.examination_id.id),
-            ('semester', '=', self.semester),
-            ('state', '=', 'evaluated')
+            ('semester_id.semester_number', '=', int(self.semester)),
+            ('state', '=', 'verified')
         ]
 
         if self.program_id:
@@ -81,54 +100,52 @@ class PublishResultWizard(models.TransientModel):
 
         return self.env['examination.result'].search(domain)
 
+    def _get_pending_results(self):
+        """Selected results not published yet"""
+        if self.publication_id:
+            return self.publication_id._get_pending_results()
+        if self.result_ids:
+            return self.result_ids.filtered(lambda r: r.state != 'published')
+        return self._get_results()
+
     def action_publish_results(self):
-        """Publish examination results"""
-        self.ensure_one()
+        """Publish examination results
 
-        # Get results
-        results = self.result_ids if self.result_ids else self._get_results()
+        The selection is recorded on an ``examination.result.publication``;
+        small publications run inline, larger ones are queued for the
+        publication cron, which commits after every chunk. Publishing a
+        failed run again resumes it.
+        """
+        self.ensure_one()
 
+        results = self._get_pending_results()
         if not results:
             raise UserError(_('No results found to publish.'))
 
-        published_count = 0
-        marksheets_generated = 0
-        errors = []
-
-        for result in results:
-            try:
-                # Publish result
-                result.write({
-                    'state': 'published',
-                    'publish_date': self.publish_date,
-                    'is_published': True
-                })
-                published_count += 1
-
-                # Generate marksheet
-                if self.generate_marksheet:
-                    marksheet = self._generate_marksheet(result)
-                    if marksheet:
-                        marksheets_generated += 1
-
-                # Send notifications
-                if self.send_email:
-                    self._send_email_notification(result)
-
-                if self.send_sms:
-                    self._send_sms_notification(result)
-
-                # Post on portal
-                if self.publish_on_portal:
-                    result.write({'portal_published': True})
-
-            except Exception as e:
-                errors.append(f"{result.student_id.name}: {str(e)}")
-                _logger.error(f"Result publication error: {str(e)}")
-
-        # Update examination status
-        if published_count > 0:
-            self.examination_id.write({'result_published': True})
+        # Pass rate of the selection, before publishing empties the pending results
+        pass_percentage = self.pass_percentage
+        if not self.publication_id:
+            self.publication_id = self.env['examination.result.publication'].create({
+                'examination_id': self.examination_id.id,
+                'result_ids': [Command.set(results.ids)],
+                'generate_marksheet': self.generate_marksheet,
+                'send_email': self.send_email,
+                'send_sms': self.send_sms,
+            })
+        publication = self.publication_id
+
+        if publication._start():
+            return {
+                'type': 'ir.actions.client',
+                'tag': 'display_notification',
+                'params': {
+                    'title': _('Results Queued'),
+                    'message': _('%s results will be published in the background in chunks of %s.')
+                               % (len(results), publication._publish_chunk_size),
+                    'type': 'info',
+                    'sticky': True,
+                }
+            }
 
         # Show result message
         message = _(
@@ -136,10 +153,10 @@ class PublishResultWizard(models.TransientModel):
             'Published: %s\n'
             'Marksheets Generated: %s\n'
             'Pass Rate: %.2f%%'
-        ) % (published_count, marksheets_generated, self.pass_percentage)
+        ) % (publication.progress_done, publication.marksheets_generated, pass_percentage)
 
-        if errors:
-            message += _('\n\nErrors:\n') + '\n'.join(errors[:5])
+        if publication.error_message:
+            message += _('\n\nErrors:\n') + publication.error_message
 
         return {
             'type': 'ir.actions.client',
@@ -147,94 +164,11 @@ class PublishResultWizard(models.TransientModel):
             'params': {
                 'title': _('Results Published'),
                 'message': message,
-                'type': 'success' if not errors else 'warning',
+                'type': 'success' if publication.state == 'done' else 'warning',
                 'sticky': True,
             }
         }
 
-    def _generate_marksheet(self, result):
-        """Generate marksheet for student"""
-        try:
-            Marksheet = self.env['marksheet.marksheet']
-
-            # Check if marksheet already exists
-            existing = Marksheet.search([
-                ('student_id', '=', result.student_id.id),
-                ('examination_id', '=', result.examination_id.id)
-            ], limit=1)
-
-            if existing:
-                return existing
-
-            # Create new marksheet
-            marksheet = Marksheet.create({
-                'student_id': result.student_id.id,
-                'examination_id': result.examination_id.id,
-                'program_id': result.student_id.program_id.id,
-                'semester': result.semester,
-                'academic_year_id': result.academic_year_id.id,
-                'result_id': result.id,
-                'issue_date': fields.Date.today(),
-                'total_marks': result.total_marks,
-                'obtained_marks': result.obtained_marks,
-                'percentage': result.percentage,
-                'cgpa': result.cgpa,
-                'grade': result.grade,
-                'result': result.result,
-                'state': 'generated'
-            })
-
-            return marksheet
-
-        except Exception as e:
-            _logger.error(f"Marksheet generation error: {str(e)}")
-            return False
-
-    def _send_email_notification(self, result):
-        """Send email notification to student"""
-        try:
-            if not result.student_id.email:
-                return False
-
-            template = self.env.ref('university_management.email_template_result_published',
-                                    raise_if_not_found=False)
-            if template:
-                template.send_mail(result.id, force_send=True)
-                return True
-
-            return False
-
-        except Exception as e:
-            _logger.error(f"Email sending error: {str(e)}")
-            return False
-
-    def _send_sms_notification(self, result):
-        """Send SMS notification to student"""
-        try:
-            if not result.student_id.mobile:
-                return False
-
-            message = _(
-                "Dear %s, Your %s result is published. Result: %s, Percentage: %.2f%%. "
-                "Login to student portal for details."
-            ) % (
-                          result.student_id.name,
-                          result.examination_id.name,
-                          result.result.upper(),
-                          result.percentage
-                      )
-
-            self.env['sms.sms'].create({
-                'number': result.student_id.mobile,
-                'body': message,
-            }).send()
-
-            return True
-
-        except Exception as e:
-            _logger.error(f"SMS sending error: {str(e)}")
-            return False
-
     def action_preview_results(self):
         """Preview results before publishing"""
         results = self.result_ids if self.result_ids else self._get_results()